@@ -4,6 +4,11 @@ First principles derivation of the curvature coefficient c_curv ≈ 0.91
 """
 
 import math
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from numeric_snapshots import record
 
 # Constants
 phi = (1 + math.sqrt(5)) / 2
@@ -254,6 +259,12 @@ print(f"Refined approximation: 1 - 1/φ³ + 0.5/φ⁵ = {final_approx:.8f}")
 print(f"Final error: {abs(exact_c_curv - final_approx):.8f}")
 print()
 
+for name, value in [("r_star", r_star_exact), ("r_geo", r_geo), ("r_eff", r_eff),
+                    ("delta_r", delta_r_needed), ("c_curv", c_curv),
+                    ("c_curv_theoretical", c_curv_theoretical), ("topo_factor", topo_factor),
+                    ("series_approx", series_approx), ("final_approx", final_approx)]:
+    record(name, value)
+
 print("CONCLUSION:")
 print("=" * 60)
 print("The curvature coefficient c_curv = 0.91024761 arises from:")
@@ -7,6 +7,11 @@ Tests first principles derivation of c* = 2
 import numpy as np
 from fractions import Fraction
 import unittest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from fibonacci_engine import fibonacci
 
 class TestSpeedFromBinary(unittest.TestCase):
     """Test that speed c* = 2 emerges from binary structure"""
@@ -67,9 +72,7 @@ class TestSpeedFromBinary(unittest.TestCase):
         """Test channel counting via Fibonacci structure"""
         # Number of n-bit strings with no consecutive 1s
         def fib_count(n):
-            if n == 0: return 1
-            if n == 1: return 2
-            return fib_count(n-1) + fib_count(n-2)
+            return fibonacci(n + 2)
         
         # For large n, growth rate approaches φ^n
         # But transmission rate is limited by 2 channels
@@ -7,6 +7,11 @@
 import numpy as np
 import math
 import unittest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from fibonacci_engine import fibonacci
 
 class TestPlanckFromBinary(unittest.TestCase):
     """测试普朗克常数从二进制结构涌现"""
@@ -24,12 +29,7 @@ class TestPlanckFromBinary(unittest.TestCase):
         """测试Fibonacci态计数产生φ²"""
         # n位二进制串（无连续1）的状态数
         def fib_states(n):
-            if n == 0: return 1
-            if n == 1: return 2
-            a, b = 1, 2
-            for _ in range(2, n+1):
-                a, b = b, a + b
-            return b
+            return fibonacci(n + 2)
         
         # 计算增长率
         n = 10
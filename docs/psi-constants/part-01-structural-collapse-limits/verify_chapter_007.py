@@ -7,6 +7,11 @@ Validates time emergence from binary state transitions
 import math
 import numpy as np
 import unittest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from fibonacci_engine import fibonacci
 
 class TestChapter007BinaryTime(unittest.TestCase):
     """Test suite for Chapter 007: Time from Binary Transitions"""
@@ -241,12 +246,7 @@ class TestChapter007BinaryTime(unittest.TestCase):
     
     def fibonacci(self, n):
         """Compute nth Fibonacci number"""
-        if n <= 1:
-            return n
-        a, b = 0, 1
-        for _ in range(n):
-            a, b = b, a + b
-        return a
+        return fibonacci(n)
     
     def test_binary_clock_mechanism(self):
         """Test how binary transitions create a clock"""
@@ -7,6 +7,11 @@ Validates energy emergence from binary state transition rates
 import math
 import numpy as np
 import unittest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from fibonacci_engine import fibonacci
 
 class TestChapter008BinaryEnergy(unittest.TestCase):
     """Test suite for Chapter 008: Energy from Binary Transitions"""
@@ -69,15 +74,6 @@ class TestChapter008BinaryEnergy(unittest.TestCase):
         """Test Fibonacci quantization of energy levels"""
         print("\n=== Fibonacci Energy Spectrum ===")
         
-        # Generate Fibonacci numbers
-        def fibonacci(n):
-            if n <= 1:
-                return n
-            a, b = 0, 1
-            for _ in range(n):
-                a, b = b, a + b
-            return a
-        
         print("Energy Level | Fibonacci | Flips Required | E/E₀")
         print("-------------|-----------|----------------|------")
         
@@ -232,12 +228,7 @@ class TestChapter008BinaryEnergy(unittest.TestCase):
     
     def fibonacci_n(self, n):
         """Helper to compute nth Fibonacci number"""
-        if n <= 1:
-            return n
-        a, b = 0, 1
-        for _ in range(n):
-            a, b = b, a + b
-        return a
+        return fibonacci(n)
     
     def test_binary_energy_examples(self):
         """Test specific examples of binary energy patterns"""
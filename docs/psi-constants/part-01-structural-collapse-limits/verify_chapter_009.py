@@ -7,6 +7,11 @@ Validates mass emergence from closed binary information loops
 import math
 import numpy as np
 import unittest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from fibonacci_engine import fibonacci
 
 class TestChapter009BinaryMass(unittest.TestCase):
     """Test suite for Chapter 009: Mass from Binary Loops"""
@@ -70,14 +75,6 @@ class TestChapter009BinaryMass(unittest.TestCase):
         """Test Fibonacci quantization of mass levels"""
         print("\n=== Fibonacci Mass Spectrum ===")
         
-        def fibonacci(n):
-            if n <= 1:
-                return n
-            a, b = 0, 1
-            for _ in range(n):
-                a, b = b, a + b
-            return a
-        
         print("Mass Level | Fibonacci | Loop Complexity | m/m_P")
         print("-----------|-----------|-----------------|------")
         
@@ -244,12 +241,7 @@ class TestChapter009BinaryMass(unittest.TestCase):
         
     def fibonacci_n(self, n):
         """Helper to compute nth Fibonacci number"""
-        if n <= 1:
-            return n
-        a, b = 0, 1
-        for _ in range(n):
-            a, b = b, a + b
-        return a
+        return fibonacci(n)
 
 
 if __name__ == "__main__":
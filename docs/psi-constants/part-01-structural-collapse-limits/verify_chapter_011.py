@@ -6,6 +6,11 @@ Tests deterministic emergence of physical constants from counting valid binary s
 
 import math
 import unittest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from fibonacci_engine import fibonacci
 
 class TestChapter011BinaryPathCounting(unittest.TestCase):
     """Test suite for Chapter 011: Constants from Binary Path Counting"""
@@ -26,16 +31,7 @@ class TestChapter011BinaryPathCounting(unittest.TestCase):
         
     def fibonacci(self, n):
         """Calculate nth Fibonacci number (1-indexed)"""
-        if n <= 0:
-            return 0
-        if n == 1:
-            return 1
-        if n == 2:
-            return 1
-        a, b = 1, 1
-        for _ in range(3, n+1):
-            a, b = b, a + b
-        return b
+        return fibonacci(n)
     
     def test_binary_path_counting(self):
         """Test counting valid binary sequences avoiding '11'"""
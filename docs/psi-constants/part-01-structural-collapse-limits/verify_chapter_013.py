@@ -6,6 +6,11 @@ Tests emergence of quantum mechanics from finite binary capacity and constraints
 
 import math
 import unittest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from fibonacci_engine import fibonacci
 # import numpy as np  # Not used
 
 class TestChapter013SpectralBoundedness(unittest.TestCase):
@@ -26,12 +31,7 @@ class TestChapter013SpectralBoundedness(unittest.TestCase):
         
     def fibonacci(self, n):
         """Calculate nth Fibonacci number"""
-        if n <= 1:
-            return n
-        a, b = 0, 1
-        for _ in range(2, n+1):
-            a, b = b, a + b
-        return b
+        return fibonacci(n)
     
     def test_spectral_eigenvalues_from_binary_states(self):
         """Test that eigenvalues emerge from discrete binary configurations"""
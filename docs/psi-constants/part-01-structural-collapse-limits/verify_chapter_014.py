@@ -6,6 +6,11 @@ Tests that c = 2 emerges directly from the cardinality of binary states
 
 import unittest
 import math
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from fibonacci_engine import fibonacci
 
 class TestChapter014SpeedOfLight(unittest.TestCase):
     """Test suite for Chapter 014: c = 2 from Binary Channels"""
@@ -30,12 +35,7 @@ class TestChapter014SpeedOfLight(unittest.TestCase):
     
     def fibonacci(self, n):
         """Calculate nth Fibonacci number"""
-        if n <= 1:
-            return n
-        a, b = 0, 1
-        for _ in range(2, n+1):
-            a, b = b, a + b
-        return b
+        return fibonacci(n)
     
     def test_speed_from_binary_cardinality(self):
         """Test c = 2 from binary state count"""
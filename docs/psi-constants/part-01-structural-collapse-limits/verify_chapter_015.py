@@ -6,6 +6,11 @@ Tests that c, ħ, G form a complete description of binary universe operations
 
 import unittest
 import math
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from fibonacci_engine import fibonacci
 
 class TestChapter015BinaryTrinity(unittest.TestCase):
     """Test suite for Chapter 015: Binary Trinity Completeness"""
@@ -31,12 +36,7 @@ class TestChapter015BinaryTrinity(unittest.TestCase):
     
     def fibonacci(self, n):
         """Calculate nth Fibonacci number"""
-        if n <= 1:
-            return n
-        a, b = 0, 1
-        for _ in range(2, n+1):
-            a, b = b, a + b
-        return b
+        return fibonacci(n)
     
     def test_binary_trinity_completeness(self):
         """Test that exactly three binary operations exist"""
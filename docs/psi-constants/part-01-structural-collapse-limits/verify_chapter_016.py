@@ -6,6 +6,12 @@ Tests that all fundamental constants emerge from binary pattern counting limits
 
 import unittest
 import math
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from fibonacci_engine import fibonacci
+from pattern_counting import PatternAutomaton
 
 class TestChapter016BinaryConstraintLimits(unittest.TestCase):
     """Test suite for Chapter 016: Binary Pattern Counting Limits"""
@@ -31,32 +37,24 @@ class TestChapter016BinaryConstraintLimits(unittest.TestCase):
     
     def fibonacci(self, n):
         """Calculate nth Fibonacci number"""
-        if n <= 1:
-            return n
-        a, b = 0, 1
-        for _ in range(2, n+1):
-            a, b = b, a + b
-        return b
+        return fibonacci(n)
     
     def test_binary_pattern_counting(self):
         """Test Fibonacci counting of valid binary patterns"""
-        # Test small pattern counts
+        automaton = PatternAutomaton(forbidden=('11',))
+        
+        # Small lengths: brute-force filter agrees with the transfer matrix
         for n in range(3, 10):
-            # Generate all n-bit patterns
-            all_patterns = []
-            for i in range(2**n):
-                pattern = format(i, f'0{n}b')
-                all_patterns.append(pattern)
-            
-            # Filter valid patterns (no consecutive 1s)
-            valid_patterns = []
-            for pattern in all_patterns:
-                if '11' not in pattern:
-                    valid_patterns.append(pattern)
-            
-            # Should equal Fibonacci number
-            expected = self.fibonacci(n + 2)
-            self.assertEqual(len(valid_patterns), expected,
+            valid_patterns = [format(i, f'0{n}b') for i in range(2**n)
+                              if '11' not in format(i, f'0{n}b')]
+            self.assertEqual(len(valid_patterns), automaton.count(n),
+                           msg=f"Brute force vs transfer matrix at n={n}")
+        
+        # Should equal Fibonacci number, far beyond brute-force reach
+        counts = automaton.counts(2000)
+        for n in range(3, 2001):
+            expected = fibonacci(n + 2)
+            self.assertEqual(counts[n], expected,
                            msg=f"Valid {n}-bit patterns = F_{n+2}")
     
     def test_speed_from_binary_channels(self):
@@ -4,6 +4,12 @@ Zeckendorf decomposition analysis for c = 299,792,458 m/s
 Finds the exact representation as sum of non-consecutive Fibonacci numbers.
 """
 
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from zeckendorf_codec import zeckendorf_indices, zeckendorf_terms
+
 def fibonacci_sequence(n):
     """Generate first n Fibonacci numbers"""
     if n <= 0:
@@ -18,38 +24,11 @@ def fibonacci_sequence(n):
         fib.append(fib[i-1] + fib[i-2])
     return fib
 
-def find_largest_fib_less_than(target, fib_list):
-    """Find largest Fibonacci number less than or equal to target"""
-    for i in range(len(fib_list) - 1, -1, -1):
-        if fib_list[i] <= target:
-            return i, fib_list[i]
-    return 0, fib_list[0]
-
 def zeckendorf_decomposition(n):
-    """Find Zeckendorf representation of n"""
-    # Generate enough Fibonacci numbers
-    fib = fibonacci_sequence(50)  # Should be enough for our number
-    
-    decomposition = []
-    indices = []
-    remaining = n
-    last_index = len(fib)  # Start from the end
-    
-    while remaining > 0:
-        # Find largest Fibonacci number ≤ remaining that doesn't break non-consecutive rule
-        found = False
-        for i in range(min(last_index - 2, len(fib) - 1), -1, -1):  # Skip consecutive numbers
-            if fib[i] <= remaining:
-                decomposition.append(fib[i])
-                indices.append(i + 1)  # Fibonacci indices typically start from F_1
-                remaining -= fib[i]
-                last_index = i
-                found = True
-                break
-        
-        if not found:
-            break
-    
+    """Find Zeckendorf representation of n (any size, see scripts/zeckendorf_codec.py)"""
+    indices = zeckendorf_indices(n).tolist()
+    decomposition = zeckendorf_terms(n)
+    remaining = n - sum(decomposition)
     return decomposition, indices, remaining
 
 def verify_decomposition(decomposition):
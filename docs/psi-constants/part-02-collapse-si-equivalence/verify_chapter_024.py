@@ -9,6 +9,11 @@ import unittest
 import math
 import numpy as np
 from fractions import Fraction
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from fibonacci_engine import fibonacci_array
 
 class TestChapter024BinaryDimensionHomomorphism(unittest.TestCase):
     
@@ -23,7 +28,7 @@ class TestChapter024BinaryDimensionHomomorphism(unittest.TestCase):
         self.G_star = self.phi_inv**2  # binary information dilution
         
         # Fibonacci numbers for Zeckendorf representation
-        self.fibonacci = [1, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144, 233, 377, 610]
+        self.fibonacci = fibonacci_array(np.arange(1, 16)).tolist()
         
         # Binary dimensional field elements (φ^F_n scaling)
         self.binary_scale_factors = [self.phi**f for f in self.fibonacci[:10]]
@@ -8,6 +8,11 @@ Based on binary universe theory with Fibonacci-indexed scaling.
 import unittest
 import math
 import numpy as np
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from fibonacci_engine import fibonacci_array
 
 class TestChapter025BinaryConformalInvariance(unittest.TestCase):
     
@@ -17,7 +22,7 @@ class TestChapter025BinaryConformalInvariance(unittest.TestCase):
         self.phi_inv = 1 / self.phi
         
         # Fibonacci numbers for "no consecutive 1s" constraint
-        self.fibonacci = [1, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144, 233]
+        self.fibonacci = fibonacci_array(np.arange(1, 14)).tolist()
         
         # Binary conformal weights (Fibonacci-indexed)
         self.F_L = 5   # F_5 for length channel
@@ -10,6 +10,11 @@ import unittest
 import math
 import numpy as np
 from itertools import product
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from fibonacci_engine import fibonacci_array
 
 class TestChapter026BinaryDimensionalBasis(unittest.TestCase):
     
@@ -24,7 +29,7 @@ class TestChapter026BinaryDimensionalBasis(unittest.TestCase):
         self.G_star = self.phi_inv**2  # binary information dilution
         
         # Fibonacci numbers for "no consecutive 1s" constraint
-        self.fibonacci = [1, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144, 233, 377, 610]
+        self.fibonacci = fibonacci_array(np.arange(1, 16)).tolist()
         
         # Binary dimensional channel Fibonacci indices (satisfying "no consecutive 1s")
         self.F_L = 5    # F_5 for length channel (spatial correlations)
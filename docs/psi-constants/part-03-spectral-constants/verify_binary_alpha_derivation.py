@@ -6,6 +6,13 @@ Shows how α emerges from 0s and 1s through minimal constraints
 
 import numpy as np
 import math
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+import fibonacci_engine
+from golden_states import no11_states, states_to_strings
+from numeric_snapshots import record
 
 def count_no_11_strings(n):
     """Count n-bit binary strings with no consecutive 1s"""
@@ -25,27 +32,7 @@ def count_no_11_strings(n):
 
 def generate_no_11_strings(n):
     """Generate all n-bit strings with no consecutive 1s"""
-    if n == 0:
-        return ['']
-    elif n == 1:
-        return ['0', '1']
-    
-    strings = []
-    # Recursively build strings
-    def build(current, remaining):
-        if remaining == 0:
-            strings.append(current)
-            return
-        
-        # Can always add 0
-        build(current + '0', remaining - 1)
-        
-        # Can only add 1 if last bit wasn't 1
-        if not current or current[-1] == '0':
-            build(current + '1', remaining - 1)
-    
-    build('', n)
-    return strings
+    return states_to_strings(no11_states(n), n)
 
 def binary_to_phase(binary_string):
     """Convert binary string to phase angle"""
@@ -142,6 +129,9 @@ def main():
     print(f"Average weight: {avg_weight:.6f}")
     print(f"α = {alpha:.9f}")
     print(f"α^(-1) = {alpha_inv:.6f}")
+    for name, value in [("omega_7", omega_7), ("level1", level1), ("level2", level2),
+                        ("avg_weight", avg_weight), ("alpha", alpha), ("alpha_inv", alpha_inv)]:
+        record(name, value)
     
     print("\n=== Binary Inevitability ===")
     print("Starting from:")
@@ -172,16 +162,10 @@ def main():
     print("="*70)
 
 def fibonacci(n):
-    """Calculate nth Fibonacci number"""
+    """Calculate nth Fibonacci number (0 for n <= 0)"""
     if n <= 0:
         return 0
-    elif n == 1:
-        return 1
-    else:
-        a, b = 0, 1
-        for _ in range(2, n+1):
-            a, b = b, a + b
-        return b
+    return fibonacci_engine.fibonacci(n)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -6,9 +6,16 @@ Shows α is inevitable from bits ∈ {0,1} with "no consecutive 1s" constraint.
 """
 
 import math
+import sys
+from pathlib import Path
 from typing import Dict, List, Tuple
 from decimal import Decimal, getcontext
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+import numpy as np
+
+from golden_states import layer_weighted_mean, no11_states, ones_count_table, states_to_strings
+
 # Set high precision for calculations
 getcontext().prec = 50
 
@@ -106,6 +113,14 @@ def test_collapse_weights(phi):
     assert abs(w7 - expected_w7) < 1e-18
     print("✓ Verified: Weight values match chapter")
     
+    # Per-state average over each layer's ones-count histogram (one dot product per layer)
+    log_table = ones_count_table(7)
+    for n, w in [(6, w6), (7, w7)]:
+        mean = layer_weighted_mean(log_table, n, w)
+        print(f"Layer {n} per-state mean weight = {mean:.20f}")
+        assert abs(mean - w) < 1e-15
+    print("✓ Verified: Every state in a layer carries the layer weight")
+    
     return w6, w7
 
 
@@ -154,27 +169,7 @@ def test_binary_states():
     
     def generate_states(n):
         """Generate all n-bit states with no consecutive 1s"""
-        if n == 0: return ['']
-        if n == 1: return ['0', '1']
-        
-        # Valid n-bit = (valid (n-1)bit + '0') or (valid (n-2)bit + '01')
-        prev1 = generate_states(n-1)
-        prev2 = generate_states(n-2)
-        
-        states = []
-        # Add 0 to all (n-1)-bit valid states
-        for s in prev1:
-            states.append(s + '0')
-        # Add 01 to all (n-2)-bit valid states
-        for s in prev2:
-            states.append(s + '01')
-        # Special case: if (n-1)-bit state ends with 0, can add 1
-        for s in prev1:
-            if not s or s[-1] == '0':
-                states.append(s + '1')
-            
-        # Remove duplicates and sort
-        return sorted(list(set(states)))
+        return states_to_strings(no11_states(n), n)
     
     # Show sample states
     print("\nLayer 6 (21 states) - First 5:")
@@ -194,16 +189,31 @@ def test_binary_states():
         assert '11' not in state
     print("\n✓ Verified: No state contains '11'")
     
+    # Ones-count histogram: C(n-k+1, k) states with exactly k ones
+    table = ones_count_table(7, exact=True, cache=False)
+    for n, layer in [(6, layer6), (7, layer7)]:
+        histogram = [sum(1 for s in layer if s.count('1') == k) for k in range(table.shape[1])]
+        print(f"Layer {n} ones-count histogram: {histogram}")
+        assert histogram == table[n].tolist()
+    print("✓ Verified: Histogram matches C(n-k+1, k)")
+    
     return layer6, layer7
 
 def test_weighted_average(D6, D7, w6, w7, omega_7):
     """Test 6: Verify weighted average calculation"""
     print("\n=== Test 6: Weighted Average <w> ===")
     
-    # Calculate numerator and denominator
+    # Layer sizes from the ones-count table: D_n = Σ_k C(n-k+1, k)
+    log_table = ones_count_table(7)
+    sizes = {n: float(np.exp(np.logaddexp.reduce(log_table[n]))) for n in (6, 7)}
+    assert abs(sizes[6] - D6) < 1e-9 and abs(sizes[7] - D7) < 1e-9
+    
+    # <w> mixes the two layer means with shares D6 : D7·ω_7
     numerator = D6 * w6 + D7 * omega_7 * w7
     denominator = D6 + D7 * omega_7
-    w_avg = numerator / denominator
+    share6 = D6 / denominator
+    w_avg = (share6 * layer_weighted_mean(log_table, 6, w6)
+             + (1 - share6) * layer_weighted_mean(log_table, 7, w7))
     
     print(f"Numerator = {D6} * {w6:.6f} + {D7} * {omega_7:.6f} * {w7:.6f}")
     print(f"         = {numerator:.20f}")
@@ -7,6 +7,11 @@ Tests how binary constraints create filters that select observable fine structur
 import unittest
 import math
 import numpy as np
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from fibonacci_engine import fibonacci_array
 
 class TestChapter035BinaryFilters(unittest.TestCase):
     
@@ -28,7 +33,7 @@ class TestChapter035BinaryFilters(unittest.TestCase):
         self.omega_0 = 2 * math.pi / self.phi
         
         # Fibonacci numbers for EM bundle
-        self.fibonacci = [1, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144, 233]
+        self.fibonacci = fibonacci_array(np.arange(1, 14)).tolist()
         
         # Tolerance
         self.tol = 1e-10
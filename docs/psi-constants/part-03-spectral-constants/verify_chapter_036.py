@@ -6,8 +6,15 @@ Tests how binary resolution limits determine which constants observers see at di
 
 import unittest
 import math
+import sys
+from pathlib import Path
+
 import numpy as np
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from golden_states import no11_states
+from hamming_visibility import hamming_distances, hamming_matrix, pack_bits, visibility
+
 class TestChapter036BinaryVisibility(unittest.TestCase):
     
     def setUp(self):
@@ -29,21 +36,14 @@ class TestChapter036BinaryVisibility(unittest.TestCase):
     def test_binary_trace_visibility(self):
         """Test binary trace visibility function"""
         # Binary trace as Hamming distance
-        def hamming_distance(s1, s2):
-            return sum(b1 != b2 for b1, b2 in zip(s1, s2))
-        
-        # Test binary sequences
-        s_initial = [1, 0, 1, 0, 1, 0]
-        s_final = [0, 1, 0, 1, 0, 1]
+        # Test binary sequences, packed as bit words (XOR + popcount)
+        s_initial = pack_bits([1, 0, 1, 0, 1, 0])
+        s_final = pack_bits([0, 1, 0, 1, 0, 1])
         
-        gamma = hamming_distance(s_initial, s_final)
+        gamma = int(hamming_distances(s_initial, s_final))
         mu = 2**3  # 3-bit resolution
         
-        # Binary visibility function
-        def visibility(gamma, mu):
-            mu_min = 1  # Single bit minimum
-            return np.exp(-(gamma**2)/(mu**2)) * (1 if gamma >= mu_min else 0)
-        
+        # Binary visibility function, mu_min = 1 (single bit minimum)
         v = visibility(gamma, mu)
         
         # Should be positive for valid trace
@@ -54,6 +54,12 @@ class TestChapter036BinaryVisibility(unittest.TestCase):
         v_large = visibility(6, mu)
         self.assertGreater(v_small, v_large)
         
+        # Whole layer at once: pairwise visibility of all 7-bit no-11 states
+        layer7 = no11_states(7)
+        v_matrix = visibility(hamming_matrix(layer7), mu)
+        self.assertTrue(np.allclose(v_matrix, v_matrix.T))
+        self.assertTrue(np.all(np.diag(v_matrix) == 0))
+        
     def test_binary_resolution_hierarchy(self):
         """Test binary scale hierarchy mu = 2^n"""
         # Binary scales
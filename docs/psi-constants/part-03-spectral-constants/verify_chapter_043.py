@@ -9,6 +9,11 @@ import unittest
 import math
 import numpy as np
 from typing import Dict, List, Tuple
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from fibonacci_engine import fibonacci
 
 class TestBinaryConstants(unittest.TestCase):
     """Test suite for Chapter 043 binary constant derivations"""
@@ -357,12 +362,7 @@ class TestBinaryConstants(unittest.TestCase):
     # Helper methods
     def _fibonacci(self, n):
         """Calculate nth Fibonacci number"""
-        if n <= 1:
-            return n
-        a, b = 0, 1
-        for _ in range(2, n + 1):
-            a, b = b, a + b
-        return b
+        return fibonacci(n)
     
     def test_11_master_binary_theorem(self):
         """Test 11: Verify master binary constant theorem"""
@@ -4,6 +4,12 @@ Core verification for Chapter 043: Focus on key bandwidth relationships
 """
 
 import math
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from fibonacci_engine import fibonacci
+from numeric_snapshots import record
 
 def verify_core_results():
     """Verify the core bandwidth-constant relationships"""
@@ -18,6 +24,7 @@ def verify_core_results():
         fib = fibonacci(r + 2)
         capacity = math.log(fib) / math.log(phi)
         print(f"   Rank {r}: Capacity = {capacity:.4f} golden bits")
+        record(f"capacity_rank_{r}", capacity)
     
     # 2. Speed of light factor
     print("\n2. Speed of Light from Bandwidth:")
@@ -49,6 +56,9 @@ def verify_core_results():
     
     print(f"   Using direct formula:")
     print(f"   α⁻¹ = {alpha_inv:.1f}")
+    for name, value in [("c_factor", c_factor), ("h_factor", h_factor), ("g_factor", g_factor),
+                        ("omega_7", omega_7), ("alpha_inv", alpha_inv)]:
+        record(name, value)
     
     # 6. Information theoretic unification
     print("\n6. Information Content Hierarchy:")
@@ -74,14 +84,5 @@ def verify_core_results():
     
     return True
 
-def fibonacci(n):
-    """Calculate nth Fibonacci number"""
-    if n <= 1:
-        return n
-    a, b = 0, 1
-    for _ in range(2, n + 1):
-        a, b = b, a + b
-    return b
-
 if __name__ == "__main__":
     verify_core_results()
\ No newline at end of file
@@ -9,6 +9,11 @@ import unittest
 import math
 import numpy as np
 from typing import List, Set, Tuple, Dict
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from fibonacci_engine import fibonacci
 
 class TestBinaryAtomicConstants(unittest.TestCase):
     """Test suite for Chapter 046 binary atomic constants derivation"""
@@ -359,12 +364,7 @@ class TestBinaryAtomicConstants(unittest.TestCase):
     # Helper methods
     def _fibonacci(self, n):
         """Calculate nth Fibonacci number"""
-        if n <= 1:
-            return n
-        a, b = 0, 1
-        for _ in range(2, n + 1):
-            a, b = b, a + b
-        return b
+        return fibonacci(n)
     
     def _zeckendorf_decomposition(self, n):
         """Get Zeckendorf representation as list of indices"""
@@ -11,6 +11,11 @@ All derivations must follow strictly from ψ = ψ(ψ) first principles.
 import unittest
 import math
 import cmath
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from fibonacci_engine import fibonacci
 
 class TestBinaryElectromagneticConstants(unittest.TestCase):
     """Test electromagnetic constants emergence from binary universe theory"""
@@ -379,12 +384,7 @@ class TestBinaryElectromagneticConstants(unittest.TestCase):
     # Helper method
     def _fibonacci(self, n):
         """Calculate nth Fibonacci number"""
-        if n <= 1:
-            return n
-        a, b = 0, 1
-        for _ in range(2, n + 1):
-            a, b = b, a + b
-        return b
+        return fibonacci(n)
 
 
 class TestBinarySummary(unittest.TestCase):
@@ -6,25 +6,17 @@ Shows how the no-11 constraint creates the Fibonacci structure
 
 import numpy as np
 import matplotlib.pyplot as plt
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from golden_states import no11_states, states_to_strings
+from phase_resonance import resonance_fraction
 
 def generate_no_11_strings(n):
     """Generate all n-bit strings with no consecutive 1s"""
-    strings = []
-    
-    def build(current, remaining):
-        if remaining == 0:
-            strings.append(current)
-            return
-        
-        # Can always add 0
-        build(current + '0', remaining - 1)
-        
-        # Can only add 1 if last bit wasn't 1
-        if not current or current[-1] == '0':
-            build(current + '1', remaining - 1)
-    
-    build('', n)
-    return sorted(strings)  # Sort for consistent ordering
+    # Packed states are already in ascending (lexicographic) order
+    return states_to_strings(no11_states(n), n)
 
 def binary_to_phase(binary_string):
     """Convert binary string to phase angle"""
@@ -97,16 +89,10 @@ def main():
     
     # Count phase differences near golden angle
     tolerance = 0.1  # radians
-    golden_resonances = 0
-    
-    for i in range(len(phases)):
-        for j in range(i+1, len(phases)):
-            diff = abs(phases[j] - phases[i])
-            # Check both difference and 2π - difference
-            if abs(diff - golden_angle) < tolerance or abs(2*np.pi - diff - golden_angle) < tolerance:
-                golden_resonances += 1
+    # Sorted-window count of pairs with |Δθ - π/φ| or |2π - Δθ - π/φ| < tolerance
+    golden_resonances, total_pairs, _ = resonance_fraction(
+        phases, golden_angle, tolerance, assume_sorted=True)
     
-    total_pairs = len(phases) * (len(phases) - 1) // 2
     print(f"Total phase pairs: {total_pairs}")
     print(f"Pairs near golden angle (±{tolerance} rad): {golden_resonances}")
     print(f"Fraction: {golden_resonances/total_pairs:.3f}")
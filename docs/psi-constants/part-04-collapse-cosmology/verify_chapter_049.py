@@ -11,6 +11,11 @@ All derivations must follow strictly from ψ = ψ(ψ) first principles.
 
 import unittest
 import math
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from fibonacci_engine import fibonacci
 
 class TestBinaryVacuumEnergy(unittest.TestCase):
     """Test vacuum energy density from binary universe theory"""
@@ -83,14 +88,6 @@ class TestBinaryVacuumEnergy(unittest.TestCase):
         series_terms = []
         partial_sums = []
         
-        def fibonacci(n):
-            if n <= 1:
-                return n
-            a, b = 0, 1
-            for _ in range(2, n + 1):
-                a, b = b, a + b
-            return b
-        
         for n in range(1, 21):  # Start from n=1
             F_n = fibonacci(n)
             term = F_n / (self.phi ** (4 * n))
@@ -170,14 +167,6 @@ class TestBinaryVacuumEnergy(unittest.TestCase):
         # Calculate total vacuum energy from binary series
         # ρ_vac = ρ_Planck × Σ(F_n/φ^(4n))
         
-        def fibonacci(n):
-            if n <= 1:
-                return n
-            a, b = 0, 1
-            for _ in range(2, n + 1):
-                a, b = b, a + b
-            return b
-        
         # Calculate series sum
         total_sum = 0
         print("\nContributions by bit depth:")
@@ -266,14 +255,6 @@ class TestBinaryVacuumEnergy(unittest.TestCase):
         # Binary vacuum information density
         # Each n-bit mode stores log₂(F_{n+2}) bits of information
         
-        def fibonacci(n):
-            if n <= 1:
-                return n
-            a, b = 0, 1
-            for _ in range(2, n + 1):
-                a, b = b, a + b
-            return b
-        
         # Calculate information content
         total_info = 0
         for n in range(1, 50):  # First 50 modes
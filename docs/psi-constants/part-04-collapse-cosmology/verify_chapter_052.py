@@ -11,6 +11,11 @@ All derivations must follow strictly from ψ = ψ(ψ) first principles.
 import unittest
 import math
 import cmath
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from fibonacci_engine import fibonacci
 
 class TestBinaryObserverHorizon(unittest.TestCase):
     """Test binary observer horizon and rank cutoff theory"""
@@ -48,19 +53,6 @@ class TestBinaryObserverHorizon(unittest.TestCase):
         """Test 1: Verify binary Fibonacci path enumeration"""
         print("\n=== Test 1: Binary Fibonacci Path Enumeration ===")
         
-        # Generate Fibonacci sequence
-        def fibonacci(n):
-            """Calculate n-th Fibonacci number"""
-            if n <= 0:
-                return 0
-            elif n == 1:
-                return 1
-            else:
-                a, b = 0, 1
-                for _ in range(2, n + 1):
-                    a, b = b, a + b
-                return b
-        
         # Test first several Fibonacci numbers
         fib_sequence = [fibonacci(r) for r in range(15)]
         print("Binary Fibonacci sequence F_r (no consecutive 1s):")
@@ -191,15 +183,7 @@ class TestBinaryObserverHorizon(unittest.TestCase):
 
     def _fibonacci_exact(self, n):
         """Calculate exact Fibonacci number for verification"""
-        if n <= 0:
-            return 0
-        elif n == 1:
-            return 1
-        else:
-            a, b = 0, 1
-            for _ in range(2, n + 1):
-                a, b = b, a + b
-            return b
+        return fibonacci(n)
 
     def test_04_binary_critical_rank(self):
         """Test 4: Calculate binary critical rank from information bounds"""
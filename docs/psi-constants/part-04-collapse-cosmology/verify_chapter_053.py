@@ -11,6 +11,11 @@ All derivations must follow strictly from ψ = ψ(ψ) first principles.
 
 import unittest
 import math
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from fibonacci_engine import fibonacci
 
 class TestBinaryCriticalDensity(unittest.TestCase):
     """Test binary critical density limit construction theory"""
@@ -119,19 +124,6 @@ class TestBinaryCriticalDensity(unittest.TestCase):
         """Test 3: Verify binary Zeckendorf representation of critical density"""
         print("\n=== Test 3: Binary Zeckendorf Representation ===")
         
-        # Fibonacci sequence for Zeckendorf representation
-        def fibonacci(n):
-            """Calculate n-th Fibonacci number"""
-            if n <= 0:
-                return 0
-            elif n == 1:
-                return 1
-            else:
-                a, b = 0, 1
-                for _ in range(2, n + 1):
-                    a, b = b, a + b
-                return b
-        
         # Binary pattern analysis shows effective scale emerges naturally
         # Not from arbitrary Fibonacci selection but from coherence analysis
         print("Binary coherence scale analysis:")
@@ -11,6 +11,11 @@ All derivations must follow strictly from ψ = ψ(ψ) first principles.
 
 import unittest
 import math
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from fibonacci_engine import fibonacci
 
 class TestBinaryPlanckDensity(unittest.TestCase):
     """Test binary Planck density as spectral maximum theory"""
@@ -260,19 +265,6 @@ class TestBinaryPlanckDensity(unittest.TestCase):
         """Test 5: Verify binary representation of Planck baseline"""
         print("\n=== Test 5: Binary Planck Representation ===")
         
-        # Fibonacci sequence
-        def fibonacci(n):
-            """Calculate n-th Fibonacci number"""
-            if n <= 0:
-                return 0
-            elif n == 1:
-                return 1
-            else:
-                a, b = 0, 1
-                for _ in range(2, n + 1):
-                    a, b = b, a + b
-                return b
-        
         # Binary Fibonacci normalization in Planck context
         print("Binary Fibonacci normalization test:")
         for n in [10, 15, 20, 25]:
@@ -597,15 +589,7 @@ class TestBinaryPlanckDensity(unittest.TestCase):
     
     def _fibonacci(self, n):
         """Helper: Calculate n-th Fibonacci number"""
-        if n <= 0:
-            return 0
-        elif n == 1:
-            return 1
-        else:
-            a, b = 0, 1
-            for _ in range(2, n + 1):
-                a, b = b, a + b
-            return b
+        return fibonacci(n)
 
 
 class TestBinarySummary(unittest.TestCase):
@@ -13,6 +13,11 @@ import unittest
 import math
 import numpy as np
 from scipy import integrate
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from fibonacci_engine import fibonacci
 
 class TestBinaryRankSpectrumOmega(unittest.TestCase):
     """Test binary rank spectrum integral theory for Ω parameters"""
@@ -307,18 +312,6 @@ class TestBinaryRankSpectrumOmega(unittest.TestCase):
         """Test 6: Verify evaluation via binary Zeckendorf decomposition"""
         print("\n=== Test 6: Binary Zeckendorf Decomposition of Integrals ===")
         
-        def fibonacci(n):
-            """Calculate n-th Fibonacci number"""
-            if n <= 0:
-                return 0
-            elif n == 1:
-                return 1
-            else:
-                a, b = 0, 1
-                for _ in range(2, n + 1):
-                    a, b = b, a + b
-                return b
-        
         # Test integral of simple function
         def test_function(r):
             """Simple test function for integration"""
@@ -526,15 +519,7 @@ class TestBinaryRankSpectrumOmega(unittest.TestCase):
     
     def _fibonacci(self, n):
         """Helper: Calculate n-th Fibonacci number"""
-        if n <= 0:
-            return 0
-        elif n == 1:
-            return 1
-        else:
-            a, b = 0, 1
-            for _ in range(2, n + 1):
-                a, b = b, a + b
-            return b
+        return fibonacci(n)
 
 
 class TestBinarySummary(unittest.TestCase):
@@ -11,6 +11,11 @@ All derivations must follow strictly from binary universe first principles.
 
 import unittest
 import math
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from fibonacci_engine import fibonacci
 
 class TestBinaryHubbleConstantDerivation(unittest.TestCase):
     """Test Hubble constant from binary pattern evolution theory"""
@@ -408,18 +413,6 @@ class TestBinaryHubbleConstantDerivation(unittest.TestCase):
         # Discrete binary H₀ spectrum prediction
         print("Discrete binary H₀ spectrum (local variations):")
         
-        def fibonacci(n):
-            """n-th Fibonacci number"""
-            if n <= 0:
-                return 0
-            elif n == 1:
-                return 1
-            else:
-                a, b = 0, 1
-                for _ in range(2, n + 1):
-                    a, b = b, a + b
-                return b
-        
         # Calculate discrete binary values
         # Use approximation for large Fibonacci numbers
         F_147 = self.phi**147 / math.sqrt(5)  # Binet's formula approximation
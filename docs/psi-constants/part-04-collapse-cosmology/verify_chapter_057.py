@@ -12,6 +12,11 @@ import unittest
 import math
 import numpy as np
 from scipy import integrate
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from fibonacci_engine import fibonacci
 
 class TestBinaryCollapsePathDynamics(unittest.TestCase):
     """Test binary collapse path dynamics and cosmic expansion"""
@@ -406,18 +411,6 @@ class TestBinaryCollapsePathDynamics(unittest.TestCase):
         """Test 8: Verify discrete redshift predictions"""
         print("\n=== Test 8: Discrete Redshift Spectrum ===")
         
-        def fibonacci(n):
-            """Calculate n-th Fibonacci number"""
-            if n <= 0:
-                return 0
-            elif n == 1:
-                return 1
-            else:
-                a, b = 0, 1
-                for _ in range(2, n + 1):
-                    a, b = b, a + b
-                return b
-        
         # Calculate discrete redshifts
         F_147 = fibonacci(40) * self.phi**(147-40) / math.sqrt(5)  # Approximate
         
@@ -12,6 +12,11 @@ import unittest
 import math
 import numpy as np
 from scipy import integrate
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from fibonacci_engine import fibonacci
 
 class TestBinaryTraceFriedmann(unittest.TestCase):
     """Test binary trace-based derivation of Friedmann equation"""
@@ -553,15 +558,7 @@ class TestBinaryTraceFriedmann(unittest.TestCase):
 
     def _fibonacci(self, n):
         """Helper: Calculate n-th Fibonacci number"""
-        if n <= 0:
-            return 0
-        elif n == 1:
-            return 1
-        else:
-            a, b = 0, 1
-            for _ in range(2, n + 1):
-                a, b = b, a + b
-            return b
+        return fibonacci(n)
 
 
 class TestBinarySummary(unittest.TestCase):
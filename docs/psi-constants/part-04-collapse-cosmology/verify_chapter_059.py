@@ -12,6 +12,11 @@ import unittest
 import math
 import numpy as np
 from scipy import integrate
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from fibonacci_engine import fibonacci
 
 class TestBinaryCollapseEquationOfState(unittest.TestCase):
     """Test binary equation of state from rank transitions"""
@@ -446,16 +451,6 @@ class TestBinaryCollapseEquationOfState(unittest.TestCase):
         # Discrete binary pressure levels
         def binary_pressure_quantized(n, r_0=10):
             """p_n^binary = p_0(1 + F_n/F_r0 × φ^(-n))"""
-            def fibonacci(k):
-                if k <= 0:
-                    return 0
-                elif k == 1:
-                    return 1
-                else:
-                    a, b = 0, 1
-                    for _ in range(2, k + 1):
-                        a, b = b, a + b
-                    return b
             
             F_n = fibonacci(n)  # Counts valid binary patterns
             F_r0 = fibonacci(r_0)
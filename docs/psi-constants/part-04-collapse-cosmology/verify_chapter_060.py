@@ -12,6 +12,11 @@ import unittest
 import math
 import numpy as np
 from scipy import integrate, special
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from fibonacci_engine import fibonacci
 
 class TestBinaryTraceDegeneracy(unittest.TestCase):
     """Test binary trace degeneracy and cosmic scale ratios"""
@@ -44,15 +49,7 @@ class TestBinaryTraceDegeneracy(unittest.TestCase):
 
     def _fibonacci(self, n):
         """Calculate n-th Fibonacci number"""
-        if n <= 0:
-            return 0
-        elif n == 1:
-            return 1
-        else:
-            a, b = 0, 1
-            for _ in range(2, n + 1):
-                a, b = b, a + b
-            return b
+        return fibonacci(n)
 
     def test_01_binary_degeneracy_function(self):
         """Test 1: Verify binary path degeneracy function"""
@@ -12,6 +12,11 @@ import unittest
 import math
 import numpy as np
 from scipy import integrate, special
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from fibonacci_engine import fibonacci_array
 
 class TestBinaryStructureFormation(unittest.TestCase):
     """Test binary structure formation from multiscale collapse"""
@@ -148,7 +153,7 @@ class TestBinaryStructureFormation(unittest.TestCase):
         r_8_binary = 13  # This is what we actually measure/use
         
         # Fibonacci numbers
-        fibonacci = [1, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89]
+        fibonacci = fibonacci_array(np.arange(1, 12)).tolist()
         F_7 = 13
         
         print(f"Binary 8 Mpc scale analysis:")
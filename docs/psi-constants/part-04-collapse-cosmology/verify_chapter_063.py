@@ -11,6 +11,11 @@ All derivations must follow strictly from ψ = ψ(ψ) first principles.
 import unittest
 import math
 import numpy as np
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from fibonacci_engine import fibonacci_array
 
 class TestBinaryObserverPopulations(unittest.TestCase):
     """Test binary observer population statistics and parameter distributions"""
@@ -43,9 +48,7 @@ class TestBinaryObserverPopulations(unittest.TestCase):
         print("\n=== Test 1: Binary Observer Population Distribution ===")
         
         # Fibonacci numbers up to rank 50
-        fibonacci = [1, 1]
-        for i in range(2, 51):
-            fibonacci.append(fibonacci[i-1] + fibonacci[i-2])
+        fibonacci = fibonacci_array(np.arange(1, 52)).tolist()
         
         def binary_observer_population(r):
             """N^binary(r) = N_0^binary * F_{r+2}/√5 * exp(-(r-r_opt)²/2σ_r²)"""
@@ -177,7 +180,7 @@ class TestBinaryObserverPopulations(unittest.TestCase):
         r_8_full = math.log(L_8_mpc / L_planck) / math.log(self.phi)
         
         # Fibonacci numbers
-        fibonacci = [1, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144]
+        fibonacci = fibonacci_array(np.arange(1, 13)).tolist()
         F_7 = 13
         
         # Modular reduction
@@ -12,6 +12,11 @@ All derivations must follow strictly from ψ = ψ(ψ) first principles.
 import unittest
 import math
 import numpy as np
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from fibonacci_engine import fibonacci_array
 
 class TestBinaryConstantGeneration(unittest.TestCase):
     """Test binary geometric generation of physical constants"""
@@ -36,9 +41,7 @@ class TestBinaryConstantGeneration(unittest.TestCase):
         self.E_P = self.M_P * self.c**2  # Planck energy
         
         # Fibonacci sequence
-        self.fibonacci = [1, 1]
-        for i in range(2, 150):  # Extended for phi^148 scale
-            self.fibonacci.append(self.fibonacci[i-1] + self.fibonacci[i-2])
+        self.fibonacci = fibonacci_array(np.arange(1, 151), exact=True).tolist()  # Extended for phi^148 scale
         
         # Binary channel capacity
         self.binary_capacity = math.log2(self.phi)  # ≈ 0.694 bits per bit
@@ -1,4 +1,9 @@
 import numpy as np
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from fibonacci_engine import fibonacci
 
 print("=== 观察者内部观测理论框架：精细结构常数的本质 ===\n")
 
@@ -15,15 +20,6 @@ print("4. 精确计算可能是 NP-complete 问题")
 print(f"\n📊 我们理论的数学预测:")
 print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
 
-def fibonacci(n):
-    if n <= 0: return 0
-    elif n == 1: return 1
-    else:
-        a, b = 0, 1
-        for _ in range(2, n + 1):
-            a, b = b, a + b
-        return b
-
 # 我们理论纯数学地产生的常数
 math_constants = [
     ("1/φ", 1/phi, "基本黄金逆比"),
@@ -1,4 +1,9 @@
 import numpy as np
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[4] / "scripts"))
+from fibonacci_engine import fibonacci
 
 print("=== Chapter 003: Existence as Spectrum Support - Verification ===\n")
 
@@ -6,18 +11,6 @@ print("=== Chapter 003: Existence as Spectrum Support - Verification ===\n")
 phi = (1 + np.sqrt(5)) / 2
 print(f"Golden ratio φ = {phi:.10f}")
 
-# 斐波那契函数
-def fibonacci(n):
-    if n <= 0:
-        return 0
-    elif n == 1:
-        return 1
-    else:
-        a, b = 0, 1
-        for _ in range(2, n + 1):
-            a, b = b, a + b
-        return b
-
 # 3.1 验证特征值结构
 print("\n3.1 Eigenvalue Structure λ_n = φ^(-F_n):")
 for n in range(1, 8):
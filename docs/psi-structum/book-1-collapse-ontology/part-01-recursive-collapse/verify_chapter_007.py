@@ -1,4 +1,9 @@
 import numpy as np
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[4] / "scripts"))
+from fibonacci_engine import fibonacci
 
 print("=== Chapter 007: Collapse Trace φ-Structure - Verification ===\n")
 
@@ -12,18 +17,6 @@ print(f"φ² = {phi**2:.10f}")
 print(f"φ + 1 = {phi + 1:.10f}")
 print(f"Equal: {np.isclose(phi**2, phi + 1)}")
 
-# 斐波那契函数
-def fibonacci(n):
-    if n <= 0:
-        return 0
-    elif n == 1:
-        return 1
-    else:
-        a, b = 0, 1
-        for _ in range(2, n + 1):
-            a, b = b, a + b
-        return b
-
 # 7.1 验证迹递归关系
 print("\n7.1 Trace Recursion ||s_{n+2}|| = ||s_{n+1}|| + ||s_n||:")
 # 模拟迹步长
@@ -1,5 +1,12 @@
 import numpy as np
 from scipy.special import zeta
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[4] / "scripts"))
+from fibonacci_engine import fibonacci
+from operator_zeta import operator_zeta
+from zeta_dynamics import zeta_fixed_points
 
 print("=== Chapter 011: Self-Collapse Equation ψ = ζ(ψ) - Verification ===\n")
 
@@ -16,24 +23,6 @@ except Exception as e:
     print(f"ERROR in basic constants: {e}")
     raise
 
-# 斐波那契函数
-def fibonacci(n):
-    try:
-        if not isinstance(n, int) or n < 0:
-            raise ValueError(f"Fibonacci index must be non-negative integer, got {n}")
-        if n <= 0:
-            return 0
-        elif n == 1:
-            return 1
-        else:
-            a, b = 0, 1
-            for _ in range(2, n + 1):
-                a, b = b, a + b
-            return b
-    except Exception as e:
-        print(f"ERROR in fibonacci({n}): {e}")
-        raise
-
 # 11.2 验证操作符zeta函数
 print("\n11.2 Operator Zeta Function:")
 print("ζ(Ô) = Σ n^(-Ô) = Σ exp(-Ô log n)")
@@ -49,6 +38,18 @@ if abs(zeta_2 - expected_zeta_2) > 1e-10:
     raise AssertionError("Zeta(2) verification failed")
 print("✓ ζ(2) = π²/6 verified")
 
+# 算子形式：对角化后逐个特征值求 ζ，ζ(2·I) = ζ(2)·I
+rng = np.random.default_rng(11)
+q, _ = np.linalg.qr(rng.standard_normal((3, 3)))
+operator = q @ np.diag([2.0, 3.0, 4.0]) @ q.T
+zeta_op = operator_zeta(operator)
+print(f"ζ(Ô) for Ô with spectrum (2, 3, 4): Tr = {np.trace(zeta_op):.6f}")
+if not np.allclose(zeta_op, q @ np.diag(zeta([2.0, 3.0, 4.0])) @ q.T, atol=1e-12):
+    raise AssertionError("Operator zeta does not match the spectral decomposition")
+if not np.allclose(operator_zeta(2 * np.eye(3)), zeta_2 * np.eye(3), atol=1e-12):
+    raise AssertionError("ζ(2·I) ≠ ζ(2)·I")
+print("✓ ζ(Ô) = V diag(ζ(λ)) V⁻¹ verified")
+
 # 11.4 验证张量固定点维数
 print("\n11.4 Tensor Fixed Point Manifold:")
 manifold_dim = fibonacci(7)
@@ -130,28 +131,13 @@ print("For demonstration, consider scalar approximation:")
 
 # 寻找接近1的解（如果存在的话）
 def find_zeta_fixed_point():
-    """尝试找到ζ(ψ) = ψ的解"""
-    from scipy.optimize import fsolve
-    
-    def equation(s):
-        if s <= 1:
-            return 1e10  # 惩罚项
-        return s - zeta(s)
-    
+    """尝试找到ζ(ψ) = ψ的解（Re(s) > 1 的实解）"""
     try:
-        # 从几个不同起点尝试
-        start_points = [1.5, 2.0, 2.5]
-        solutions = []
-        
-        for start in start_points:
-            try:
-                sol = fsolve(equation, start)[0]
-                if sol > 1 and abs(equation(sol)) < 1e-6:
-                    solutions.append(sol)
-            except:
-                continue
-        
-        return solutions
+        # 复网格上批量牛顿迭代 + 除法收缩，代替逐个起点的 fsolve
+        result = zeta_fixed_points(re_range=(1.1, 3.0), im_range=(-0.5, 0.5),
+                                   resolution=(16, 64), workers=1)
+        return [r.real for r in result.roots
+                if r.real > 1 and abs(r.imag) < 1e-9 and abs(r.real - zeta(r.real)) < 1e-6]
     except Exception as e:
         print(f"Numerical solving failed: {e}")
         return []
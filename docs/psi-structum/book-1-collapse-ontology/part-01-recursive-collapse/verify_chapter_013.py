@@ -1,4 +1,9 @@
 import numpy as np
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[4] / "scripts"))
+from fibonacci_engine import fibonacci
 
 print("=== Chapter 013: Entropy as Trace Complexity - Verification ===\n")
 
@@ -15,24 +20,6 @@ except Exception as e:
     print(f"ERROR in basic constants: {e}")
     raise
 
-# 斐波那契函数（带异常处理）
-def fibonacci(n):
-    try:
-        if not isinstance(n, int) or n < 0:
-            raise ValueError(f"Fibonacci index must be non-negative integer, got {n}")
-        if n <= 0:
-            return 0
-        elif n == 1:
-            return 1
-        else:
-            a, b = 0, 1
-            for _ in range(2, n + 1):
-                a, b = b, a + b
-            return b
-    except Exception as e:
-        print(f"ERROR in fibonacci({n}): {e}")
-        raise
-
 # 13.1 验证迹复杂度定义
 print("\n13.1 Trace Complexity Definition:")
 print("C[T] = Σ_{k: t_k=1} k × F_k")
@@ -1,4 +1,9 @@
 import numpy as np
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[4] / "scripts"))
+from fibonacci_engine import fibonacci
 
 print("=== 基础常数问题的深层分析 ===\n")
 
@@ -10,15 +15,6 @@ print(f"精细结构常数 α = {alpha_em:.6f}")
 phi = (1 + np.sqrt(5)) / 2
 print(f"黄金比例 φ = {phi:.6f}")
 
-def fibonacci(n):
-    if n <= 0: return 0
-    elif n == 1: return 1
-    else:
-        a, b = 0, 1
-        for _ in range(2, n + 1):
-            a, b = b, a + b
-        return b
-
 print("\n=== 理论声称与现实的对比 ===")
 
 attempts = [
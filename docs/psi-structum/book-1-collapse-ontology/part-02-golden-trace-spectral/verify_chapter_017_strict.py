@@ -1,4 +1,9 @@
 import numpy as np
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[4] / "scripts"))
+from fibonacci_engine import fibonacci
 
 print("=== Chapter 017: Golden Trace Algebra - CRITICAL ANALYSIS OF 137 PROBLEM ===\n")
 
@@ -15,19 +20,6 @@ except Exception as e:
     print(f"ERROR in basic constants: {e}")
     raise
 
-def fibonacci(n):
-    if not isinstance(n, int) or n < 0:
-        raise ValueError(f"Fibonacci index must be non-negative integer, got {n}")
-    if n <= 0:
-        return 0
-    elif n == 1:
-        return 1
-    else:
-        a, b = 0, 1
-        for _ in range(2, n + 1):
-            a, b = b, a + b
-        return b
-
 print("\n=== CRITICAL ANALYSIS: THE 137 PROBLEM ===")
 
 # 用户指出的核心问题
@@ -1,18 +1,14 @@
 import numpy as np
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[4] / "scripts"))
+from fibonacci_engine import fibonacci
 
 print("=== Chapter 018: Spectral Decomposition - Final Observer Framework Verification ===\n")
 
 phi = (1 + np.sqrt(5)) / 2
 
-def fibonacci(n):
-    if n <= 0: return 0
-    elif n == 1: return 1
-    else:
-        a, b = 0, 1
-        for _ in range(2, n + 1):
-            a, b = b, a + b
-        return b
-
 print("🎯 修正后的章节合规性检查:")
 print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
 
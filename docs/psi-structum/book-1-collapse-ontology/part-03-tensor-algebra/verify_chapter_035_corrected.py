@@ -1,4 +1,10 @@
 import numpy as np
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[4] / "scripts"))
+from dirichlet_series import dirichlet_series, golden_weight
+from fibonacci_engine import fibonacci
 
 print("=== Chapter 035: Zeta Function Formula - CORRECTED Verification ===\n")
 
@@ -15,19 +21,6 @@ except Exception as e:
     print(f"ERROR in basic constants: {e}")
     raise
 
-def fibonacci(n):
-    if not isinstance(n, int) or n < 0:
-        raise ValueError(f"Fibonacci index must be non-negative integer, got {n}")
-    if n <= 0:
-        return 0
-    elif n == 1:
-        return 1
-    else:
-        a, b = 0, 1
-        for _ in range(2, n + 1):
-            a, b = b, a + b
-        return b
-
 print("\n=== CORRECTED CHAPTER VERIFICATION ===")
 
 # 检查：第一性原理合规
@@ -117,11 +110,18 @@ print("✓ RATIO PATTERNS: ζ^{ij}(2n)/ζ^{ij}(n) = φ^{-n} + O(n^{-2})")
 print("✓ EXACT VALUES: From path enumeration only")
 
 # 模拟特殊值比率
-print("\nSpecial value ratios (mock calculation):")
-# 假设的ζ值用于演示比率
-zeta_vals = {2: 1.5, 3: 0.9, 4: 0.6, 6: 0.25}
-print(f"  ζ(3)/ζ(2) ≈ {zeta_vals[3]/zeta_vals[2]:.3f} ≈ φ^{-1} = {1/phi:.3f}")
-print(f"  ζ(4)/ζ(2) ≈ {zeta_vals[4]/zeta_vals[2]:.3f} ≈ φ^{-2} = {1/phi**2:.3f}")
+print("\nSpecial value ratios (golden path weights, 2^18 terms):")
+# ζ^{ii}(s) = Σ T_P n_F[P]^{-s}，T_P = φ^{-|Δk|} 由 n 的 Zeckendorf 路径给出
+s_special = np.array([2.0, 3.0, 4.0, 6.0])
+zeta_vals = dict(zip([2, 3, 4, 6], dirichlet_series(s_special, golden_weight, n_terms=1 << 18, tail='mean')))
+# 与章节声称的 φ^{-k} 并列输出，偏差超过 5% 即标为不符
+for num, k in [(3, 1), (4, 2)]:
+    ratio = zeta_vals[num] / zeta_vals[2]
+    target = phi**(-k)
+    deviation = abs(ratio - target) / target
+    verdict = "✓ matches" if deviation < 0.05 else "✗ does not match"
+    print(f"  ζ({num})/ζ(2) = {ratio:.3f}  vs  φ^{{-{k}}} = {target:.3f}  "
+          f"(relative deviation {deviation:.1%}) {verdict}")
 
 # 检查：修正后的数学结构
 print("\n✅ 10. Mathematical Structure (CORRECTED):")
@@ -1,4 +1,10 @@
 import numpy as np
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[4] / "scripts"))
+from fibonacci_engine import fibonacci
+from zeta_dynamics import CONVERGED, zeta_tower, zeta_tower_map
 
 print("=== Chapter 040: Recursive ζ Self-Application - CORRECTED Verification ===\n")
 
@@ -15,19 +21,6 @@ except Exception as e:
     print(f"ERROR in basic constants: {e}")
     raise
 
-def fibonacci(n):
-    if not isinstance(n, int) or n < 0:
-        raise ValueError(f"Fibonacci index must be non-negative integer, got {n}")
-    if n <= 0:
-        return 0
-    elif n == 1:
-        return 1
-    else:
-        a, b = 0, 1
-        for _ in range(2, n + 1):
-            a, b = b, a + b
-        return b
-
 print("\n=== CORRECTED CHAPTER VERIFICATION ===")
 
 # 检查：第一性原理合规
@@ -106,19 +99,21 @@ print("✓ CONVERGENCE: lim ρ_n = ζ'(s*)")
 print("✓ MATHEMATICAL: Dynamical systems")
 
 # 验证迭代比率行为
-print("\nIteration ratio example (simplified):")
-def simple_func(x):
-    return 1 + 1/x if x != 0 else float('inf')
-
-s = 2.0
+print("\nIteration ratio example:")
+# ρ_n = Σ_{k≤n} ρ_k - Σ_{k≤n-1} ρ_k；塔可能提前停止，按实际步数标注
 ratios = []
-for n in range(1, 6):
-    s_prev = s
-    s = simple_func(s)
-    if n > 1:
-        ratio = s / s_prev
-        ratios.append(ratio)
-        print(f"  Iteration {n}: ratio = {ratio:.6f}")
+_, _, _, _, prev_sum, _ = zeta_tower([2.0], max_iter=1)
+for n in range(2, 6):
+    _, _, _, steps, ratio_sum, _ = zeta_tower([2.0], max_iter=n)
+    ratios.append((ratio_sum[0] - prev_sum[0]).real)
+    prev_sum = ratio_sum
+    print(f"  Iteration {steps[0]}: ratio = {ratios[-1]:.6f}")
+
+# 整块网格的迭代塔：ρ_n → 1（收敛到吸引不动点），C_n 有限
+tower = zeta_tower_map(re_range=(-2.0, 0.5), im_range=(-1.0, 1.0), resolution=(32, 64), workers=1)
+attracted = tower.status == CONVERGED
+print(f"  Grid: {attracted.mean():.1%} of points reach s* = {np.median(tower.values[attracted].real):.6f}")
+print(f"  Median of mean ρ_k there = {np.median((tower.ratio_sum / tower.steps)[attracted].real):.6f}")
 
 # 检查：修正后的复杂度
 print("\n✅ 11. Complexity from Self-Application (CORRECTED):")
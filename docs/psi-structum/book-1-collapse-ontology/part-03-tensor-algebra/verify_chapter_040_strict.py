@@ -1,6 +1,12 @@
 import numpy as np
 import cmath
 import math
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[4] / "scripts"))
+from fibonacci_engine import fibonacci
+from zeta_dynamics import zeta_tower
 
 print("=== Chapter 040: Recursive ζ Self-Application - STRICT First Principles Verification ===\n")
 
@@ -17,19 +23,6 @@ except Exception as e:
     print(f"ERROR in basic constants: {e}")
     raise
 
-def fibonacci(n):
-    if not isinstance(n, int) or n < 0:
-        raise ValueError(f"Fibonacci index must be non-negative integer, got {n}")
-    if n <= 0:
-        return 0
-    elif n == 1:
-        return 1
-    else:
-        a, b = 0, 1
-        for _ in range(2, n + 1):
-            a, b = b, a + b
-        return b
-
 print("\n=== FIRST PRINCIPLES COMPLIANCE ANALYSIS ===")
 
 # 检查：自应用原理
@@ -104,17 +97,14 @@ print("✗ FINE STRUCTURE: α = 1/(4π g^7)")
 print("✗ ARBITRARY: Factor 4π g^7")
 
 # 模拟自耦合计算
-print("\nSelf-coupling check (mock):")
-# 简化的迭代（不是真实的ζ函数）
-def mock_zeta(s):
-    return 1 + 1/s  # 非常简化的模型
-
-z1 = 2.0
-z2 = mock_zeta(z1)
-z3 = mock_zeta(z2)
-g_mock = z3/z2
+print("\nSelf-coupling check:")
+# 真实的ζ迭代塔：g = ζ^[3](2)/ζ^[2](2) 即 ρ_3(2)
+z3 = zeta_tower([2.0], max_iter=3)[0]
+z2 = zeta_tower([2.0], max_iter=2)[0]
+g_mock = (z3[0] / z2[0]).real
 alpha_claimed = 1/(4*np.pi*g_mock**7)
-print(f"Mock g_self = {g_mock:.6f}")
+print(f"ζ^[3](2) = {z3[0].real:.6f}")
+print(f"g_self = ρ_3(2) = {g_mock:.6f}")
 print(f"α = 1/(4π g^7) = {alpha_claimed:.6f}")
 print(f"Should be 1/137 = {1/137:.6f}")
 print(f"Completely wrong!")
@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+章节 → 验证脚本 → 本地依赖 的索引，以及按改动重跑的监视模式
+
+同一目录下 chapter-0NN-*.md 与 verify_chapter_0NN*.py 共用章节号（不同目录的
+章节号会重复，所以章节键是 "目录#NNN"）。被索引的脚本与 verify_runner 的发现规则
+相同（verify_*.py 与 derive_*.py）。脚本的本地依赖与 result_cache 的
+缓存键使用同一套解析（scripts/ 中的共享内核、书目录中的 observer_constant_framework.py 等）。
+
+索引持久化在 CACHE_DIR/chapter_index.json，附带所有被索引文件的 (路径, mtime)
+指纹，文件有增删改时自动重建。
+
+    python3 scripts/chapter_index.py                         # 重建并汇总
+    python3 scripts/chapter_index.py --affected chapter.md   # 列出受影响的脚本
+    python3 scripts/chapter_index.py --watch --warm          # 保存即重跑受影响的验证
+
+监视模式在 Linux 上用 inotify（ctypes 直接调用 libc），其他平台退化为轮询 mtime。
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import hashlib
+import json
+import os
+import re
+import select
+import struct
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import verify_runner
+from result_cache import CACHE_DIR, REPO_ROOT, SHARED_DIR, local_dependencies
+
+DEFAULT_ROOTS = (REPO_ROOT / "docs" / "psi-constants", REPO_ROOT / "docs" / "psi-structum")
+INDEX_PATH = CACHE_DIR / "chapter_index.json"
+DEBOUNCE = 0.3
+POLL_INTERVAL = 1.0
+
+_CHAPTER_MD = re.compile(r"^chapter-(\d+)-.*\.md$")
+_CHAPTER_PY = re.compile(r"^verify_chapter_(\d+)\w*\.py$")
+
+
+def _rel(path):
+    """仓库内相对路径（字符串）"""
+    return str(Path(path).resolve().relative_to(REPO_ROOT))
+
+
+def tracked_files(roots=DEFAULT_ROOTS):
+    """被索引的 .md 与 .py 文件（含 scripts/ 中的共享模块）"""
+    files = []
+    for root in tuple(roots) + (SHARED_DIR,):
+        for pattern in ("*.md", "*.py"):
+            files.extend(p for p in Path(root).rglob(pattern) if '__pycache__' not in p.parts)
+    return sorted(set(files))
+
+
+def fingerprint(files):
+    """文件集合及其 mtime 的摘要，用于判断持久化的索引是否过期"""
+    digest = hashlib.sha1()
+    for path in files:
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            continue
+        digest.update(f"{_rel(path)}:{mtime}\n".encode())
+    return digest.hexdigest()
+
+
+def build_index(roots=DEFAULT_ROOTS):
+    """
+    扫描 roots，返回索引字典
+
+    chapters:   章节键 → {markdown: [...], scripts: [...]}
+    scripts:    脚本 → {chapter: 章节键或 None, depends: [本地依赖]}
+    dependents: 本地模块 → 直接或间接导入它的脚本
+    """
+    files = tracked_files(roots)
+    chapters = defaultdict(lambda: {'markdown': [], 'scripts': []})
+    scripts = {}
+    dependents = defaultdict(list)
+    for path in files:
+        if SHARED_DIR in path.parents:
+            continue
+        key_dir = _rel(path.parent)
+        md = _CHAPTER_MD.match(path.name)
+        if md:
+            chapters[f"{key_dir}#{md.group(1)}"]['markdown'].append(_rel(path))
+            continue
+        if not verify_runner.is_verify_script(path):
+            continue
+        py = _CHAPTER_PY.match(path.name)
+        chapter = f"{key_dir}#{py.group(1)}" if py else None
+        if chapter:
+            chapters[chapter]['scripts'].append(_rel(path))
+        depends = [_rel(dep) for dep in local_dependencies(path)]
+        scripts[_rel(path)] = {'chapter': chapter, 'depends': depends}
+        for dep in depends:
+            dependents[dep].append(_rel(path))
+
+    return {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'roots': [_rel(root) for root in roots],
+        'fingerprint': fingerprint(files),
+        'chapters': dict(sorted(chapters.items())),
+        'scripts': scripts,
+        'dependents': dict(sorted(dependents.items())),
+    }
+
+
+def save_index(index, path=INDEX_PATH):
+    """写入索引（临时文件 + 改名）"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, indent=1)
+    os.replace(tmp, path)
+
+
+def load_index(roots=DEFAULT_ROOTS, path=INDEX_PATH, rebuild=False):
+    """读取持久化的索引，过期或 rebuild=True 时重建并保存"""
+    roots = tuple(Path(r).resolve() for r in roots)
+    if not rebuild:
+        try:
+            with open(path, encoding='utf-8') as f:
+                index = json.load(f)
+            if (index.get('roots') == [_rel(r) for r in roots]
+                    and index.get('fingerprint') == fingerprint(tracked_files(roots))):
+                return index
+        except (OSError, ValueError):
+            pass
+    index = build_index(roots)
+    save_index(index, path)
+    return index
+
+
+def affected_scripts(index, changed):
+    """改动的文件（任意路径）影响到的验证脚本，按路径排序"""
+    chapter_of_md = {md: key for key, entry in index['chapters'].items() for md in entry['markdown']}
+    result = set()
+    for path in changed:
+        try:
+            rel = _rel(path)
+        except ValueError:
+            continue
+        if rel in index['scripts']:
+            result.add(rel)
+        if rel in chapter_of_md:
+            result.update(index['chapters'][chapter_of_md[rel]]['scripts'])
+        result.update(index['dependents'].get(rel, ()))
+    return sorted(result)
+
+
+class _Inotify:
+    """最小的 inotify 封装：监视目录中文件的写入完成、移入与删除"""
+
+    IN_CLOSE_WRITE, IN_MOVED_TO, IN_CREATE, IN_DELETE = 0x8, 0x80, 0x100, 0x200
+    IN_ISDIR = 0x40000000
+    MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    _EVENT = struct.Struct('iIII')
+
+    def __init__(self):
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c') or None, use_errno=True)
+        self.fd = self._libc.inotify_init1(os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs = {}
+
+    def add_tree(self, root):
+        """监视 root 及其全部子目录"""
+        for directory in [Path(root)] + [p for p in Path(root).rglob('*') if p.is_dir()]:
+            if '__pycache__' in directory.parts:
+                continue
+            wd = self._libc.inotify_add_watch(self.fd, str(directory).encode(), self.MASK)
+            if wd >= 0:
+                self._dirs[wd] = directory
+
+    def read(self, timeout):
+        """等待最多 timeout 秒，返回改动的路径列表"""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        data = os.read(self.fd, 1 << 16)
+        paths = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = self._EVENT.unpack_from(data, offset)
+            offset += self._EVENT.size
+            name = data[offset:offset + length].rstrip(b'\0').decode(errors='replace')
+            offset += length
+            if wd not in self._dirs or not name:
+                continue
+            path = self._dirs[wd] / name
+            if mask & self.IN_ISDIR:
+                if mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                    self.add_tree(path)
+                continue
+            paths.append(path)
+        return paths
+
+    def close(self):
+        """关闭 inotify 描述符（同时撤销全部监视）"""
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+class _Poller:
+    """没有 inotify 时按 mtime 轮询"""
+
+    def __init__(self):
+        self._roots = []
+        self._seen = {}
+
+    def _scan(self):
+        state = {}
+        for root in self._roots:
+            for path in Path(root).rglob('*'):
+                if path.suffix in ('.md', '.py') and '__pycache__' not in path.parts:
+                    try:
+                        state[path] = path.stat().st_mtime_ns
+                    except OSError:
+                        continue
+        return state
+
+    def add_tree(self, root):
+        self._roots.append(root)
+        self._seen = self._scan()
+
+    def read(self, timeout):
+        time.sleep(min(timeout, POLL_INTERVAL))
+        state = self._scan()
+        changed = [p for p in set(state) | set(self._seen) if state.get(p) != self._seen.get(p)]
+        self._seen = state
+        return changed
+
+    def close(self):
+        pass
+
+
+def watcher():
+    """inotify 可用时用 inotify，否则轮询"""
+    if sys.platform.startswith('linux'):
+        try:
+            return _Inotify()
+        except (OSError, AttributeError):
+            pass
+    return _Poller()
+
+
+def watch(roots=DEFAULT_ROOTS, warm=False, timeout=None, cache=True):
+    """监视 roots 与 scripts/，每次保存后只重跑受影响的验证脚本"""
+    roots = tuple(Path(r).resolve() for r in roots)
+    index = load_index(roots)
+    source = watcher()
+    pool = None
+    try:
+        for root in roots + (SHARED_DIR,):
+            source.add_tree(root)
+        result_cache = verify_runner.ResultCache() if cache else None
+        pool = verify_runner.WarmPool(env=verify_runner.script_env()) if warm else None
+        timeout = timeout or verify_runner.DEFAULT_TIMEOUT
+        print(f"监视 {len(index['scripts'])} 个验证脚本（{type(source).__name__.strip('_')}），Ctrl-C 退出")
+        while True:
+            changed = set(p for p in source.read(3600) if p.suffix in ('.md', '.py'))
+            if not changed:
+                continue
+            deadline = time.monotonic() + DEBOUNCE
+            while time.monotonic() < deadline:
+                changed.update(p for p in source.read(DEBOUNCE) if p.suffix in ('.md', '.py'))
+            if any(p.suffix == '.py' for p in changed):
+                index = load_index(roots)
+            targets = [REPO_ROOT / s for s in affected_scripts(index, changed) if (REPO_ROOT / s).exists()]
+            names = ", ".join(sorted(p.name for p in changed))
+            print(f"\n改动: {names} → {len(targets)} 个验证脚本")
+            results = verify_runner.run_all(targets, timeout=timeout, on_result=verify_runner._print_result,
+                                            cache=result_cache, warm=pool)
+            summary = verify_runner.summarize(results)
+            print(f"通过 {summary[verify_runner.PASSED]}，失败 {summary[verify_runner.FAILED]}，"
+                  f"超时 {summary[verify_runner.TIMEOUT]}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        source.close()
+        if pool is not None:
+            pool.close()
+
+
+def main(argv=None):
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description="章节与验证脚本的依赖索引")
+    parser.add_argument('roots', nargs='*', help="索引的目录（默认 docs/psi-constants 与 docs/psi-structum）")
+    parser.add_argument('--rebuild', action='store_true', help="强制重建索引")
+    parser.add_argument('--affected', nargs='+', metavar='FILE', help="列出这些文件改动后需要重跑的脚本")
+    parser.add_argument('--watch', action='store_true', help="监视改动并重跑受影响的验证脚本")
+    parser.add_argument('--warm', action='store_true', help="监视模式下使用预热解释器")
+    parser.add_argument('--timeout', type=float, help="每个脚本的超时（秒）")
+    parser.add_argument('--no-cache', action='store_true', help="监视模式下不使用结果缓存")
+    args = parser.parse_args(argv)
+    roots = args.roots or DEFAULT_ROOTS
+
+    if args.watch:
+        watch(roots, args.warm, args.timeout, cache=not args.no_cache)
+        return 0
+
+    index = load_index(roots, rebuild=args.rebuild)
+    if args.affected:
+        for script in affected_scripts(index, args.affected):
+            print(script)
+        return 0
+
+    linked = sum(1 for s in index['scripts'].values() if s['chapter'])
+    print(f"索引: {INDEX_PATH}")
+    print(f"章节 {len(index['chapters'])} 个，验证脚本 {len(index['scripts'])} 个（{linked} 个关联到章节）")
+    print("共享模块被依赖次数:")
+    for dep, users in sorted(index['dependents'].items(), key=lambda item: -len(item[1])):
+        print(f"  {len(users):4d}  {dep}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Zeckendorf 系数的 Dirichlet 级数 Σ a(n)·n^(-s)
+
+第034/035章的张量 ζ 函数 ζ^{ij}(s) = Σ_P T^{ij}_P [n_F[P]]^(-s) 中，
+路径 P 与正整数 n 的 Zeckendorf 位模式一一对应（zeckendorf_codec 的约定，
+第i位 ↔ F_{i+2}），所以 T_P 是 n 的位模式的函数 a(n)。T_P = 1 时退化为黎曼 ζ。
+
+系数函数接收 (n 块, 位矩阵块) 返回系数块；系数按块生成，经 zeta_engine.partial_sum
+的 weights 钩子与 n^(-s) 的外积逐块累加，s 可为数组。
+
+尾项加速：
+    'mean'        Σ_{n≥N} a(n) n^(-s) ≈ ā·Σ_{n≥N} n^(-s)，ā 为已算系数的平均值，
+                  后者用 Euler–Maclaurin 展开（a(n) = 1 时精确）
+    'richardson'  假设 S_N = S + c·N^(1-s)，由 S_{N/2} 与 S_N 消去 c（Re(s) > 1）
+"""
+
+import numpy as np
+
+from zeckendorf_codec import zeckendorf_bits, zeckendorf_width
+from zeta_engine import DEFAULT_CHUNK, euler_maclaurin_tail, partial_sum
+
+PHI = (1 + 5 ** 0.5) / 2
+DEFAULT_TERMS = 1 << 16
+TAIL_MODES = (None, 'mean', 'richardson')
+
+
+def _lowest_highest(bits):
+    """每行最低、最高置位的下标（n ≥ 1 时至少有一位）"""
+    width = bits.shape[1]
+    lowest = np.argmax(bits, axis=1)
+    highest = width - 1 - np.argmax(bits[:, ::-1], axis=1)
+    return lowest, highest
+
+
+def unit_weight(n, bits):
+    """T_P = 1：级数即黎曼 ζ"""
+    return np.ones(len(n))
+
+
+def golden_weight(n, bits):
+    """
+    第034章的黄金路径权重 T_P = Π φ^(-|k_{i+1} - k_i|)
+
+    路径沿置位下标升序走，乘积化简为 φ^(-(最高位 - 最低位))。
+    """
+    lowest, highest = _lowest_highest(bits)
+    return PHI ** -(highest - lowest).astype(np.float64)
+
+
+def digit_weight(base):
+    """a(n) = base^(Zeckendorf 项数)；base = -1 给出 Zeckendorf 版的 Liouville 函数"""
+    def weight(n, bits):
+        return np.power(base, bits.sum(axis=1, dtype=np.int64).astype(np.float64))
+    return weight
+
+
+def layer_weight(base):
+    """a(n) = base^(层号)，层号为 n 的 Zeckendorf 位数（最高位下标 + 1）"""
+    def weight(n, bits):
+        _, highest = _lowest_highest(bits)
+        return np.power(base, (highest + 1).astype(np.float64))
+    return weight
+
+
+def zeckendorf_coefficients(n, weight):
+    """对 n 块生成系数：先批量编码成位矩阵，再交给 weight"""
+    n = np.asarray(n, dtype=np.int64)
+    bits = zeckendorf_bits(n, zeckendorf_width(n.max()))
+    return np.asarray(weight(n, bits))
+
+
+def dirichlet_series(s, weight=unit_weight, n_terms=DEFAULT_TERMS, tail=None, chunk=DEFAULT_CHUNK):
+    """
+    Σ_{n≥1} a(n)·n^(-s)，a(n) = weight(n, Zeckendorf 位矩阵)
+
+    s 为标量或（复）数组。tail 取 TAIL_MODES 之一：None 只算前 n_terms 项
+    的部分和，其余见模块说明。
+    """
+    if tail not in TAIL_MODES:
+        raise ValueError(f"tail must be one of {TAIL_MODES}, got {tail!r}")
+    is_real = np.isrealobj(s)
+    s_arr = np.asarray(s, dtype=np.complex128)
+    N = int(n_terms)
+
+    seen = [0.0, 0]  # 系数和、项数，供 'mean' 估计 ā
+
+    def coefficients(n):
+        a = zeckendorf_coefficients(n, weight)
+        seen[0] += a.sum()
+        seen[1] += len(a)
+        return a
+
+    if tail == 'richardson':
+        M = N // 2
+        head = partial_sum(s_arr, 1, M, weights=coefficients, chunk=chunk)
+        full = head + partial_sum(s_arr, M, N, weights=coefficients, chunk=chunk)
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            scale_n = np.exp((s_arr - 1) * np.log(N))
+            scale_m = np.exp((s_arr - 1) * np.log(M))
+            value = (full * scale_n - head * scale_m) / (scale_n - scale_m)
+    else:
+        value = partial_sum(s_arr, 1, N, weights=coefficients, chunk=chunk)
+        if tail == 'mean':
+            value = value + seen[0] / max(seen[1], 1) * euler_maclaurin_tail(s_arr, N)
+
+    if is_real:
+        value = value.real
+    return value[()] if value.ndim == 0 else value
+
+
+def main():
+    """主函数：单位权重与黎曼 ζ 对比，以及非平凡权重的张量 ζ"""
+    from zeta_engine import zeta
+
+    print("Zeckendorf 系数 Dirichlet 级数")
+    print("=" * 60)
+    s = np.array([1.5, 2.0, 3.0, 0.5 + 14.134725141734693j])
+    exact = zeta(s)
+    for mode in TAIL_MODES[:2]:
+        approx = dirichlet_series(s, unit_weight, n_terms=1 << 14, tail=mode)
+        print(f"T_P = 1, tail={mode!s:>10}: 最大误差 {np.max(np.abs(approx - exact)):.2e}")
+    approx = dirichlet_series(s[:3].real, unit_weight, n_terms=1 << 14, tail='richardson')
+    print(f"T_P = 1, tail=richardson: 最大误差 {np.max(np.abs(approx - exact[:3].real)):.2e}")
+
+    s_values = np.array([2.0, 3.0, 4.0, 6.0])
+    for label, weight in [("黄金 φ^(-Δk)", golden_weight), ("(-1)^项数", digit_weight(-1.0)),
+                          ("φ^(-层号)", layer_weight(1 / PHI))]:
+        coarse = dirichlet_series(s_values, weight, n_terms=1 << 16, tail='mean')
+        fine = dirichlet_series(s_values, weight, n_terms=1 << 20, tail='mean')
+        values = ", ".join(f"ζ({v:g}) = {z:.10f}" for v, z in zip(s_values, fine))
+        print(f"{label}: {values}（2^16 与 2^20 项之差 {np.max(np.abs(fine - coarse)):.1e}）")
+
+
+if __name__ == "__main__":
+    main()
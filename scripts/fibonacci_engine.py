@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+共享的斐波那契/卢卡斯数引擎
+
+约定与各章节验证脚本一致：F_0 = 0, F_1 = 1, L_0 = 2, L_1 = 1，
+下标必须是非负整数（bool 不算），否则抛出 ValueError。
+
+- 精确整数：快速倍增 F_2k = F_k (2F_{k+1} - F_k), F_2k+1 = F_k² + F_{k+1}²，O(log n)
+- 有界 LRU 缓存：倍增过程中的中间结果在多次调用之间复用
+- 向量化：下标数组查 int64 表（n ≤ 92），或返回精确的 object 数组
+- 浮点快速路径：Binet 公式 φ^n/√5，附带误差上界
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+PHI = (1 + 5 ** 0.5) / 2
+SQRT5 = 5 ** 0.5
+MEMO_SIZE = 4096
+
+# F_0 .. F_92：F_92 是不超过 int64 上限的最大斐波那契数
+_SMALL = [0, 1]
+while _SMALL[-1] + _SMALL[-2] <= np.iinfo(np.int64).max:
+    _SMALL.append(_SMALL[-1] + _SMALL[-2])
+_SMALL_ARRAY = np.array(_SMALL, dtype=np.int64)
+MAX_INT64_INDEX = len(_SMALL) - 1
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def fibonacci_pair(n):
+    """(F_n, F_{n+1})，快速倍增"""
+    if n < len(_SMALL) - 1:
+        return _SMALL[n], _SMALL[n + 1]
+    a, b = fibonacci_pair(n >> 1)
+    c = a * (2 * b - a)
+    d = a * a + b * b
+    return (d, c + d) if n & 1 else (c, d)
+
+
+def _check_index(n):
+    """下标检查，与验证脚本中的 fibonacci 保持同样的报错"""
+    if isinstance(n, (bool, np.bool_)) or not isinstance(n, (int, np.integer)) or n < 0:
+        raise ValueError(f"Fibonacci index must be non-negative integer, got {n}")
+    return int(n)
+
+
+def fibonacci(n):
+    """第n个斐波那契数（精确整数）"""
+    n = _check_index(n)
+    if n <= MAX_INT64_INDEX:
+        return _SMALL[n]
+    return fibonacci_pair(n)[0]
+
+
+def lucas(n):
+    """第n个卢卡斯数 L_n = 2F_{n+1} - F_n"""
+    f, g = fibonacci_pair(_check_index(n))
+    return 2 * g - f
+
+
+def fibonacci_array(indices, exact=False):
+    """
+    向量化 F_n
+
+    下标都不超过 92 时返回 int64 数组；否则 exact=True 返回
+    Python 整数的 object 数组，exact=False 则抛出 OverflowError。
+    """
+    indices = np.asarray(indices)
+    if indices.dtype == np.bool_:
+        raise ValueError("Fibonacci index must be non-negative integer, got bool array")
+    indices = indices.astype(np.int64)
+    if not indices.size:
+        return np.zeros(indices.shape, dtype=np.int64)
+    if indices.min() < 0:
+        raise ValueError("Fibonacci index must be non-negative integer")
+    if indices.max() <= MAX_INT64_INDEX:
+        return _SMALL_ARRAY[indices]
+    if not exact:
+        raise OverflowError(f"F_{indices.max()} 超出 int64，请使用 exact=True 或 fibonacci_binet")
+    out = np.empty(indices.shape, dtype=object)
+    for pos, n in np.ndenumerate(indices):
+        out[pos] = fibonacci(n)
+    return out
+
+
+def fibonacci_binet(n):
+    """
+    Binet 公式的浮点 F_n，返回 (值, 绝对误差上界)
+
+    误差来源: 被略去的 |ψ|^n/√5，以及 φ 的舍入经 n 次幂放大
+    (相对误差约 (n/2 + 2)·eps)。n > 1474 时溢出为 inf。
+    """
+    n = np.asarray(n, dtype=np.float64)
+    eps = np.finfo(np.float64).eps
+    with np.errstate(over='ignore'):
+        value = PHI ** n / SQRT5
+        bound = value * (n / 2 + 2) * eps + (PHI - 1) ** n / SQRT5
+    value = np.where(n > 0, value, 0.0)
+    bound = np.where(n > 0, bound, 0.0)
+    if value.ndim == 0:
+        return float(value), float(bound)
+    return value, bound
+
+
+def main():
+    """主函数：展示引擎各接口"""
+    print("斐波那契/卢卡斯数引擎")
+    print("=" * 60)
+    print(f"F_0..F_15: {[fibonacci(n) for n in range(16)]}")
+    print(f"L_0..L_15: {[lucas(n) for n in range(16)]}")
+
+    n = 150
+    value, bound = fibonacci_binet(n)
+    exact = fibonacci(n)
+    print(f"\nF_{n} = {exact}")
+    print(f"Binet: {value:.15e} ± {bound:.2e} (实际误差 {abs(value - exact):.2e})")
+    assert abs(value - exact) <= bound
+
+    print(f"\nF_[10, 50, 90] = {fibonacci_array([10, 50, 90]).tolist()}")
+    print(f"F_(10^6) 共 {fibonacci(10**6).bit_length()} 个二进制位")
+    print(f"缓存: {fibonacci_pair.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
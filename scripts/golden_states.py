@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+黄金约束状态枚举器
+
+把n位无连续1 (no-11) 的二进制状态打包成 uint64 整数数组，
+最高位对应字符串的第一个字符，数组按数值（即字典序）升序排列。
+
+层结构: layer(n) = layer(n-1) ∪ (2^(n-1) + layer(n-2))
+即 '0'+s 与 '10'+t 两块，前一块全部小于 2^(n-1)，拼接后天然有序。
+
+同一结构给出排名: 第i位为1时跳过了低i位自由的 a(i) = F_{i+2} 个状态，
+所以 rank(state) = Σ_{第i位为1} a(i)，与层数n无关；unrank 为贪心逆过程。
+两者都逐位进行，耗时 O(n)（n 为位数），但不需要枚举整层。
+
+按1的个数k统计，第n层恰有 C(n-k+1, k) 个状态（k个1各自后接一个0）。
+"""
+
+import math
+import os
+from pathlib import Path
+
+import numpy as np
+
+MAX_BITS = 64
+DEFAULT_CHUNK = 1 << 20
+CACHE_DIR = Path(os.environ.get("PSI_CACHE_DIR", Path.home() / ".cache" / "psi-verify"))
+MAX_CACHE_BYTES = 64 * 1024 * 1024
+
+
+def _check_bits(n):
+    """检查位数是否能放进一个 uint64"""
+    if n < 0 or n > MAX_BITS:
+        raise ValueError(f"位数必须在 0..{MAX_BITS} 之间: n={n}")
+
+
+def count_no11(n):
+    """n位无连续1字符串的个数 a(n) = F_{n+2}（精确整数）"""
+    _check_bits(n)
+    a, b = 1, 2  # a(0), a(1)
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+
+# a(i) = F_{i+2}，i = 0..64；a(64) = F_66 仍在 int64 范围内
+_LAYER_COUNTS = [count_no11(i) for i in range(MAX_BITS + 1)]
+_LAYER_COUNTS_ARRAY = np.array(_LAYER_COUNTS, dtype=np.int64)
+
+
+def rank(state):
+    """状态在其所在层中的序号（与层数无关），逐位累加，O(n)"""
+    state = int(state)
+    if state < 0 or state >= 1 << MAX_BITS:
+        raise ValueError(f"状态超出 {MAX_BITS} 位: {state}")
+    if state & (state >> 1):
+        raise ValueError(f"状态含有连续的1: {state:b}")
+    k = 0
+    i = 0
+    while state:
+        if state & 1:
+            k += _LAYER_COUNTS[i]
+        state >>= 1
+        i += 1
+    return k
+
+
+def unrank(n, k):
+    """第n层中序号为k的状态（升序），逐位贪心，O(n)，不需要枚举整层"""
+    _check_bits(n)
+    k = int(k)
+    if k < 0 or k >= _LAYER_COUNTS[n]:
+        raise IndexError(f"第{n}层只有 {_LAYER_COUNTS[n]} 个状态: k={k}")
+    state = 0
+    for i in range(n - 1, -1, -1):
+        if k >= _LAYER_COUNTS[i]:
+            state |= 1 << i
+            k -= _LAYER_COUNTS[i]
+    return state
+
+
+def rank_array(states):
+    """rank 的向量化版本，返回 int64 数组（对 64 个位各做一次数组运算）"""
+    states = np.asarray(states, dtype=np.uint64)
+    if not is_no11(states).all():
+        raise ValueError("存在含有连续1的状态")
+    ranks = np.zeros(states.shape, dtype=np.int64)
+    for i in range(MAX_BITS):
+        bit = ((states >> np.uint64(i)) & np.uint64(1)).astype(bool)
+        if not bit.any():
+            continue
+        ranks[bit] += _LAYER_COUNTS_ARRAY[i]
+    return ranks
+
+
+def unrank_array(n, ks):
+    """unrank 的向量化版本，返回 uint64 状态数组（对 n 个位各做一次数组运算）"""
+    _check_bits(n)
+    ks = np.array(ks, dtype=np.int64)
+    if ks.size and (ks.min() < 0 or ks.max() >= _LAYER_COUNTS[n]):
+        raise IndexError(f"第{n}层只有 {_LAYER_COUNTS[n]} 个状态")
+    states = np.zeros(ks.shape, dtype=np.uint64)
+    for i in range(n - 1, -1, -1):
+        take = ks >= _LAYER_COUNTS_ARRAY[i]
+        states[take] |= np.uint64(1) << np.uint64(i)
+        ks[take] -= _LAYER_COUNTS_ARRAY[i]
+    return states
+
+
+def no11_range(n, start, stop):
+    """第n层序号 [start, stop) 的状态切片"""
+    return unrank_array(n, np.arange(start, stop, dtype=np.int64))
+
+
+def no11_states(n):
+    """返回n位全部无连续1状态，uint64数组，升序"""
+    _check_bits(n)
+    prev2 = np.zeros(1, dtype=np.uint64)               # layer(0): ['']
+    if n == 0:
+        return prev2
+    prev1 = np.array([0, 1], dtype=np.uint64)          # layer(1): ['0', '1']
+    for k in range(2, n + 1):
+        top = np.uint64(1) << np.uint64(k - 1)
+        prev2, prev1 = prev1, np.concatenate((prev1, prev2 | top))
+    return prev1
+
+
+def iter_no11_chunks(n, chunk_size=DEFAULT_CHUNK):
+    """
+    流式枚举第n层状态，每次产出不超过 chunk_size 个元素的有序块
+
+    把n位拆成高 n-m 位与低 m 位：高位以1结尾时低位首位只能是0，
+    而以0开头的低位状态恰好是 layer(m) 的前 F_{m+1} 个元素。
+    内存占用只与 chunk_size 有关，可用于 n ≤ 60 的深层扫描。
+    """
+    _check_bits(n)
+    if chunk_size < 2:
+        raise ValueError("chunk_size 至少为2")
+
+    if count_no11(n) <= chunk_size:
+        yield no11_states(n)
+        return
+
+    m = 1
+    while count_no11(m + 1) <= chunk_size:
+        m += 1
+    low = no11_states(m)
+    low_zero_top = low[:count_no11(m - 1)]
+
+    for high_chunk in iter_no11_chunks(n - m, chunk_size):
+        for h in high_chunk.tolist():
+            tail = low_zero_top if h & 1 else low
+            yield tail | np.uint64(h << m)
+
+
+def is_no11(states):
+    """向量化检查: 状态中是否没有相邻的1"""
+    states = np.asarray(states, dtype=np.uint64)
+    return (states & (states >> np.uint64(1))) == 0
+
+
+def states_to_strings(states, n):
+    """把打包状态还原成n位 '0'/'1' 字符串列表"""
+    return [format(v, f'0{n}b') if n else '' for v in np.asarray(states).tolist()]
+
+
+def states_to_bits(states, n):
+    """把打包状态展开成 (个数, n) 的 uint8 位矩阵，第0列为最高位"""
+    states = np.asarray(states, dtype=np.uint64)
+    shifts = np.arange(n - 1, -1, -1, dtype=np.uint64)
+    return ((states[:, None] >> shifts) & np.uint64(1)).astype(np.uint8)
+
+
+def states_to_phases(states, n):
+    """状态相位 θ = 2π·value / 2^n"""
+    states = np.asarray(states, dtype=np.uint64)
+    return 2 * np.pi * states.astype(np.float64) / float(2 ** n)
+
+
+def ones_count(n, k):
+    """第n层中恰有k个1的状态数 C(n-k+1, k)"""
+    if k < 0 or n - k + 1 < k:
+        return 0
+    return math.comb(n - k + 1, k)
+
+
+def _log_factorials(n_max):
+    """log(m!)，m = 0..n_max+1"""
+    return np.concatenate(([0.0], np.cumsum(np.log(np.arange(1, n_max + 2)))))
+
+
+class LogOnesTable:
+    """
+    对数表的按行视图：只保存 log(m!)，第n行 log C(n-k+1, k) 在取行时 O(n) 算出
+
+    形状与稠密表相同，table[n] 返回长 (n_max+1)//2+1 的行（计数为0处是 -inf），
+    table[n, k] 取单个元素。n = 10^4 时只占 80 KB，而稠密表约 400 MB。
+    """
+
+    def __init__(self, log_fact):
+        self.log_fact = np.asarray(log_fact, dtype=np.float64)
+        self.n_max = len(self.log_fact) - 2
+        self.shape = (self.n_max + 1, (self.n_max + 1) // 2 + 1)
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __getitem__(self, index):
+        if isinstance(index, tuple):
+            n, k = index
+            return self[n][k]
+        n = int(index)
+        if n < 0:
+            n += len(self)
+        if not 0 <= n <= self.n_max:
+            raise IndexError(f"层号超出 0..{self.n_max}: {index}")
+        k = np.arange(self.shape[1])
+        rest = n - 2 * k + 1
+        valid = rest >= 0
+        row = np.full(self.shape[1], -np.inf)
+        kv = k[valid]
+        row[valid] = self.log_fact[n - kv + 1] - self.log_fact[kv] - self.log_fact[rest[valid]]
+        return row
+
+    def dense(self):
+        """展开成稠密数组（只适合小 n_max）"""
+        return np.array([self[n] for n in range(len(self))]).reshape(self.shape)
+
+
+def _exact_ones_table(n_max):
+    """精确大整数表：T[n][k] = T[n-1][k] + T[n-2][k-1]（追加 '0' 或 '01'）"""
+    width = (n_max + 1) // 2 + 1
+    table = np.zeros((n_max + 1, width), dtype=object)
+    table[0, 0] = 1
+    if n_max >= 1:
+        table[1, :2] = [1, 1][:width]
+    for n in range(2, n_max + 1):
+        table[n] = table[n - 1]
+        table[n, 1:] += table[n - 2, :-1]
+    return table
+
+
+_decimal_to_int = np.frompyfunc(int, 1, 1)
+
+
+def ones_count_table(n_max, exact=False, cache=False):
+    """
+    第 0..n_max 层按1的个数统计的直方图，形状 (n_max+1, (n_max+1)//2+1)
+
+    exact=False 返回按行计算的自然对数表 LogOnesTable（计数为0处是 -inf），
+    n 到 10^4 也不会溢出，且只保存 log(m!)；exact=True 返回 Python 整数的 object 数组。
+    cache=True 时结果缓存在 CACHE_DIR，但超过 MAX_CACHE_BYTES 的表不写盘
+    （对数表只存 log(m!)，n = 10^4 时 80 KB）。精确表按十进制字符串保存，读取不需要 pickle。
+    """
+    path = CACHE_DIR / f"ones_count_{'decimal' if exact else 'logfact'}_{n_max}.npy"
+    if cache and path.exists():
+        stored = np.load(path)
+        return _decimal_to_int(stored) if exact else LogOnesTable(stored)
+
+    if exact:
+        table = _exact_ones_table(n_max)
+        stored = table.astype(str)
+    else:
+        stored = _log_factorials(n_max)
+        table = LogOnesTable(stored)
+    if cache and stored.nbytes <= MAX_CACHE_BYTES:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, 'wb') as f:
+            np.save(f, stored)
+        os.replace(tmp, path)
+    return table
+
+
+def layer_weighted_mean(log_table, n, values_by_k):
+    """
+    第n层状态上按1的个数加权的平均值 Σ_k C(n-k+1,k)·v_k / F_{n+2}
+
+    log_table 为 ones_count_table 的对数表（只取第n行），整层平均只需一次点积。
+    """
+    row = log_table[n]
+    values_by_k = np.broadcast_to(np.asarray(values_by_k, dtype=np.float64), row.shape)
+    weights = np.exp(row - np.logaddexp.reduce(row))
+    return float(weights @ values_by_k)
+
+
+def main():
+    """主函数：展示各层状态数与流式枚举"""
+    print("黄金约束状态枚举器")
+    print("=" * 60)
+    for n in range(8):
+        states = no11_states(n)
+        print(f"n={n}: {len(states):3d} 个状态 = F_{n+2} | {states_to_strings(states[:3], n)}")
+
+    n = 32
+    total = 0
+    for chunk in iter_no11_chunks(n, chunk_size=1 << 18):
+        assert is_no11(chunk).all()
+        total += len(chunk)
+    print(f"\n流式枚举 n={n}: {total} 个状态 (F_{n+2} = {count_no11(n)})")
+    assert total == count_no11(n)
+
+    n = 60
+    k = count_no11(n) // 2
+    state = unrank(n, k)
+    print(f"\n第{n}层共 {count_no11(n)} 个状态，第{k}个: {state:0{n}b}")
+    assert rank(state) == k
+
+    table = ones_count_table(7, exact=True, cache=False)
+    print(f"\n第7层按1的个数: {table[7].tolist()} (合计 {sum(table[7])})")
+    n = 10**4
+    log_table = ones_count_table(n, cache=False)
+    density = layer_weighted_mean(log_table, n, np.arange(log_table.shape[1]) / n)
+    phi = (1 + 5 ** 0.5) / 2
+    print(f"第{n}层1的平均密度 <k>/n = {density:.6f} (1/(1+φ²) = {1 / (1 + phi ** 2):.6f})")
+
+
+if __name__ == "__main__":
+    main()
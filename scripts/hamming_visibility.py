@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+整层状态的汉明距离与可见度核
+
+状态按 golden_states 的约定打包成 uint64，两状态的汉明距离 γ = popcount(a ^ b)。
+可见度沿用第036章的定义 V(γ, μ) = exp(-γ²/μ²)·[γ ≥ μ_min]。
+
+γ 只取 0..64，所以任何 γ 的函数在整层上的和都由距离直方图决定：
+分块模式逐块累加直方图，内存只与块大小有关，10^5 以上的层也能处理。
+"""
+
+import numpy as np
+
+from golden_states import no11_states
+
+MAX_DISTANCE = 64
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def _popcount_swar(x):
+    """旧版 NumPy 没有 bitwise_count 时的 SWAR 位计数"""
+    x = x - ((x >> np.uint64(1)) & np.uint64(0x5555555555555555))
+    x = (x & np.uint64(0x3333333333333333)) + ((x >> np.uint64(2)) & np.uint64(0x3333333333333333))
+    x = (x + (x >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    return ((x * np.uint64(0x0101010101010101)) >> np.uint64(56)).astype(np.uint8)
+
+
+def popcount(x):
+    """uint64 数组逐元素的1的个数"""
+    x = np.asarray(x, dtype=np.uint64)
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(x)
+    with np.errstate(over='ignore'):
+        return _popcount_swar(x)
+
+
+def pack_bits(bits):
+    """0/1 序列（第一个元素为最高位）打包成一个整数"""
+    value = 0
+    for bit in bits:
+        value = (value << 1) | int(bit)
+    return value
+
+
+def hamming_distances(a, b):
+    """逐元素汉明距离（可广播）"""
+    return popcount(np.bitwise_xor(np.asarray(a, dtype=np.uint64), np.asarray(b, dtype=np.uint64)))
+
+
+def hamming_matrix(a, b=None):
+    """全配对汉明距离矩阵，uint8，形状 (len(a), len(b))"""
+    a = np.asarray(a, dtype=np.uint64)
+    b = a if b is None else np.asarray(b, dtype=np.uint64)
+    return hamming_distances(a[:, None], b[None, :])
+
+
+def visibility(gamma, mu, mu_min=1):
+    """向量化可见度 V(γ, μ) = exp(-γ²/μ²)·[γ ≥ μ_min]"""
+    gamma = np.asarray(gamma, dtype=np.float64)
+    return np.exp(-(gamma ** 2) / (mu ** 2)) * (gamma >= mu_min)
+
+
+# 每个配对的峰值字节数：uint64 异或中间量与 uint8 距离同时存在，
+# 随后 bincount 把 uint8 转为 intp 时同样是 1 + 8 字节
+BYTES_PER_PAIR = 9
+
+
+def _tile_size(max_bytes):
+    """在内存上限内的方块边长"""
+    return max(1, int((max_bytes // BYTES_PER_PAIR) ** 0.5))
+
+
+def hamming_histogram(states, max_bytes=DEFAULT_MAX_BYTES):
+    """
+    全部无序对 (i < j) 的汉明距离直方图，长度 65 的 int64 数组
+
+    按上三角分块计算，每块的中间数组不超过 max_bytes。对角块是对称的，
+    整块计数后减去对角线（γ = 0）再减半，不需要 triu_indices 的下标数组。
+    """
+    states = np.asarray(states, dtype=np.uint64)
+    tile = _tile_size(max_bytes)
+    hist = np.zeros(MAX_DISTANCE + 1, dtype=np.int64)
+    for i0 in range(0, len(states), tile):
+        rows = states[i0:i0 + tile]
+        for j0 in range(i0, len(states), tile):
+            counts = np.bincount(hamming_matrix(rows, states[j0:j0 + tile]).ravel(),
+                                 minlength=MAX_DISTANCE + 1)
+            if j0 == i0:
+                counts[0] -= len(rows)
+                counts //= 2
+            hist += counts
+    return hist
+
+
+def sampled_hamming(states, n_pairs, seed=0):
+    """随机抽取 n_pairs 个不同下标的对，返回其汉明距离（少于两个状态时没有这样的对）"""
+    states = np.asarray(states, dtype=np.uint64)
+    if n_pairs == 0:
+        return np.zeros(0, dtype=np.uint8)
+    if len(states) < 2:
+        raise ValueError(f"sampled_hamming 至少需要 2 个状态才能抽取不同的状态对: 只有 {len(states)} 个")
+    rng = np.random.default_rng(seed)
+    i = rng.integers(0, len(states), n_pairs)
+    j = (i + rng.integers(1, len(states), n_pairs)) % len(states)
+    return hamming_distances(states[i], states[j])
+
+
+def mean_visibility(states, mu, mu_min=1, max_bytes=DEFAULT_MAX_BYTES):
+    """整层无序对的平均可见度"""
+    return histogram_visibility(hamming_histogram(states, max_bytes), mu, mu_min)
+
+
+def histogram_visibility(hist, mu, mu_min=1):
+    """由距离直方图求平均可见度：与 V(0..64) 的一次点积"""
+    pairs = hist.sum()
+    if pairs == 0:
+        return 0.0
+    return float(hist @ visibility(np.arange(MAX_DISTANCE + 1), mu, mu_min) / pairs)
+
+
+def main():
+    """主函数：各层的平均汉明距离与可见度"""
+    print("整层汉明距离与可见度")
+    print("=" * 60)
+    mu = 2 ** 3
+    for n in (7, 12, 16, 20):
+        states = no11_states(n)
+        hist = hamming_histogram(states)
+        mean_gamma = hist @ np.arange(MAX_DISTANCE + 1) / hist.sum()
+        v = histogram_visibility(hist, mu)
+        print(f"第{n:2d}层 {len(states):6d} 个状态: <γ> = {mean_gamma:.4f}, <V(γ, μ={mu})> = {v:.6f}")
+
+    states = no11_states(27)
+    sample = sampled_hamming(states, 10**6)
+    print(f"\n第27层 {len(states)} 个状态，抽样 10^6 对: <γ> ≈ {sample.mean():.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+验证脚本中反复出现的计算内核的基准测试，按提交记录历史并检测退化
+
+每个内核有一组问题规模；setup(size) 准备输入并返回无参的计时函数。
+spectral_kernel、holographic_kernel、count_binary_triangles、brute_force_patterns 按第045、026、058、016章
+验证脚本中的写法复制（这些脚本在导入时就运行，不能直接 import）。
+
+计时取 REPEATS 轮，每轮循环次数自动调整到至少 MIN_TIME 秒，记录每次调用的最短与中位时间。
+历史是一个 JSON 文件，键为 git 提交（工作区有改动时加 "-dirty"）：
+
+    python3 scripts/kernel_bench.py run                      # 全部内核、全部规模
+    python3 scripts/kernel_bench.py run -k zeta --sizes 1    # 只跑 zeta，每个内核最小的规模
+    python3 scripts/kernel_bench.py compare                  # 最近两次记录
+    python3 scripts/kernel_bench.py compare abc123 HEAD --threshold 0.15
+
+compare 以最短时间之比判断：慢于 1 + threshold 的条目标为退化，存在退化时退出码为 1。
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections import namedtuple
+from pathlib import Path
+
+import numpy as np
+
+from result_cache import CACHE_DIR, REPO_ROOT, environment_fingerprint
+
+PHI = (1 + 5 ** 0.5) / 2
+HISTORY_PATH = CACHE_DIR / "kernel_bench.json"
+REPEATS = 5
+MIN_TIME = 0.05
+DEFAULT_THRESHOLD = 0.10
+
+Kernel = namedtuple('Kernel', 'name sizes setup description')
+Timing = namedtuple('Timing', 'best median loops repeats')
+
+
+def _fibonacci(n):
+    from fibonacci_engine import fibonacci, fibonacci_pair
+
+    def run():
+        fibonacci_pair.cache_clear()
+        return fibonacci(n)
+    return run
+
+
+def _no11(n):
+    from golden_states import no11_states
+    return lambda: no11_states(n)
+
+
+def _brute_force(n):
+    # 第016章：逐个格式化 2**n 个位串并过滤含 "11" 的
+    def run():
+        return [format(i, f'0{n}b') for i in range(2 ** n) if '11' not in format(i, f'0{n}b')]
+    return run
+
+
+def _zeckendorf(n):
+    from zeckendorf_codec import zeckendorf_encode
+    values = np.arange(n, dtype=np.int64)
+    return lambda: zeckendorf_encode(values)
+
+
+def _zeta_sum(n):
+    from zeta_engine import partial_sum
+    s = 0.5 + 1j * np.linspace(10.0, 50.0, 64)
+    return lambda: partial_sum(s, 1, n)
+
+
+def spectral_kernel(z, w, t, eigenvals):
+    """第045章：K(z,w;t) = Σ e^(-λt)/((z-λ)(w-λ))"""
+    result = 0
+    for lam in eigenvals:
+        if abs(z - lam) > 1e-10 and abs(w - lam) > 1e-10:
+            result += np.exp(-lam * t) / ((z - lam) * (w - lam))
+    return result
+
+
+def _spectral(n):
+    eigenvals = PHI ** -np.arange(n, dtype=np.float64)
+    points = np.linspace(0.05, 2.5, 32) + 0.1j
+
+    def run():
+        return [spectral_kernel(z, w, 1.0, eigenvals) for z in points[:8] for w in points]
+    return run
+
+
+def holographic_kernel(i, j, k, phi):
+    """第026章的黄金全息核"""
+    return np.exp(-abs(i - k) / (phi * (abs(j) + 1)))
+
+
+def _holographic(n):
+    def run():
+        kernel = np.zeros((n, n, n))
+        for i in range(n):
+            for j in range(n):
+                for k in range(n):
+                    kernel[i, j, k] = holographic_kernel(i, j, k, PHI)
+        return kernel
+    return run
+
+
+def _triangles(r_max):
+    # 第058章：边权来自 E_r = E_P φ^(-r) 的归一化内积
+    def inner(r1, r2):
+        return PHI ** (-r1) * PHI ** (-r2)
+
+    def edge(r1, r2):
+        return inner(r1, r2) / (math.sqrt(inner(r1, r1)) * math.sqrt(inner(r2, r2)))
+
+    def count_binary_triangles():
+        triangles = possible = 0
+        for r1 in range(r_max):
+            for r2 in range(r1 + 1, r_max):
+                for r3 in range(r2 + 1, r_max):
+                    possible += 1
+                    if edge(r1, r2) * edge(r2, r3) * edge(r1, r3) > 0.5:
+                        triangles += 1
+        return triangles, possible
+    return count_binary_triangles
+
+
+def _quad(n):
+    from scipy import integrate
+    # 第055章：φ^(-r) 乘高斯窗在 [0, r_max] 上的积分，扫描窗口中心
+    centers = np.linspace(5.0, 30.0, n)
+
+    def run():
+        return [integrate.quad(lambda r, c=c: PHI ** (-r) * math.exp(-(r - c) ** 2 / 8.0), 0, 40)[0]
+                for c in centers]
+    return run
+
+
+def _eigen(m):
+    from operator_zeta import golden_collapse_operator
+    matrix = golden_collapse_operator(m)
+    return lambda: np.linalg.eigh(matrix)
+
+
+KERNELS = (
+    Kernel('fibonacci', (10 ** 4, 10 ** 5, 10 ** 6), _fibonacci, "精确 F_n（清空倍增缓存）"),
+    Kernel('no11', (16, 20, 24), _no11, "n 位无连续1状态枚举"),
+    Kernel('brute_force_patterns', (10, 14, 18), _brute_force, "2**n 位串穷举过滤"),
+    Kernel('zeckendorf', (10 ** 4, 10 ** 5, 10 ** 6), _zeckendorf, "0..N-1 的 Zeckendorf 编码"),
+    Kernel('zeta_sum', (10 ** 3, 10 ** 4, 10 ** 5), _zeta_sum, "64 个 s 上的 Σ n^(-s)，N 项"),
+    Kernel('spectral_kernel', (8, 64, 512), _spectral, "256 个 (z,w) 点，n 个特征值"),
+    Kernel('holographic_kernel', (8, 16, 32), _holographic, "n³ 全息核张量"),
+    Kernel('count_binary_triangles', (10, 20, 40), _triangles, "O(r³) 三角形计数"),
+    Kernel('quad', (10, 100, 1000), _quad, "n 次 scipy quad"),
+    Kernel('eigen', (64, 256, 512), _eigen, "m×m 塌缩张量 eigh"),
+)
+
+
+def measure(func, repeats=REPEATS, min_time=MIN_TIME):
+    """每次调用的最短/中位时间；循环次数翻倍直到一轮不少于 min_time"""
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or loops >= 1 << 20:
+            break
+        loops *= 2
+    samples = [elapsed / loops]
+    for _ in range(repeats - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        samples.append((time.perf_counter() - start) / loops)
+    return Timing(min(samples), statistics.median(samples), loops, repeats)
+
+
+def run_benchmarks(kernels=KERNELS, max_sizes=None, repeats=REPEATS, on_result=None):
+    """运行内核，返回 {"名字[规模]": Timing 字典}"""
+    results = {}
+    for kernel in kernels:
+        for size in kernel.sizes[:max_sizes]:
+            timing = measure(kernel.setup(size), repeats)
+            key = f"{kernel.name}[{size}]"
+            results[key] = timing._asdict()
+            if on_result:
+                on_result(key, timing)
+    return results
+
+
+def current_commit():
+    """HEAD 的提交号，跟踪文件有改动时加 -dirty；不在 git 仓库中返回 'unknown'"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short=12', 'HEAD'], cwd=REPO_ROOT,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(['git', 'diff', '--quiet', 'HEAD', '--'], cwd=REPO_ROOT).returncode != 0
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+    return commit + '-dirty' if dirty else commit
+
+
+def load_history(path=HISTORY_PATH):
+    """读取历史（按插入顺序）；文件不存在时为空"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save_history(history, path=HISTORY_PATH):
+    """写入历史（临时文件 + 改名）"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(history, f, ensure_ascii=False, indent=1)
+    os.replace(tmp, path)
+
+
+def record_run(results, commit=None, path=HISTORY_PATH):
+    """把一次运行并入该提交的记录（同一提交重复运行时按条目覆盖）"""
+    history = load_history(path)
+    commit = commit or current_commit()
+    entry = history.pop(commit, {'results': {}})
+    entry['results'].update(results)
+    entry['date'] = time.strftime('%Y-%m-%dT%H:%M:%S%z')
+    entry['machine'] = platform.node()
+    entry['environment'] = environment_fingerprint()
+    history[commit] = entry
+    save_history(history, path)
+    return commit
+
+
+def resolve_commit(history, ref):
+    """历史中与 ref 匹配的键：完整键、提交号前缀，或 git 可解析的引用"""
+    if ref in history:
+        return ref
+    candidates = [key for key in history if key.startswith(ref)]
+    if not candidates:
+        try:
+            sha = subprocess.run(['git', 'rev-parse', ref], cwd=REPO_ROOT, capture_output=True,
+                                 text=True, check=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            sha = None
+        candidates = [key for key in history if sha and sha.startswith(key.split('-')[0])]
+    if not candidates:
+        raise KeyError(f"no benchmark history for {ref!r}")
+    # 同一提交既有干净记录又有 -dirty 记录时取最后写入的
+    return candidates[-1]
+
+
+def compare(base, head, threshold=DEFAULT_THRESHOLD):
+    """
+    比较两条记录的 results，返回 [(键, 旧最短, 新最短, 比值, 是否退化)]，按比值降序
+
+    只比较两边都有的条目。
+    """
+    rows = []
+    for key in base.keys() & head.keys():
+        old, new = base[key]['best'], head[key]['best']
+        ratio = new / old if old > 0 else float('inf')
+        rows.append((key, old, new, ratio, ratio > 1 + threshold))
+    return sorted(rows, key=lambda row: -row[3])
+
+
+def _format_time(seconds):
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('µs', 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:7.2f} {unit}"
+    return f"{seconds / 1e-9:7.1f} ns"
+
+
+def main(argv=None):
+    """命令行：run / compare / list"""
+    parser = argparse.ArgumentParser(description="计算内核基准测试")
+    parser.add_argument('--history', default=HISTORY_PATH, help="历史文件（默认在缓存目录）")
+    sub = parser.add_subparsers(dest='command', required=True)
+    run = sub.add_parser('run', help="运行基准并写入当前提交的记录")
+    run.add_argument('-k', dest='keyword', help="只运行名字中含此子串的内核")
+    run.add_argument('--sizes', type=int, help="每个内核只运行最小的前几个规模")
+    run.add_argument('--repeats', type=int, default=REPEATS)
+    run.add_argument('--no-record', action='store_true', help="只打印，不写历史")
+    cmp_ = sub.add_parser('compare', help="比较两次记录（默认最近两次）")
+    cmp_.add_argument('base', nargs='?')
+    cmp_.add_argument('head', nargs='?')
+    cmp_.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                      help="噪声阈值：最短时间变慢超过该比例才算退化")
+    sub.add_parser('list', help="列出历史中的记录")
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        kernels = [k for k in KERNELS if not args.keyword or args.keyword in k.name]
+        print(f"内核基准（Python {platform.python_version()}，NumPy {np.__version__}）")
+        print("=" * 60)
+
+        def show(key, timing):
+            print(f"{key:32s} {_format_time(timing.best)}  中位 {_format_time(timing.median)}"
+                  f"  ×{timing.loops}", flush=True)
+        results = run_benchmarks(kernels, args.sizes, args.repeats, on_result=show)
+        if not args.no_record:
+            commit = record_run(results, path=args.history)
+            print(f"\n已记录到 {args.history} [{commit}]")
+        return 0
+
+    history = load_history(args.history)
+    if args.command == 'list':
+        for commit, entry in history.items():
+            print(f"{commit:20s} {entry['date']}  {len(entry['results'])} 项  {entry.get('machine', '')}")
+        return 0
+
+    if args.base is None:
+        if len(history) < 2:
+            print("历史中不足两次记录", file=sys.stderr)
+            return 2
+        base_key, head_key = list(history)[-2:]
+    else:
+        try:
+            base_key = resolve_commit(history, args.base)
+            head_key = resolve_commit(history, args.head) if args.head else list(history)[-1]
+        except KeyError as exc:
+            print(exc.args[0], file=sys.stderr)
+            return 2
+    rows = compare(history[base_key]['results'], history[head_key]['results'], args.threshold)
+    print(f"{base_key} → {head_key}（阈值 {args.threshold:.0%}）")
+    for key, old, new, ratio, slower in rows:
+        mark = "退化" if slower else ("加速" if ratio < 1 / (1 + args.threshold) else "    ")
+        print(f"{mark}  {key:32s} {_format_time(old)} → {_format_time(new)}  ×{ratio:.3f}")
+    regressions = sum(1 for row in rows if row[4])
+    print(f"比较 {len(rows)} 项，退化 {regressions} 项")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
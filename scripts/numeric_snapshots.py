@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+数值结论快照：按名字记录验证脚本推出的数值，并在两次运行之间快速比较
+
+脚本中调用 record("alpha_inv", alpha_inv) 即可；只有设置了环境变量
+PSI_SNAPSHOT_DIR（verify_runner --snapshot DIR 会设置）时才真正记录，否则为空操作。
+进程退出时每个脚本写一个 .npz（names: 字符串数组，values: float64 数组），
+文件名由脚本在仓库内的路径得到。复数拆成 name.re / name.im，数组展开成 name[i]。
+
+一次运行就是一个目录。比较时把两个目录的全部条目读成按键排序的数组，
+用 np.intersect1d 对齐后向量化判断漂移，上万个数值也只需几毫秒。
+
+    python3 scripts/verify_runner.py --snapshot runs/before
+    python3 scripts/verify_runner.py --snapshot runs/after
+    python3 scripts/numeric_snapshots.py diff runs/before runs/after --rtol 1e-9
+"""
+
+import argparse
+import atexit
+import os
+import sys
+import time
+from collections import namedtuple
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+ENV_VAR = "PSI_SNAPSHOT_DIR"
+KEY_SEPARATOR = "::"
+
+SnapshotDiff = namedtuple('SnapshotDiff', 'drifted added removed compared')
+
+_values = {}
+_directory = None
+
+
+def enable(directory):
+    """开始记录，退出时写入 directory（通常由环境变量自动开启）"""
+    global _directory
+    _directory = Path(directory)
+
+
+def enabled():
+    """当前是否在记录"""
+    return _directory is not None
+
+
+def record(name, value):
+    """记录一个命名数值（标量、复数或数组）；未开启时直接返回"""
+    if _directory is None:
+        return
+    array = np.asarray(value)
+    if array.ndim == 0:
+        items = [(name, array[()])]
+    else:
+        items = [(f"{name}[{i}]", v) for i, v in enumerate(array.ravel().tolist())]
+    for key, v in items:
+        if np.iscomplexobj(v):
+            _values[f"{key}.re"] = float(np.real(v))
+            _values[f"{key}.im"] = float(np.imag(v))
+        else:
+            _values[key] = float(v)
+
+
+def _script_label():
+    """当前脚本的标识：仓库内相对路径（去掉 .py）"""
+    script = Path(sys.argv[0] or 'interactive').resolve()
+    try:
+        label = str(script.relative_to(REPO_ROOT))
+    except ValueError:
+        label = script.name
+    return label[:-3] if label.endswith('.py') else label
+
+
+def flush():
+    """把已记录的数值写入 npz（没有记录时不写文件）；可重复调用"""
+    if _directory is None or not _values:
+        return None
+    label = _script_label()
+    _directory.mkdir(parents=True, exist_ok=True)
+    path = _directory / (label.replace(os.sep, '__') + '.npz')
+    tmp = path.with_suffix(f".{os.getpid()}.tmp.npz")
+    names = np.array(list(_values), dtype=str)
+    values = np.array(list(_values.values()), dtype=np.float64)
+    np.savez(tmp, names=names, values=values, script=np.array(label))
+    os.replace(tmp, path)
+    return path
+
+
+def load_run(directory):
+    """读取一次运行的全部快照，返回按键排序的 (键数组, 值数组)；键为 "脚本::名字" """
+    keys, values = [], []
+    for path in sorted(Path(directory).glob("*.npz")):
+        with np.load(path) as data:
+            script = str(data['script'])
+            keys.append(np.char.add(script + KEY_SEPARATOR, data['names']))
+            values.append(data['values'])
+    if not keys:
+        return np.array([], dtype=str), np.array([], dtype=np.float64)
+    keys = np.concatenate(keys)
+    values = np.concatenate(values)
+    order = np.argsort(keys, kind='stable')
+    return keys[order], values[order]
+
+
+def diff_runs(before, after, rtol=1e-9, atol=0.0):
+    """
+    比较两次运行，返回 SnapshotDiff
+
+    drifted 为 (键, 旧值, 新值) 列表（超出 rtol/atol，nan 与 nan 视为相同），
+    added/removed 为只在一侧出现的键。
+    """
+    keys_a, values_a = load_run(before)
+    keys_b, values_b = load_run(after)
+    common, ia, ib = np.intersect1d(keys_a, keys_b, assume_unique=True, return_indices=True)
+    old, new = values_a[ia], values_b[ib]
+    same = np.isclose(new, old, rtol=rtol, atol=atol, equal_nan=True)
+    drift = np.flatnonzero(~same)
+    return SnapshotDiff(
+        drifted=[(str(common[i]), float(old[i]), float(new[i])) for i in drift],
+        added=np.setdiff1d(keys_b, keys_a, assume_unique=True).tolist(),
+        removed=np.setdiff1d(keys_a, keys_b, assume_unique=True).tolist(),
+        compared=len(common),
+    )
+
+
+if os.environ.get(ENV_VAR):
+    enable(os.environ[ENV_VAR])
+    atexit.register(flush)
+
+
+def main(argv=None):
+    """命令行：show RUN 或 diff BEFORE AFTER"""
+    parser = argparse.ArgumentParser(description="数值结论快照")
+    sub = parser.add_subparsers(dest='command', required=True)
+    show = sub.add_parser('show', help="列出一次运行记录的数值")
+    show.add_argument('run')
+    show.add_argument('-k', dest='keyword', help="只显示键中含此子串的条目")
+    diff = sub.add_parser('diff', help="比较两次运行")
+    diff.add_argument('before')
+    diff.add_argument('after')
+    diff.add_argument('--rtol', type=float, default=1e-9)
+    diff.add_argument('--atol', type=float, default=0.0)
+    args = parser.parse_args(argv)
+
+    if args.command == 'show':
+        keys, values = load_run(args.run)
+        for key, value in zip(keys, values):
+            if not args.keyword or args.keyword in key:
+                print(f"{value:+.15g}  {key}")
+        return 0
+
+    start = time.perf_counter()
+    result = diff_runs(args.before, args.after, args.rtol, args.atol)
+    elapsed = time.perf_counter() - start
+    for key, old, new in result.drifted:
+        rel = abs(new - old) / abs(old) if old else float('inf')
+        print(f"漂移  {key}: {old:.15g} → {new:.15g}  (相对 {rel:.2e})")
+    for key in result.added:
+        print(f"新增  {key}")
+    for key in result.removed:
+        print(f"移除  {key}")
+    print(f"比较 {result.compared} 个数值，漂移 {len(result.drifted)}，新增 {len(result.added)}，"
+          f"移除 {len(result.removed)}，用时 {elapsed * 1000:.1f} ms")
+    return 1 if result.drifted or result.removed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
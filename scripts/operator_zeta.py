@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+算子 ζ 函数 ζ(sÔ) = Σ n^(-sÔ) = Σ exp(-s Ô log n)
+
+对可对角化的 Ô = V Λ V⁻¹，逐项作用后 ζ(sÔ) = V diag(ζ(sλ_k)) V⁻¹，
+标量部分交给 zeta_engine（Euler–Maclaurin，对整叠矩阵的全部特征值一次求值）。
+Hermite 矩阵用 eigh，V⁻¹ = V^H，结果仍为 Hermite；一般矩阵用 eig。
+
+特征分解按矩阵内容的哈希缓存：同一个算子在不同 s 下反复求值时只分解一次。
+输入可以是单个 (m, m) 矩阵，也可以是形状 (..., m, m) 的一叠矩阵。
+"""
+
+import hashlib
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+
+from zeta_engine import zeta
+
+CACHE_SIZE = 256
+MAX_CONDITION = 1e12
+
+Eigensystem = namedtuple('Eigensystem', 'values vectors inverse hermitian')
+
+_cache = OrderedDict()
+
+
+def _matrix_key(matrices, hermitian):
+    """缓存键：形状、dtype 与内容的 SHA-1"""
+    digest = hashlib.sha1(np.ascontiguousarray(matrices).tobytes()).hexdigest()
+    return matrices.shape, matrices.dtype.str, hermitian, digest
+
+
+def _as_stack(matrices):
+    """检查输入为 (..., m, m) 的方阵（叠）"""
+    matrices = np.asarray(matrices)
+    if matrices.ndim < 2 or matrices.shape[-1] != matrices.shape[-2]:
+        raise ValueError(f"Operator must be a square matrix or a stack of them, got shape {matrices.shape}")
+    if not np.issubdtype(matrices.dtype, np.number) or np.issubdtype(matrices.dtype, np.integer):
+        matrices = matrices.astype(np.float64)
+    return matrices
+
+
+def is_hermitian(matrices, tol=1e-12):
+    """整叠矩阵是否都满足 A = A^H"""
+    matrices = np.asarray(matrices)
+    return bool(np.allclose(matrices, np.conj(np.swapaxes(matrices, -1, -2)), rtol=0, atol=tol))
+
+
+def eigensystem(matrices, hermitian=None):
+    """
+    带缓存的特征分解，返回 Eigensystem(values, vectors, inverse, hermitian)
+
+    hermitian=None 时自动判断。一般矩阵的特征向量矩阵条件数超过
+    MAX_CONDITION 时视为不可对角化，抛出 ValueError。
+    """
+    matrices = _as_stack(matrices)
+    if hermitian is None:
+        hermitian = is_hermitian(matrices)
+    key = _matrix_key(matrices, hermitian)
+    if key in _cache:
+        _cache.move_to_end(key)
+        return _cache[key]
+
+    if hermitian:
+        values, vectors = np.linalg.eigh(matrices)
+        inverse = np.conj(np.swapaxes(vectors, -1, -2))
+    else:
+        values, vectors = np.linalg.eig(matrices)
+        condition = np.linalg.cond(vectors)
+        if np.any(~np.isfinite(condition) | (condition > MAX_CONDITION)):
+            raise ValueError(f"Operator is not diagonalizable (eigenvector condition number {np.max(condition):.2e})")
+        inverse = np.linalg.inv(vectors)
+
+    system = Eigensystem(values, vectors, inverse, hermitian)
+    _cache[key] = system
+    if len(_cache) > CACHE_SIZE:
+        _cache.popitem(last=False)
+    return system
+
+
+def clear_cache():
+    """清空特征分解缓存"""
+    _cache.clear()
+
+
+def operator_zeta(matrices, s=1.0, hermitian=None):
+    """
+    ζ(sÔ)，matrices 为 (m, m) 或 (..., m, m)，s 为标量
+
+    实对称输入且 s 为实数时返回实矩阵，否则返回复矩阵。
+    特征值满足 sλ = 1 时对应分量为 inf（ζ 的极点）。
+    """
+    matrices = _as_stack(matrices)
+    system = eigensystem(matrices, hermitian)
+    spectrum = zeta(s * system.values)
+    result = (system.vectors * spectrum[..., None, :]) @ system.inverse
+    if system.hermitian and np.isrealobj(matrices) and np.isrealobj(s):
+        return result.real
+    return result
+
+
+def operator_zeta_trace(matrices, s=1.0, hermitian=None):
+    """谱迹 Tr ζ(sÔ) = Σ_k ζ(sλ_k)，每个矩阵一个值"""
+    system = eigensystem(matrices, hermitian)
+    return zeta(s * system.values).sum(axis=-1)
+
+
+def golden_collapse_operator(m):
+    """第033章的黄金权重塌缩张量 C_ij = φ^(-|i-j|)"""
+    phi = (1 + 5 ** 0.5) / 2
+    index = np.arange(m)
+    return phi ** -np.abs(index[:, None] - index[None, :]).astype(np.float64)
+
+
+def main():
+    """主函数：与逐项求和比较，并对一叠塌缩张量扫描 s"""
+    from scipy.linalg import expm
+
+    print("算子 ζ 函数 ζ(sÔ) = Σ n^(-sÔ)")
+    print("=" * 60)
+    rng = np.random.default_rng(0)
+    q, _ = np.linalg.qr(rng.standard_normal((4, 4)))
+    op = q @ np.diag([2.0, 2.5, 3.0, 4.0]) @ q.T
+    exact = operator_zeta(op)
+    N = 20000
+    direct = sum(expm(-op * np.log(n)) for n in range(1, N))
+    # 逐项求和的尾部 ≈ N^(1-λ)/(λ-1)，最小特征值 2 时约 1/N
+    print(f"随机 Hermite 4×4，与前 {N} 项直接求和之差: {np.abs(exact - direct).max():.2e}"
+          f"（截断误差约 {1 / N:.1e}）")
+
+    stack = np.stack([golden_collapse_operator(8) * c for c in (2.0, 3.0, 4.0)])
+    for s in (1.0, 1.5, 2.0):
+        traces = operator_zeta_trace(stack, s)
+        print(f"s = {s}: Tr ζ(s·cC_8), c = 2, 3, 4 → " + ", ".join(f"{t:.6f}" for t in traces))
+    print(f"缓存中的特征分解: {len(_cache)} 个")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+受约束二进制模式的转移矩阵计数引擎
+
+把禁止模式集合编译成 Aho–Corasick 自动机：状态是“尚未出现禁止模式的
+最长有效后缀”，每读入一个符号沿 goto/fail 边转移，落入禁止模式即丢弃。
+长度为n的合法串个数 = 起始行向量 · T^n · 全1列向量，
+T 用平方求幂，矩阵元是 Python 整数（精确大整数）或任意可乘加的权重。
+
+例: 禁止 '11' 时自动机只有 '' 和 '1' 两个状态，T = [[1,1],[1,0]]，
+计数即 F_{n+2}。
+"""
+
+from collections import deque
+
+
+class PatternAutomaton:
+    """禁止模式集合对应的确定有限自动机"""
+
+    def __init__(self, forbidden=('11',), alphabet='01'):
+        self.alphabet = tuple(alphabet)
+        self.forbidden = tuple(forbidden)
+        if not self.forbidden or any(not p for p in self.forbidden):
+            raise ValueError("禁止模式不能为空串")
+        for pattern in self.forbidden:
+            if any(ch not in self.alphabet for ch in pattern):
+                raise ValueError(f"模式 {pattern!r} 含有字母表之外的符号")
+        self._build()
+
+    def _build(self):
+        """构建 trie、失配链接，并把转移补全为 DFA"""
+        goto = [{}]
+        dead = [False]
+        for pattern in self.forbidden:
+            node = 0
+            for ch in pattern:
+                if ch not in goto[node]:
+                    goto.append({})
+                    dead.append(False)
+                    goto[node][ch] = len(goto) - 1
+                node = goto[node][ch]
+            dead[node] = True
+
+        fail = [0] * len(goto)
+        delta = [dict() for _ in goto]
+        queue = deque()
+        for ch in self.alphabet:
+            child = goto[0].get(ch)
+            if child is None:
+                delta[0][ch] = 0
+            else:
+                delta[0][ch] = child
+                queue.append(child)
+        while queue:
+            node = queue.popleft()
+            dead[node] = dead[node] or dead[fail[node]]
+            for ch in self.alphabet:
+                child = goto[node].get(ch)
+                if child is None:
+                    delta[node][ch] = delta[fail[node]][ch]
+                else:
+                    fail[child] = delta[fail[node]][ch]
+                    delta[node][ch] = child
+                    queue.append(child)
+
+        # 只保留活状态，重新编号；起始状态为0
+        alive = [i for i in range(len(goto)) if not dead[i]]
+        index = {old: new for new, old in enumerate(alive)}
+        self.n_states = len(alive)
+        self.transitions = [
+            {ch: index[delta[old][ch]] for ch in self.alphabet if not dead[delta[old][ch]]}
+            for old in alive
+        ]
+
+    def transfer_matrix(self, weights=None):
+        """
+        转移矩阵 T[i][j] = Σ 从状态i读一个符号到j的权重
+
+        weights 为 {符号: 权重}，缺省每个符号权重为1（纯计数）。
+        """
+        weights = weights or {}
+        zero = 0 * next(iter(weights.values()), 1)
+        matrix = [[zero] * self.n_states for _ in range(self.n_states)]
+        for i, row in enumerate(self.transitions):
+            for ch, j in row.items():
+                matrix[i][j] = matrix[i][j] + weights.get(ch, 1)
+        return matrix
+
+    def count(self, n, weights=None):
+        """长度为n的合法串的（加权）个数"""
+        if n < 0:
+            raise ValueError(f"长度必须非负: n={n}")
+        matrix = self.transfer_matrix(weights)
+        row = [0] * self.n_states
+        row[0] = 1
+        # 行向量 · T^n：按二进制位平方求幂，向量只与当前幂相乘
+        while n:
+            if n & 1:
+                row = _vec_mat(row, matrix)
+            n >>= 1
+            if n:
+                matrix = _mat_mat(matrix, matrix)
+        return sum(row)
+
+    def counts(self, n_max, weights=None):
+        """长度 0..n_max 的全部计数，逐步递推"""
+        matrix = self.transfer_matrix(weights)
+        row = [0] * self.n_states
+        row[0] = 1
+        result = [sum(row)]
+        for _ in range(n_max):
+            row = _vec_mat(row, matrix)
+            result.append(sum(row))
+        return result
+
+
+def _vec_mat(row, matrix):
+    """行向量乘矩阵"""
+    size = len(matrix)
+    out = [0] * size
+    for i, a in enumerate(row):
+        if a:
+            mrow = matrix[i]
+            for j in range(size):
+                out[j] += a * mrow[j]
+    return out
+
+
+def _mat_mat(left, right):
+    """方阵乘法"""
+    return [_vec_mat(row, right) for row in left]
+
+
+def count_avoiding(n, forbidden=('11',), alphabet='01', weights=None):
+    """长度为n、不含任何禁止模式的串的个数"""
+    return PatternAutomaton(forbidden, alphabet).count(n, weights)
+
+
+def main():
+    """主函数：no-11 计数与其他约束族"""
+    print("转移矩阵计数引擎")
+    print("=" * 60)
+    no11 = PatternAutomaton(('11',))
+    print(f"禁止 '11': {no11.n_states} 个状态，T = {no11.transfer_matrix()}")
+    print(f"n = 0..10: {no11.counts(10)}")
+
+    a, b = 1, 2
+    for _ in range(5000):
+        a, b = b, a + b
+    assert no11.count(5000) == a
+    print(f"n = 5000: {len(str(a))} 位整数 = F_5002 ✅")
+
+    for forbidden in (('111',), ('101',), ('11', '000')):
+        counts = PatternAutomaton(forbidden).counts(10)
+        print(f"禁止 {forbidden}: {counts}")
+
+    phi = (1 + 5 ** 0.5) / 2
+    weighted = no11.count(7, weights={'0': 1.0, '1': 1 / phi})
+    print(f"\n第7层按 φ^(-#1) 加权: {weighted:.6f}")
+
+
+if __name__ == "__main__":
+    main()
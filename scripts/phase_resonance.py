@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+黄金角共振的相位对计数
+
+判据与 visualize_binary_states.py 的双重循环相同：对每一对相位，
+差值 d = |θ_j - θ_i| 满足 |d - π/φ| < tol 或 |2π - d - π/φ| < tol 即计为共振。
+相位排序一次后，对每个 θ_i 用 searchsorted 求落在 (θ_i + lo, θ_i + hi)
+窗口内的 θ_j 个数，总复杂度 O(N log N)。
+
+直方图模式用 FFT 计算循环自相关，得到全部相位差的分布。
+"""
+
+import sys
+
+import numpy as np
+
+from golden_states import no11_states, states_to_phases
+
+PHI = (1 + 5 ** 0.5) / 2
+GOLDEN_ANGLE = np.pi / PHI
+TWO_PI = 2 * np.pi
+
+
+def _windows(angle, tolerance):
+    """差值 d ∈ [0, 2π) 的共振区间（已合并重叠部分）"""
+    windows = sorted([
+        (angle - tolerance, angle + tolerance),
+        (TWO_PI - angle - tolerance, TWO_PI - angle + tolerance),
+    ])
+    merged = [windows[0]]
+    for lo, hi in windows[1:]:
+        if lo < merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], hi))
+        else:
+            merged.append((lo, hi))
+    return merged
+
+
+def count_resonant_pairs(phases, angle=GOLDEN_ANGLE, tolerance=0.1, assume_sorted=False):
+    """满足共振判据的无序相位对个数"""
+    phases = np.asarray(phases, dtype=np.float64)
+    if not assume_sorted:
+        phases = np.sort(phases)
+    index = np.arange(len(phases))
+    total = 0
+    for lo, hi in _windows(angle, tolerance):
+        # 开区间 (θ_i + lo, θ_i + hi)，且只数 j > i
+        left = np.searchsorted(phases, phases + lo, side='right')
+        right = np.searchsorted(phases, phases + hi, side='left')
+        left = np.maximum(left, index + 1)
+        total += int(np.maximum(right - left, 0).sum())
+    return total
+
+
+def resonance_fraction(phases, angle=GOLDEN_ANGLE, tolerance=0.1, assume_sorted=False):
+    """返回 (共振对数, 总对数, 比例)"""
+    n = len(phases)
+    total_pairs = n * (n - 1) // 2
+    resonant = count_resonant_pairs(phases, angle, tolerance, assume_sorted)
+    return resonant, total_pairs, resonant / total_pairs if total_pairs else 0.0
+
+
+def layer_resonance_fraction(n, angle=GOLDEN_ANGLE, tolerance=0.1):
+    """第n层全部无连续1状态的共振比例（状态升序，相位天然有序）"""
+    phases = states_to_phases(no11_states(n), n)
+    return resonance_fraction(phases, angle, tolerance, assume_sorted=True)
+
+
+def phase_difference_histogram(phases, bins=4096):
+    """
+    全部有序相位对 (i ≠ j) 的循环相位差直方图
+
+    把相位分到 bins 个格子，循环自相关 irfft(|rfft(h)|²) 的第l项
+    就是格差为l的有序对个数。返回 (格子下沿, 个数)；第l格与第 bins-l 格对称，
+    无序对在两格各出现一次。
+    """
+    phases = np.mod(np.asarray(phases, dtype=np.float64), TWO_PI)
+    cells = np.minimum((phases / TWO_PI * bins).astype(np.int64), bins - 1)
+    hist = np.bincount(cells, minlength=bins).astype(np.float64)
+    spectrum = np.fft.rfft(hist)
+    counts = np.rint(np.fft.irfft(spectrum * np.conj(spectrum), n=bins)).astype(np.int64)
+    counts[0] -= len(phases)  # 去掉 i = j 的自配对
+    return np.arange(bins) * (TWO_PI / bins), counts
+
+
+def main():
+    """主函数：第20层起的共振比例扫描"""
+    print("黄金角共振相位对计数")
+    print("=" * 60)
+    print(f"π/φ = {GOLDEN_ANGLE:.4f} rad，容差 ±0.1 rad")
+    last = int(sys.argv[1]) if len(sys.argv) > 1 else 26
+    for n in [7] + list(range(20, last + 1)):
+        resonant, total, fraction = layer_resonance_fraction(n)
+        print(f"第{n:2d}层: {total:>16d} 对中 {resonant:>16d} 对共振，比例 {fraction:.6f}")
+
+
+if __name__ == "__main__":
+    main()
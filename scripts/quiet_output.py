@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+批量运行时的静默/压缩日志输出
+
+psi-structum 的 _strict/_corrected 脚本在模块级打印数百行（含 emoji 与制表符），
+批量运行时逐行编码与写出占了不少时间。设置环境变量后，脚本的 sys.stdout 被替换：
+
+    PSI_QUIET=1        丢弃 stdout（print 不编码、不写出）
+    PSI_LOG_DIR=DIR    stdout 写入 DIR/<仓库内路径>.log.gz（缓冲，gzip 压缩，只在退出时落盘）
+
+stderr 保持不变，断言失败与 AssertionError 的回溯、unittest 的报告照常输出，退出码不受影响。
+
+脚本本身不需要修改：verify_runner --quiet / --log-dir 通过本模块启动脚本
+（冷启动），或在 warm_pool 的子进程中调用 install()（预热模式）。
+本模块同时是冷启动的批量启动器：设置了 PSI_SEED 或 PSI_LIMITS 时也经由它运行，
+以便先设定种子（见 seeding）与资源上限（见 sandbox）。
+
+    python3 scripts/quiet_output.py path/to/verify_xxx.py
+    zcat DIR/docs__psi-structum__...__verify_chapter_026_strict.log.gz | less
+"""
+
+import atexit
+import gzip
+import io
+import os
+import runpy
+import sys
+import traceback
+from pathlib import Path
+
+import sandbox
+import seeding
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+QUIET_VAR = "PSI_QUIET"
+LOG_VAR = "PSI_LOG_DIR"
+COMPRESS_LEVEL = 6
+
+_installed = None
+
+
+class NullWriter(io.TextIOBase):
+    """丢弃一切写入的文本流"""
+
+    encoding = 'utf-8'
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        return len(text)
+
+
+class GzipLog(io.TextIOBase):
+    """写入 gzip 文件的文本流；flush() 不落盘（print(flush=True) 不会触发压缩块），close() 才写出"""
+
+    encoding = 'utf-8'
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._raw = gzip.open(self.path, 'wt', encoding='utf-8', errors='backslashreplace',
+                              compresslevel=COMPRESS_LEVEL)
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        return self._raw.write(text)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        if not self._raw.closed:
+            self._raw.close()
+        super().close()
+
+
+def active(env=None):
+    """env（默认 os.environ）是否要求静默或写日志"""
+    env = os.environ if env is None else env
+    return bool(env.get(LOG_VAR)) or env.get(QUIET_VAR, '') not in ('', '0')
+
+
+def log_path(script, directory):
+    """脚本的日志文件：仓库内相对路径中的目录分隔符换成 __"""
+    script = Path(script).resolve()
+    try:
+        label = str(script.relative_to(REPO_ROOT).with_suffix(''))
+    except ValueError:
+        label = script.stem
+    return Path(directory) / (label.replace(os.sep, '__') + '.log.gz')
+
+
+def install(script=None, env=None):
+    """
+    按环境变量替换 sys.stdout，返回新的流（未启用时返回 None）
+
+    script 决定日志文件名（默认 sys.argv[0]）。日志在 close() 或进程正常退出时写出。
+    """
+    global _installed
+    env = os.environ if env is None else env
+    if not active(env):
+        return None
+    if env.get(LOG_VAR):
+        stream = GzipLog(log_path(script or sys.argv[0], env[LOG_VAR]))
+    else:
+        stream = NullWriter()
+    sys.stdout = stream
+    _installed = stream
+    atexit.register(close)
+    return stream
+
+
+def close():
+    """写出并关闭已安装的日志（os._exit 之前需要显式调用）"""
+    global _installed
+    if _installed is not None:
+        _installed.close()
+        _installed = None
+
+
+def run(script):
+    """安装输出替换（并按环境变量设定种子与资源上限）后以 __main__ 运行脚本，行为与 python script 相同"""
+    script = Path(script).resolve()
+    sys.argv = [str(script)] + sys.argv[2:]
+    sys.path[0] = str(script.parent)
+    install(script)
+    seeding.seed_script(script)
+    limits = sandbox.limits_from_env()
+    if limits:
+        sandbox.apply_limits(limits)
+    try:
+        runpy.run_path(str(script), run_name='__main__')
+    except MemoryError:
+        traceback.print_exc()
+        sys.exit(sandbox.EXIT_MEMORY)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        sys.exit("usage: quiet_output.py SCRIPT [ARGS...]")
+    run(sys.argv[1])
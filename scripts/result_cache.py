@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+验证脚本结果的内容寻址缓存
+
+键是以下内容的 SHA-256：
+    脚本在仓库内的相对路径（runner 在脚本目录中运行，路径也决定了工作目录）、脚本源码、
+    Python/NumPy/SciPy 版本、影响结果的环境变量（RESULT_ENV_VARS，如 PSI_SEED），
+    以及脚本（递归）导入的本地模块源码。
+本地模块按 verify 脚本的 sys.path 顺序查找：先 scripts/（由 sys.path.insert(0, ...) 放在最前），
+再脚本目录及其上级目录（仓库内）。
+任何一项变化都会得到新键，旧条目自然失效。
+
+条目是 CACHE_DIR/results/<键前两位>/<键>.json，内容为 verify_runner 的结果字典。
+命中时更新修改时间，总大小超过上限时按修改时间从旧到新删除（近似 LRU）。
+"""
+
+import ast
+import hashlib
+import json
+import os
+import platform
+import sys
+from functools import lru_cache
+from importlib import metadata
+from pathlib import Path
+
+import seeding
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SHARED_DIR = REPO_ROOT / "scripts"
+CACHE_DIR = Path(os.environ.get("PSI_CACHE_DIR", Path.home() / ".cache" / "psi-verify"))
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# 改变脚本输出的环境变量：取值不同的运行不能共用缓存条目
+RESULT_ENV_VARS = (seeding.SEED_VAR,)
+
+
+def _version(package):
+    """已安装包的版本，不导入包本身"""
+    try:
+        return metadata.version(package)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+@lru_cache(maxsize=1)
+def environment_fingerprint():
+    """影响结果的解释器与数值库版本"""
+    return {
+        'python': platform.python_version(),
+        'implementation': sys.implementation.name,
+        'numpy': _version('numpy'),
+        'scipy': _version('scipy'),
+    }
+
+
+def _imported_names(path):
+    """脚本中 import 的顶层模块名"""
+    try:
+        tree = ast.parse(Path(path).read_bytes(), filename=str(path))
+    except SyntaxError:
+        return set()
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split('.')[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            names.add(node.module.split('.')[0])
+    return names
+
+
+def _search_path(path):
+    """查找本地模块的目录：先 scripts/，再脚本目录及其在仓库内的上级目录"""
+    directories = [SHARED_DIR, path.parent]
+    directories.extend(p for p in path.parent.parents if p.is_relative_to(REPO_ROOT) and p != REPO_ROOT)
+    return list(dict.fromkeys(directories))
+
+
+def _repo_relative(path):
+    """仓库内文件用相对路径表示，其余用绝对路径"""
+    return str(path.relative_to(REPO_ROOT) if path.is_relative_to(REPO_ROOT) else path)
+
+
+def local_dependencies(path):
+    """脚本递归导入的本地模块文件（不含脚本本身），按路径排序"""
+    path = Path(path).resolve()
+    found = set()
+    pending = [path]
+    while pending:
+        current = pending.pop()
+        for name in _imported_names(current):
+            for directory in _search_path(current):
+                candidate = directory / f"{name}.py"
+                if candidate.is_file():
+                    candidate = candidate.resolve()
+                    if candidate not in found and candidate != path:
+                        found.add(candidate)
+                        pending.append(candidate)
+                    break
+    return sorted(found)
+
+
+def cache_key(path, env=None):
+    """脚本结果的内容寻址键；脚本路径与 env（默认 os.environ）中的 RESULT_ENV_VARS 参与计算"""
+    path = Path(path).resolve()
+    env = os.environ if env is None else env
+    digest = hashlib.sha256()
+    digest.update(json.dumps(environment_fingerprint(), sort_keys=True).encode())
+    digest.update(json.dumps({name: env.get(name) for name in RESULT_ENV_VARS}, sort_keys=True).encode())
+    digest.update(_repo_relative(path).encode())
+    digest.update(path.read_bytes())
+    for dep in local_dependencies(path):
+        digest.update(_repo_relative(dep).encode())
+        digest.update(dep.read_bytes())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """磁盘上的结果缓存，按总大小淘汰"""
+
+    def __init__(self, directory=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = Path(directory) if directory else CACHE_DIR / "results"
+        self.max_bytes = max_bytes
+
+    def _path(self, key):
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key):
+        """命中返回结果字典，否则 None"""
+        path = self._path(key)
+        try:
+            with open(path, encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        os.utime(path)
+        return entry
+
+    def put(self, key, result):
+        """写入一条结果（先写临时文件再改名，并发写入也不会读到半个文件）"""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False)
+        os.replace(tmp, path)
+
+    def entries(self):
+        """(修改时间, 大小, 路径) 列表"""
+        if not self.directory.exists():
+            return []
+        items = []
+        for path in self.directory.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            items.append((stat.st_mtime, stat.st_size, path))
+        return items
+
+    def evict(self):
+        """删除最久未用的条目直到总大小不超过 max_bytes，返回删除个数"""
+        items = sorted(self.entries())
+        total = sum(size for _, size, _ in items)
+        removed = 0
+        for _, size, path in items:
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self):
+        """清空缓存"""
+        for _, _, path in self.entries():
+            path.unlink(missing_ok=True)
+
+
+def main():
+    """主函数：缓存状态，或列出一个脚本的键与本地依赖"""
+    cache = ResultCache()
+    if len(sys.argv) > 1:
+        for arg in sys.argv[1:]:
+            print(f"{cache_key(arg)}  {arg}")
+            for dep in local_dependencies(arg):
+                print(f"    依赖 {dep}")
+        return
+    items = cache.entries()
+    total = sum(size for _, size, _ in items)
+    print(f"缓存目录 {cache.directory}: {len(items)} 条，{total / 1024 / 1024:.1f} MB "
+          f"（上限 {cache.max_bytes / 1024 / 1024:.0f} MB）")
+    print(f"环境: {environment_fingerprint()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+临界线上的 Riemann–Siegel Z(t) 求值与零点搜索
+
+Z(t) = e^{iθ(t)} ζ(1/2 + it) 是实函数，零点即 ζ 在临界线上的零点：
+    Z(t) = 2 Σ_{n≤N} n^(-1/2) cos(θ(t) - t log n)
+           + (-1)^(N-1) a^(-1/2) [C0(p) + C1(p)/a + C2(p)/a²]
+其中 a = √(t/2π)，N = ⌊a⌋，p = a - N。
+C0(p) = cos(2π(p² - p - 1/16)) / cos(2πp)，C1、C2 由 C0 的导数给出 (Gabcke)：
+    C1 = -C0'''/(96π²)，C2 = C0''/(64π²) + C0⁽⁶⁾/(18432π⁴)
+C0 在 p = 1/4、3/4 处是可去奇点，这里先用切比雪夫多项式拟合再求导。
+t 较小时直接用 zeta_engine 的 Euler–Maclaurin 结果。
+
+零点搜索以 Gram 点 θ(g_n) = nπ 为框架：相邻“好” Gram 点之间的
+Gram 块按 Rosser 规则应含与块长相同个数的零点，不足时加密采样。
+区间按 Gram 下标切成段（切点顺延到下一个好 Gram 点，不拆开 Rosser 块），
+在进程池中并行，结果按顺序流式写入文件。
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from numpy.polynomial import Chebyshev, chebyshev
+
+from zeta_engine import zeta
+
+SMALL_T = 200.0
+DEFAULT_CHUNK = 4096
+DEFAULT_SEGMENT = 20000
+BISECT_STEPS = 52
+
+
+def _c0_exact(p):
+    """C0 的闭式（在 1/4、3/4 附近有 0/0 抵消）"""
+    return np.cos(2 * np.pi * (p * p - p - 1 / 16)) / np.cos(2 * np.pi * p)
+
+
+def _fit_coefficients(degree=48):
+    """在切比雪夫节点上拟合 C0，并求出 C1、C2 所需的导数多项式（[0, 1] 上的切比雪夫系数）"""
+    nodes = np.cos(np.pi * (np.arange(4 * degree) + 0.5) / (4 * degree)) / 2 + 0.5
+    nodes = nodes[np.minimum(np.abs(nodes - 0.25), np.abs(nodes - 0.75)) > 1e-3]
+    c0 = Chebyshev.fit(nodes, _c0_exact(nodes), degree, domain=[0, 1])
+    c1 = -c0.deriv(3) / (96 * np.pi ** 2)
+    c2 = c0.deriv(2) / (64 * np.pi ** 2) + c0.deriv(6) / (18432 * np.pi ** 4)
+    # 三组系数并排成 (degree+1, 3)，一次 Clenshaw 递推同时求出 C0、C1、C2
+    coef = np.zeros((degree + 1, 3))
+    for j, c in enumerate((c0, c1, c2)):
+        coef[:len(c.coef), j] = c.coef
+    return coef
+
+
+_COEF = _fit_coefficients()
+
+
+def theta(t):
+    """Riemann–Siegel θ(t) 的渐近展开（t ≥ 10 时误差 < 1e-11）"""
+    t = np.asarray(t, dtype=np.float64)
+    return (t / 2 * np.log(t / (2 * np.pi)) - t / 2 - np.pi / 8
+            + 1 / (48 * t) + 7 / (5760 * t ** 3) + 31 / (80640 * t ** 5))
+
+
+def _z_small(t):
+    """小 t：由 Euler–Maclaurin 的 ζ(1/2 + it) 直接得到 Z(t)"""
+    return (np.exp(1j * theta(t)) * zeta(0.5 + 1j * t)).real
+
+
+def _z_riemann_siegel(t):
+    """大 t：Riemann–Siegel 主和加 C0..C2 修正"""
+    a = np.sqrt(t / (2 * np.pi))
+    N = np.floor(a).astype(np.int64)
+    p = a - N
+    n = np.arange(1, N.max() + 1, dtype=np.float64)
+    phase = theta(t)[:, None] - t[:, None] * np.log(n)[None, :]
+    terms = np.cos(phase) / np.sqrt(n)[None, :]
+    terms[n[None, :] > N[:, None]] = 0.0
+    main = 2 * terms.sum(axis=1)
+    sign = np.where(N % 2 == 1, 1.0, -1.0)
+    c0, c1, c2 = chebyshev.chebval(2 * p - 1, _COEF)
+    remainder = sign * a ** -0.5 * (c0 + c1 / a + c2 / a ** 2)
+    return main + remainder
+
+
+def riemann_siegel_z(t, chunk=DEFAULT_CHUNK):
+    """向量化 Z(t)，t 为标量或数组（t > 0）"""
+    t_arr = np.atleast_1d(np.asarray(t, dtype=np.float64))
+    out = np.empty(t_arr.shape, dtype=np.float64)
+    flat_t, flat_out = t_arr.ravel(), out.ravel()
+    small = flat_t < SMALL_T
+    if small.any():
+        flat_out[small] = _z_small(flat_t[small])
+    large = np.flatnonzero(~small)
+    for lo in range(0, len(large), chunk):
+        idx = large[lo:lo + chunk]
+        flat_out[idx] = _z_riemann_siegel(flat_t[idx])
+    return out.reshape(np.shape(t)) if np.ndim(t) else float(out[0])
+
+
+def gram_points(indices):
+    """Gram 点 g_n：θ(g_n) = nπ，向量化牛顿迭代"""
+    n = np.asarray(indices, dtype=np.float64)
+    t = np.maximum(2 * np.pi * (n + 1) / np.log(np.maximum(n, 2.0)) + 10, 10.0)
+    for _ in range(60):
+        step = (theta(t) - n * np.pi) / (0.5 * np.log(t / (2 * np.pi)))
+        t = np.maximum(t - step, 8.0)
+        if np.all(np.abs(step) < 1e-12 * t):
+            break
+    return t
+
+
+def _refine(lo, hi, z_lo):
+    """对一批异号区间同时二分"""
+    for _ in range(BISECT_STEPS):
+        mid = (lo + hi) / 2
+        z_mid = riemann_siegel_z(mid)
+        left = np.sign(z_mid) == np.sign(z_lo)
+        lo = np.where(left, mid, lo)
+        z_lo = np.where(left, z_mid, z_lo)
+        hi = np.where(left, hi, mid)
+    return (lo + hi) / 2
+
+
+def _sign_changes(t_grid, z_grid):
+    """返回相邻采样点之间的异号区间"""
+    change = np.flatnonzero(np.sign(z_grid[:-1]) * np.sign(z_grid[1:]) < 0)
+    return t_grid[change], t_grid[change + 1], z_grid[change]
+
+
+def zeros_in_gram_range(n0, n1, max_refine=256):
+    """
+    Gram 区间 (g_{n-1}, g_n]（n0 ≤ n < n1）内的全部零点
+
+    返回 (零点数组, 未能补足的零点数)。块边界取“好” Gram 点，
+    即 (-1)^n Z(g_n) > 0 者；坏块逐级加密采样直到找齐或达到 max_refine。
+    """
+    index = np.arange(n0 - 1, n1)
+    g = gram_points(index)
+    z = riemann_siegel_z(g)
+    good = np.flatnonzero(np.where(index % 2 == 0, z, -z) > 0)
+    # 两端强制作为块边界，保证整个区间被覆盖
+    bounds = np.unique(np.concatenate(([0], good, [len(g) - 1])))
+
+    lows, highs, z_lows = [], [], []
+    missing = 0
+    for a, b in zip(bounds[:-1], bounds[1:]):
+        expected = b - a
+        sub = 1
+        while True:
+            if sub == 1:
+                t_grid, z_grid = g[a:b + 1], z[a:b + 1]
+            else:
+                frac = np.arange(sub) / sub
+                t_grid = (g[a:b, None] + np.diff(g[a:b + 1])[:, None] * frac).ravel()
+                t_grid = np.append(t_grid, g[b])
+                z_grid = riemann_siegel_z(t_grid)
+            lo, hi, z_lo = _sign_changes(t_grid, z_grid)
+            if len(lo) >= expected or sub >= max_refine:
+                break
+            sub *= 4
+        missing += max(expected - len(lo), 0)
+        lows.append(lo)
+        highs.append(hi)
+        z_lows.append(z_lo)
+
+    lo, hi, z_lo = (np.concatenate(x) for x in (lows, highs, z_lows))
+    return _refine(lo, hi, z_lo), missing
+
+
+def _is_good(index):
+    """好 Gram 点：(-1)^n Z(g_n) > 0"""
+    index = np.asarray(index)
+    z = riemann_siegel_z(gram_points(index))
+    return np.where(index % 2 == 0, z, -z) > 0
+
+
+def segment_bounds(count, segment, probe=16):
+    """
+    把 Gram 区间 [0, count) 切成约 segment 长的段
+
+    每个切点 n1 都顺延到 g_{n1-1} 为好 Gram 点处，这样 Rosser 块不会
+    被两段拆开，各段的零点个数与段长无关；末段同样顺延，因此总区间数
+    可能略多于 count。
+    """
+    bounds = []
+    n0 = 0
+    while n0 < count:
+        k = max(min(n0 + segment, count), n0 + 1) - 1
+        while True:
+            good = np.flatnonzero(_is_good(np.arange(k, k + probe)))
+            if len(good):
+                k += int(good[0])
+                break
+            k += probe
+        bounds.append((n0, k + 1))
+        n0 = k + 1
+    return bounds
+
+
+def _segment_job(bounds):
+    """进程池任务：一个 Gram 下标段"""
+    n0, n1 = bounds
+    zeros, missing = zeros_in_gram_range(n0, n1)
+    return n0, n1, zeros, missing
+
+
+def find_zeros(count, out_path, workers=None, segment=DEFAULT_SEGMENT):
+    """
+    求前 count 个 Gram 区间内的零点并流式写入 out_path（每行一个 t）
+
+    返回 (写出的零点个数, 未补足个数)。
+    """
+    segments = segment_bounds(count, segment)
+    written = 0
+    missing = 0
+    with open(out_path, 'w') as out, ProcessPoolExecutor(max_workers=workers) as pool:
+        for n0, n1, zeros, lost in pool.map(_segment_job, segments):
+            np.savetxt(out, zeros, fmt='%.12f')
+            out.flush()
+            written += len(zeros)
+            missing += lost
+            print(f"  Gram [{n0}, {n1}): {len(zeros)} 个零点" + (f"，缺 {lost} 个" if lost else ""))
+    return written, missing
+
+
+def main():
+    """命令行：python3 riemann_siegel.py --zeros 1000000 --out zeros.txt"""
+    parser = argparse.ArgumentParser(description="临界线零点搜索 (Riemann–Siegel)")
+    parser.add_argument('--zeros', type=int, default=1000, help="Gram 区间个数（约等于零点个数）")
+    parser.add_argument('--out', default='zeta_zeros.txt', help="输出文件")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="进程数")
+    parser.add_argument('--segment', type=int, default=DEFAULT_SEGMENT, help="每个任务的 Gram 区间数")
+    args = parser.parse_args()
+
+    print("Riemann–Siegel 零点搜索")
+    print("=" * 60)
+    known = [14.134725141734693, 21.022039638771555, 25.010857580145688]
+    print("前三个零点的 Z(t): " + ", ".join(f"{riemann_siegel_z(t):.1e}" for t in known))
+
+    start = time.time()
+    written, missing = find_zeros(args.zeros, args.out, args.workers, args.segment)
+    elapsed = time.time() - start
+    status = '✅' if missing == 0 else '❌'
+    print(f"\n共 {written} 个零点写入 {args.out}，用时 {elapsed:.1f}s，缺失 {missing} {status}")
+    return 0 if missing == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
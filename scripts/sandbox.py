@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+资源受限的执行：地址空间（RLIMIT_AS）与 CPU 时间（RLIMIT_CPU）上限
+
+有些验证的规模参数一旦调大，内存或时间就会失控（第016章的 2**n 穷举、第058章 O(r³) 的
+count_binary_triangles）。verify_runner --memory-limit/--cpu-limit 让每个脚本在上限下运行，
+越界的脚本记为独立的 "resource" 结果，并给出达到的峰值 RSS 与 CPU 时间。
+冷启动时上限经环境变量 PSI_LIMITS 交给启动器（quiet_output），在执行脚本前于子进程内设置；
+预热模式下由 fork 出的子进程直接设置。
+
+判定越界：
+    内存  RLIMIT_AS 下分配失败，Python 抛出 MemoryError（NumPy 为 "Unable to allocate"）
+    CPU   超过软上限收到 SIGXCPU，超过硬上限（软上限 + 1 秒）收到 SIGKILL
+
+RLIMIT_AS 限制的是虚拟地址空间，导入 NumPy/SciPy 后就有约 250 MB，上限要在此之上。
+
+二分模式在上限内寻找内核（kernel_bench.KERNELS）能承受的最大规模：
+每个规模在 fork 出的子进程中带上限运行一次，先倍增找到第一个失败的规模，再二分。
+
+    python3 scripts/verify_runner.py --memory-limit 1024 --cpu-limit 60
+    python3 scripts/sandbox.py bisect count_binary_triangles --cpu 2
+    python3 scripts/sandbox.py bisect brute_force_patterns --memory 512 --lo 8
+"""
+
+import argparse
+import os
+import resource
+import signal
+import sys
+import time
+import traceback
+from collections import namedtuple
+
+Limits = namedtuple('Limits', 'memory_mb cpu_seconds', defaults=(None, None))
+Outcome = namedtuple('Outcome', 'ok exceeded wall_time cpu_time max_rss_kb error')
+
+MEMORY, CPU = 'memory', 'cpu'
+EXIT_MEMORY = 3
+LIMITS_VAR = "PSI_LIMITS"
+DEFAULT_BISECT_CPU = 30.0
+_MEMORY_MARKERS = ("MemoryError", "Unable to allocate", "std::bad_alloc", "Cannot allocate memory")
+
+
+def apply_limits(limits):
+    """在当前进程设置上限（子进程 fork 之后、运行脚本之前调用）"""
+    if limits.memory_mb:
+        size = int(limits.memory_mb * 1024 * 1024)
+        resource.setrlimit(resource.RLIMIT_AS, (size, size))
+    if limits.cpu_seconds:
+        soft = max(1, int(limits.cpu_seconds + 0.999))
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, soft + 1))
+
+
+def limits_env(limits):
+    """把上限编码为环境变量，由启动器（quiet_output）在子进程中读取并设置"""
+    return {LIMITS_VAR: ",".join("" if value is None else repr(float(value)) for value in limits)}
+
+
+def active(env=None):
+    """env（默认 os.environ）中是否给出了上限"""
+    env = os.environ if env is None else env
+    return bool(env.get(LIMITS_VAR))
+
+
+def limits_from_env(env=None):
+    """读取 limits_env 写入的上限；未设置时返回 None"""
+    env = os.environ if env is None else env
+    if not active(env):
+        return None
+    return Limits(*(float(field) if field else None for field in env[LIMITS_VAR].split(",")))
+
+
+def exceeded(limits, returncode, cpu_time, stderr=''):
+    """由退出状态判断越界类型：MEMORY、CPU 或 None"""
+    if not limits:
+        return None
+    if limits.cpu_seconds and (returncode in (-signal.SIGXCPU, -signal.SIGKILL)
+                               and cpu_time >= limits.cpu_seconds * 0.95):
+        return CPU
+    if limits.memory_mb and returncode != 0 and (
+            returncode == EXIT_MEMORY or any(marker in stderr for marker in _MEMORY_MARKERS)):
+        return MEMORY
+    return None
+
+
+def run_limited(func, limits, args=()):
+    """
+    在 fork 出的子进程中带上限调用 func(*args)，返回 Outcome
+
+    子进程中的 MemoryError 以 EXIT_MEMORY 退出，其它异常以 1 退出（错误信息经管道传回）。
+    """
+    read_fd, write_fd = os.pipe()
+    start = time.perf_counter()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        code = 0
+        try:
+            apply_limits(limits)
+            func(*args)
+        except MemoryError:
+            code = EXIT_MEMORY
+        except BaseException:
+            os.write(write_fd, traceback.format_exc().encode()[-4096:])
+            code = 1
+        finally:
+            os._exit(code)
+    os.close(write_fd)
+    with os.fdopen(read_fd, 'rb') as pipe:
+        error = pipe.read().decode(errors='replace')
+    _, status, usage = os.wait4(pid, 0)
+    wall = time.perf_counter() - start
+    returncode = os.waitstatus_to_exitcode(status)
+    cpu = usage.ru_utime + usage.ru_stime
+    reason = exceeded(limits, returncode, cpu, error)
+    return Outcome(returncode == 0, reason, wall, cpu, usage.ru_maxrss, error or None)
+
+
+def bisect_parameter(setup, limits, lo=1, hi=None, on_step=None):
+    """
+    在上限内 setup(n)() 能完成的最大整数 n，返回 (n, 每步的 (n, Outcome) 列表)
+
+    假设可行性随 n 单调。hi 未给出时从 lo 倍增直到失败。lo 本身不可行时返回 (None, steps)。
+    setup(n) 与调用都在子进程中执行，准备输入的内存也计入上限。
+    """
+    steps = []
+
+    def feasible(n):
+        outcome = run_limited(lambda: setup(n)(), limits)
+        steps.append((n, outcome))
+        if on_step:
+            on_step(n, outcome)
+        if not outcome.ok and outcome.exceeded is None:
+            raise RuntimeError(f"kernel failed at n={n} for a reason other than resources:\n{outcome.error}")
+        return outcome.ok
+
+    if not feasible(lo):
+        return None, steps
+    good = lo
+    if hi is None:
+        bad = lo * 2
+        while feasible(bad):
+            good, bad = bad, bad * 2
+    elif feasible(hi):
+        return hi, steps
+    else:
+        bad = hi
+    while bad - good > 1:
+        mid = (good + bad) // 2
+        if feasible(mid):
+            good = mid
+        else:
+            bad = mid
+    return good, steps
+
+
+def main(argv=None):
+    """命令行：bisect KERNEL"""
+    from kernel_bench import KERNELS
+
+    kernels = {k.name: k for k in KERNELS}
+    parser = argparse.ArgumentParser(description="资源上限下的内核规模二分")
+    sub = parser.add_subparsers(dest='command', required=True)
+    p = sub.add_parser('bisect', help="找出内核在上限内能承受的最大规模")
+    p.add_argument('kernel', choices=sorted(kernels))
+    p.add_argument('--memory', type=float, help="地址空间上限（MB）")
+    p.add_argument('--cpu', type=float, default=DEFAULT_BISECT_CPU,
+                   help="CPU 时间上限（秒）；每次试运行都必须在有限时间内结束，所以总有默认值")
+    p.add_argument('--lo', type=int, help="起始规模（默认该内核最小的基准规模）")
+    p.add_argument('--hi', type=int, help="上界（默认倍增寻找）")
+    args = parser.parse_args(argv)
+    kernel = kernels[args.kernel]
+    limits = Limits(args.memory, args.cpu)
+    print(f"二分 {kernel.name}（{kernel.description}），内存 {args.memory or '∞'} MB，CPU {args.cpu:g} s")
+    print("=" * 60)
+
+    def show(n, outcome):
+        state = "通过" if outcome.ok else f"越界({outcome.exceeded})"
+        print(f"  n = {n:10d}  {state:12s} {outcome.cpu_time:8.2f}s cpu  峰值 {outcome.max_rss_kb / 1024:8.1f} MB",
+              flush=True)
+
+    try:
+        best, steps = bisect_parameter(kernel.setup, limits, args.lo or kernel.sizes[0], args.hi, show)
+    except RuntimeError as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    if best is None:
+        print("起始规模即越界")
+        return 1
+    print(f"最大可行规模: {best}（{len(steps)} 次试运行）")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+验证脚本的确定性随机种子
+
+设置 PSI_SEED=<整数> 后，每个脚本在运行前按 (基础种子, 仓库内路径) 得到自己的种子，
+并用它初始化 random 与 NumPy 的全局随机状态（np.random.seed）。种子只取决于路径，
+与哪台机器、哪个进程、以什么顺序运行无关，所以分布式运行的结果可以逐项复现。
+
+未设置时保持原来的行为：每次运行取新的随机种子。
+脚本里显式调用 np.random.seed(...) 或 default_rng(seed) 的不受影响。
+"""
+
+import hashlib
+import os
+import random
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SEED_VAR = "PSI_SEED"
+
+
+def active(env=None):
+    """env（默认 os.environ）中是否给出了基础种子"""
+    env = os.environ if env is None else env
+    return bool(env.get(SEED_VAR))
+
+
+def derive_seed(base, label):
+    """由基础种子与标签得到 32 位种子（平台无关）"""
+    digest = hashlib.sha256(f"{int(base)}:{label}".encode()).digest()
+    return int.from_bytes(digest[:4], 'little')
+
+
+def script_label(path):
+    """脚本的标签：仓库内相对路径（POSIX 形式），仓库外的脚本用文件名"""
+    path = Path(path).resolve()
+    try:
+        return path.relative_to(REPO_ROOT).as_posix()
+    except ValueError:
+        return path.name
+
+
+def seed_all(seed):
+    """初始化 random 与 NumPy 的全局随机状态"""
+    random.seed(seed)
+    numpy = sys.modules.get('numpy')
+    if numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            return
+    numpy.random.seed(seed)
+
+
+def seed_script(path, env=None):
+    """按环境变量为脚本设定种子，返回所用种子；未启用时返回 None"""
+    env = os.environ if env is None else env
+    if not active(env):
+        return None
+    seed = derive_seed(env[SEED_VAR], script_label(path))
+    seed_all(seed)
+    return seed
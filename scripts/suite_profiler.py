@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+unittest 验证套件的逐测试计时、内存分配与 RSS 统计
+
+InstrumentedResult 是 TextTestResult 的子类，对每个 test_* 方法记录
+墙钟时间、CPU 时间、tracemalloc 峰值与 RSS 增量。可以单独使用：
+
+    unittest.main(testRunner=InstrumentedRunner)
+
+也可以用命令行对全部 TestCase 验证脚本汇总：脚本按模块导入（不触发其 __main__），
+用 TestLoader 收集测试后逐个运行，最后按耗时与内存给出热点排名。
+超过阈值的测试可以用 SIGPROF 采样器重跑一次，列出最常出现的栈顶函数。
+
+    python3 scripts/suite_profiler.py --top 20 --profile 0.5
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import resource
+import signal
+import sys
+import sysconfig
+import time
+import tracemalloc
+import unittest
+from collections import Counter, namedtuple
+from pathlib import Path
+
+TestTiming = namedtuple('TestTiming', 'test suite outcome wall_time cpu_time alloc_peak_kb rss_delta_kb')
+
+SAMPLE_INTERVAL = 0.001
+
+
+def current_rss_kb():
+    """当前常驻内存（KB）；没有 /proc 时退化为峰值 RSS"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') // 1024
+    except (OSError, ValueError, IndexError):
+        usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return usage // 1024 if sys.platform == 'darwin' else usage
+
+
+class InstrumentedResult(unittest.TextTestResult):
+    """逐测试记录资源消耗的 TestResult，结果在 self.timings"""
+
+    trace_allocations = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.timings = []
+        self._outcome = None
+        self._started_tracing = False
+
+    def startTest(self, test):
+        if self.trace_allocations:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            tracemalloc.reset_peak()
+            self._alloc_base = tracemalloc.get_traced_memory()[0]
+        self._outcome = 'passed'
+        self._rss = current_rss_kb()
+        self._cpu = time.process_time()
+        self._wall = time.perf_counter()
+        super().startTest(test)
+
+    def stopTest(self, test):
+        super().stopTest(test)
+        wall = time.perf_counter() - self._wall
+        cpu = time.process_time() - self._cpu
+        alloc = 0
+        if self.trace_allocations:
+            alloc = max(tracemalloc.get_traced_memory()[1] - self._alloc_base, 0) // 1024
+        self.timings.append(TestTiming(
+            test=test.id(),
+            suite=getattr(sys.modules.get(type(test).__module__), '__file__', None),
+            outcome=self._outcome,
+            wall_time=wall,
+            cpu_time=cpu,
+            alloc_peak_kb=alloc,
+            rss_delta_kb=current_rss_kb() - self._rss,
+        ))
+
+    def stopTestRun(self):
+        super().stopTestRun()
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def addFailure(self, test, err):
+        self._outcome = 'failed'
+        super().addFailure(test, err)
+
+    def addError(self, test, err):
+        self._outcome = 'error'
+        super().addError(test, err)
+
+    def addSkip(self, test, reason):
+        self._outcome = 'skipped'
+        super().addSkip(test, reason)
+
+    def addExpectedFailure(self, test, err):
+        self._outcome = 'expected failure'
+        super().addExpectedFailure(test, err)
+
+    def addUnexpectedSuccess(self, test):
+        self._outcome = 'unexpected success'
+        super().addUnexpectedSuccess(test)
+
+
+class InstrumentedRunner(unittest.TextTestRunner):
+    """使用 InstrumentedResult 的 TextTestRunner，运行结束后打印本套件的热点"""
+
+    resultclass = InstrumentedResult
+
+    def run(self, test):
+        result = super().run(test)
+        print_hotspots(result.timings, top=5, stream=self.stream)
+        return result
+
+
+# 标准库与第三方包所在目录（虚拟环境中两者可能分开）
+_LIBRARY_DIRS = tuple(sorted({os.path.join(sysconfig.get_paths()[key], '')
+                              for key in ('stdlib', 'platstdlib', 'purelib', 'platlib')}))
+
+
+def _is_library(filename):
+    """帧的文件是否属于标准库、第三方包或冻结模块（<frozen ...>）"""
+    return filename.startswith('<') or filename.startswith(_LIBRARY_DIRS)
+
+
+class _Sampler:
+    """SIGPROF 采样：按 CPU 时间定时记录当前栈顶（本仓库代码优先）"""
+
+    def __init__(self, interval=SAMPLE_INTERVAL):
+        self.interval = interval
+        self.samples = Counter()
+
+    def _handler(self, signum, frame):
+        leaf = frame
+        # 跳过标准库与第三方包，停在第一个仓库内的帧；找不到就用原栈顶
+        while leaf is not None and _is_library(leaf.f_code.co_filename):
+            leaf = leaf.f_back
+        leaf = leaf or frame
+        code = leaf.f_code
+        self.samples[f"{Path(code.co_filename).name}:{leaf.f_lineno} {code.co_name}"] += 1
+
+    def __enter__(self):
+        self._previous = signal.signal(signal.SIGPROF, self._handler)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        return self
+
+    def __exit__(self, *exc):
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, self._previous)
+
+
+def sample_test(test, interval=SAMPLE_INTERVAL):
+    """在采样器下重跑一个测试（含类级 setUp），返回 Counter"""
+    fresh = type(test)(test._testMethodName)
+    with _Sampler(interval) as sampler, contextlib.redirect_stdout(io.StringIO()):
+        unittest.TestSuite([fresh]).run(unittest.TestResult())
+    return sampler.samples
+
+
+@contextlib.contextmanager
+def script_context(path):
+    """以脚本目录为工作目录并放在 sys.path 最前，与直接运行脚本时一致"""
+    directory = str(Path(path).resolve().parent)
+    cwd = os.getcwd()
+    sys.path.insert(0, directory)
+    try:
+        os.chdir(directory)
+        yield
+    finally:
+        os.chdir(cwd)
+        sys.path.remove(directory)
+
+
+def load_suite_module(path):
+    """按文件路径导入验证脚本（模块名不是 __main__，其主程序不会运行）"""
+    path = Path(path).resolve()
+    name = "suite_" + "_".join(path.relative_to(path.parents[2]).with_suffix('').parts).replace('-', '_')
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    with script_context(path):
+        spec.loader.exec_module(module)
+    return module
+
+
+def profile_suites(paths, trace_allocations=True, profile_threshold=None, quiet=True):
+    """
+    导入并运行 paths 中的 TestCase，返回 (全部 TestTiming, {测试 id: 采样 Counter})
+
+    profile_threshold 为秒数时，墙钟时间超过它的测试会在采样器下重跑一次。
+    """
+    timings, profiles = [], {}
+    loader = unittest.TestLoader()
+    for path in paths:
+        sink = io.StringIO() if quiet else sys.stdout
+        with contextlib.redirect_stdout(sink):
+            try:
+                module = load_suite_module(path)
+            except Exception as exc:
+                print(f"无法导入 {path}: {exc!r}", file=sys.stderr)
+                continue
+            suite = loader.loadTestsFromModule(module)
+            # TestSuite.run 会丢弃已运行的测试，采样重跑需要先留下引用
+            tests = {t.id(): t for t in _iter_tests(suite)}
+            result = InstrumentedResult(io.StringIO(), descriptions=False, verbosity=0)
+            result.trace_allocations = trace_allocations
+            # 采样重跑与计时运行使用同样的工作目录与 sys.path
+            with script_context(path):
+                suite.run(result)
+                result.stopTestRun()
+                if profile_threshold is not None:
+                    for timing in result.timings:
+                        if timing.wall_time > profile_threshold and timing.test in tests:
+                            profiles[timing.test] = sample_test(tests[timing.test])
+        timings.extend(result.timings)
+    return timings, profiles
+
+
+def _iter_tests(suite):
+    """展开嵌套的 TestSuite"""
+    for item in suite:
+        if isinstance(item, unittest.TestSuite):
+            yield from _iter_tests(item)
+        else:
+            yield item
+
+
+def print_hotspots(timings, top=20, stream=None):
+    """按墙钟时间与分配峰值排名"""
+    stream = stream or sys.stdout
+    if not timings:
+        return
+    total = sum(t.wall_time for t in timings)
+    print(f"\n{len(timings)} 个测试，共 {total:.3f}s", file=stream)
+    print(f"{'墙钟':>9s} {'CPU':>9s} {'分配峰值':>10s} {'RSS增量':>9s}  测试", file=stream)
+    for t in sorted(timings, key=lambda t: -t.wall_time)[:top]:
+        print(f"{t.wall_time:8.4f}s {t.cpu_time:8.4f}s {t.alloc_peak_kb:8d}KB {t.rss_delta_kb:7d}KB  "
+              f"{t.test} [{t.outcome}]", file=stream)
+    heavy = sorted(timings, key=lambda t: -t.alloc_peak_kb)[:min(top, 5)]
+    print("分配峰值最大:", file=stream)
+    for t in heavy:
+        print(f"  {t.alloc_peak_kb:8d}KB  {t.test}", file=stream)
+
+
+def main(argv=None):
+    """命令行入口"""
+    from verify_runner import DEFAULT_ROOTS, discover, script_kind
+
+    parser = argparse.ArgumentParser(description="TestCase 验证套件的逐测试热点报告")
+    parser.add_argument('paths', nargs='*', help="目录或脚本（默认全部含 TestCase 的验证脚本）")
+    parser.add_argument('-k', dest='keyword', help="只运行路径中含此子串的脚本")
+    parser.add_argument('--top', type=int, default=20, help="排名显示的条数")
+    parser.add_argument('--profile', type=float, metavar='SECONDS',
+                        help="对超过该墙钟时间的测试采样重跑")
+    parser.add_argument('--no-tracemalloc', action='store_true', help="不统计分配峰值（开销更小）")
+    parser.add_argument('--json', help="把逐测试数据写入 JSON")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('MPLBACKEND', 'Agg')
+    paths = [p for p in discover(args.paths or DEFAULT_ROOTS, keyword=args.keyword)
+             if script_kind(p) == 'unittest']
+    print(f"运行 {len(paths)} 个 TestCase 验证脚本")
+    timings, profiles = profile_suites(paths, not args.no_tracemalloc, args.profile)
+    print_hotspots(timings, args.top)
+
+    for test, samples in profiles.items():
+        count = sum(samples.values())
+        if not count:
+            continue
+        print(f"\n采样 {test}（{count} 个样本）:")
+        for where, hits in samples.most_common(8):
+            print(f"  {hits / count:6.1%}  {where}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({
+                'timings': [t._asdict() for t in timings],
+                'profiles': {test: dict(samples) for test, samples in profiles.items()},
+            }, f, ensure_ascii=False, indent=1)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+并行运行 docs/psi-constants 与 docs/psi-structum 下的全部验证脚本（verify_*.py 与 derive_*.py）
+
+两类脚本都按独立进程运行：unittest.TestCase 套件（以 unittest.main() 结束）
+与模块级打印的脚本，都以退出码判断通过与否。每个脚本在自己的目录下运行，
+stdout/stderr 分别捕获，超时则杀掉进程。子进程用 os.wait4 回收，
+从其 rusage 取得 CPU 时间与峰值 RSS。
+
+结果按内容寻址缓存（result_cache）：脚本及其本地依赖、解释器和数值库版本都没变时
+直接复用上次的结果，--no-cache 关闭。
+--warm 改由 warm_pool 的预热解释器 fork 子进程运行，省去每个脚本的启动与导入开销。
+--snapshot DIR 让脚本经 numeric_snapshots.record 记录的数值写入 DIR（此时不使用缓存）。
+--quiet 丢弃脚本的 stdout，--log-dir DIR 把它压缩写入 DIR（见 quiet_output）；stderr 照常捕获。
+--seed N 让使用全局随机状态的脚本按路径得到确定的种子（见 seeding）。
+--memory-limit MB / --cpu-limit SEC 在 RLIMIT_AS / RLIMIT_CPU 下运行，越界记为 resource（见 sandbox）。
+分布式运行见 work_queue。
+
+    python3 scripts/verify_runner.py                      # 全部，报告写入 verify_report.json
+    python3 scripts/verify_runner.py docs/psi-constants -k chapter_03 --timeout 60
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import re
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import quiet_output
+import sandbox
+import seeding
+from result_cache import DEFAULT_MAX_BYTES, ResultCache, cache_key
+from warm_pool import WarmPool
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_ROOTS = (REPO_ROOT / "docs" / "psi-constants", REPO_ROOT / "docs" / "psi-structum")
+# derive_*.py 是 psi-constants 中推导 c_curv 等常数的脚本，其中的数值也记录快照
+DEFAULT_PATTERNS = ("verify_*.py", "derive_*.py")
+DEFAULT_TIMEOUT = 300.0
+DEFAULT_REPORT = "verify_report.json"
+
+PASSED, FAILED, TIMEOUT, RESOURCE = 'passed', 'failed', 'timeout', 'resource'
+
+ScriptResult = namedtuple('ScriptResult',
+                          'script kind status returncode wall_time cpu_time max_rss_kb tests stdout stderr cached '
+                          'exceeded',
+                          defaults=(False, None))
+
+_TESTS_RUN = re.compile(r"^Ran (\d+) tests? in", re.MULTILINE)
+
+
+def script_kind(path):
+    """'unittest'（含 TestCase 子类）或 'script'（模块级打印）"""
+    source = Path(path).read_text(encoding='utf-8', errors='replace')
+    return 'unittest' if re.search(r"\(\s*(unittest\.)?TestCase\s*\)", source) else 'script'
+
+
+def is_verify_script(path, patterns=DEFAULT_PATTERNS):
+    """文件名匹配 patterns（模式或其元组）且不在 __pycache__ 中的脚本"""
+    if isinstance(patterns, str):
+        patterns = (patterns,)
+    path = Path(path)
+    return '__pycache__' not in path.parts and any(fnmatch.fnmatch(path.name, p) for p in patterns)
+
+
+def discover(roots=DEFAULT_ROOTS, patterns=DEFAULT_PATTERNS, keyword=None):
+    """按路径排序的验证脚本列表；patterns 为文件名模式（或其元组），roots 中可以直接给出文件"""
+    found = set()
+    for root in roots:
+        root = Path(root).resolve()
+        if root.is_file():
+            found.add(root)
+        else:
+            found.update(p for p in root.rglob('*.py') if is_verify_script(p, patterns))
+    scripts = sorted(found)
+    if keyword:
+        scripts = [p for p in scripts if keyword in str(p.relative_to(REPO_ROOT))]
+    return scripts
+
+
+def script_env(extra=None):
+    """子进程环境：无界面的 matplotlib 后端，UTF-8 输出"""
+    env = dict(os.environ)
+    env.setdefault('MPLBACKEND', 'Agg')
+    env['PYTHONIOENCODING'] = 'utf-8'
+    env.update(extra or {})
+    return env
+
+
+def run_script(path, timeout=DEFAULT_TIMEOUT, python=sys.executable, env=None, limits=None):
+    """在脚本所在目录运行一个脚本，返回 ScriptResult；limits 为 sandbox.Limits"""
+    path = Path(path).resolve()
+    env = env or script_env()
+    if limits and any(limits):
+        # 上限由启动器在子进程内设置：线程池中用 preexec_fn 可能在 fork 与 exec 之间死锁
+        env = dict(env, **sandbox.limits_env(limits))
+    command = [python, path.name]
+    if quiet_output.active(env) or seeding.active(env) or sandbox.active(env):
+        command = [python, str(Path(quiet_output.__file__).resolve()), path.name]
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        start = time.perf_counter()
+        # 独立的会话与进程组：超时时连同脚本启动的子进程一起杀掉
+        proc = subprocess.Popen(command, cwd=path.parent, stdout=out, stderr=err,
+                                stdin=subprocess.DEVNULL, env=env, start_new_session=True)
+        timed_out = threading.Event()
+        lock = threading.Lock()
+        exited = False
+
+        def kill():
+            with lock:
+                if exited:
+                    return
+                timed_out.set()
+                try:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+
+        timer = threading.Timer(timeout, kill)
+        timer.start()
+        try:
+            # 先等待退出但不回收：回收之前 pid 不会被复用，定时器不会误杀别的进程
+            os.waitid(os.P_PID, proc.pid, os.WEXITED | os.WNOWAIT)
+        finally:
+            with lock:
+                exited = True
+            timer.cancel()
+        _, status, usage = os.wait4(proc.pid, 0)
+        wall = time.perf_counter() - start
+        proc.returncode = os.waitstatus_to_exitcode(status)
+
+        out.seek(0)
+        err.seek(0)
+        stdout = out.read().decode('utf-8', errors='replace')
+        stderr = err.read().decode('utf-8', errors='replace')
+
+    return _make_result(path, proc.returncode, timed_out.is_set(), wall,
+                        usage.ru_utime + usage.ru_stime, usage.ru_maxrss, stdout, stderr, limits)
+
+
+def run_script_warm(path, pool, timeout=DEFAULT_TIMEOUT, limits=None):
+    """在预热解释器 fork 的子进程中运行一个脚本，返回 ScriptResult"""
+    path = Path(path).resolve()
+    raw = pool.run(path, timeout, limits)
+    return _make_result(path, raw['returncode'], raw['timed_out'], raw['wall_time'],
+                        raw['cpu_time'], raw['max_rss_kb'], raw['stdout'], raw['stderr'], limits)
+
+
+def _make_result(path, returncode, timed_out, wall, cpu, max_rss_kb, stdout, stderr, limits=None):
+    """由子进程的原始数据组装 ScriptResult"""
+    exceeded = None if timed_out else sandbox.exceeded(limits, returncode, cpu, stderr)
+    if timed_out:
+        outcome = TIMEOUT
+    elif exceeded:
+        outcome = RESOURCE
+    else:
+        outcome = PASSED if returncode == 0 else FAILED
+    tests = _TESTS_RUN.search(stderr)
+    return ScriptResult(
+        script=str(path.relative_to(REPO_ROOT)),
+        kind=script_kind(path),
+        status=outcome,
+        returncode=returncode,
+        wall_time=round(wall, 4),
+        cpu_time=round(cpu, 4),
+        max_rss_kb=max_rss_kb,
+        tests=int(tests.group(1)) if tests else None,
+        stdout=stdout,
+        stderr=stderr,
+        exceeded=exceeded,
+    )
+
+
+def cached_run(path, cache, timeout=DEFAULT_TIMEOUT, env=None, warm=None, limits=None):
+    """先查缓存，未命中再运行；超时结果与负载有关，不写入缓存"""
+    def execute():
+        if warm is not None:
+            return run_script_warm(path, warm, timeout, limits)
+        return run_script(path, timeout, env=env, limits=limits)
+
+    if cache is None:
+        return execute()
+    key = cache_key(path, env)
+    entry = cache.get(key)
+    if entry is not None:
+        # 报告中的脚本名以本次的路径为准
+        entry.update(script=str(Path(path).resolve().relative_to(REPO_ROOT)), cached=True)
+        return ScriptResult(**entry)
+    result = execute()
+    if result.status != TIMEOUT:
+        cache.put(key, result._asdict())
+    return result
+
+
+def run_all(scripts, workers=None, timeout=DEFAULT_TIMEOUT, on_result=None, cache=None, warm=None,
+            env=None, limits=None):
+    """
+    并行运行，返回与 scripts 同序的结果列表
+
+    每个任务本身就是一个子进程，所以用线程池分派即可让 workers 个解释器同时运行。
+    on_result(result) 在每个脚本结束时按完成顺序回调。给出 cache 时跳过未变的脚本，
+    结束后按大小上限淘汰旧条目；给出 warm（WarmPool）时由预热解释器 fork 子进程。
+    limits（sandbox.Limits）为每个脚本的内存与 CPU 时间上限。
+    """
+    workers = workers or os.cpu_count()
+    env = env or script_env()
+    results = [None] * len(scripts)
+
+    def job(index):
+        results[index] = cached_run(scripts[index], cache, timeout, env=env, warm=warm, limits=limits)
+        if on_result:
+            on_result(results[index])
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(job, range(len(scripts))))
+    if cache is not None:
+        cache.evict()
+    return results
+
+
+def summarize(results):
+    """按状态计数"""
+    summary = {PASSED: 0, FAILED: 0, TIMEOUT: 0, RESOURCE: 0, 'cached': 0}
+    for r in results:
+        summary[r.status] = summary.get(r.status, 0) + 1
+        summary['cached'] += bool(r.cached)
+    return summary
+
+
+def write_report(results, path, wall_time, workers):
+    """机器可读的 JSON 报告"""
+    report = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'workers': workers,
+        'wall_time': round(wall_time, 3),
+        'summary': summarize(results),
+        'results': [r._asdict() for r in results],
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=1)
+    return report
+
+
+def _print_result(result):
+    """一行进度"""
+    mark = {PASSED: '✅', FAILED: '❌', TIMEOUT: '⏱', RESOURCE: '💥'}[result.status]
+    source = "  (缓存)" if result.cached else ""
+    if result.status == RESOURCE:
+        source += f"  (超出{'内存' if result.exceeded == sandbox.MEMORY else 'CPU'}上限)"
+    print(f"{mark} {result.wall_time:7.2f}s {result.cpu_time:7.2f}s cpu "
+          f"{result.max_rss_kb / 1024:7.1f} MB  {result.script}{source}", flush=True)
+
+
+def build_parser():
+    """命令行参数（后续模式在此基础上扩展）"""
+    parser = argparse.ArgumentParser(description="并行运行验证脚本并生成 JSON 报告")
+    parser.add_argument('paths', nargs='*', help="目录或脚本（默认 docs/psi-constants 与 docs/psi-structum）")
+    parser.add_argument('--pattern', action='append', dest='patterns',
+                        help=f"脚本文件名模式，可重复（默认 {' '.join(DEFAULT_PATTERNS)}）")
+    parser.add_argument('-k', dest='keyword', help="只运行路径中含此子串的脚本")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="同时运行的脚本数")
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, help="每个脚本的超时（秒）")
+    parser.add_argument('--report', default=DEFAULT_REPORT, help="JSON 报告路径")
+    parser.add_argument('--list', action='store_true', help="只列出发现的脚本")
+    parser.add_argument('--no-cache', action='store_true', help="不读写结果缓存")
+    parser.add_argument('--cache-size', type=float, default=DEFAULT_MAX_BYTES / 1024 / 1024,
+                        help="结果缓存大小上限（MB）")
+    parser.add_argument('--clear-cache', action='store_true', help="运行前清空结果缓存")
+    parser.add_argument('--warm', action='store_true', help="由预热解释器 fork 子进程运行脚本")
+    parser.add_argument('--snapshot', metavar='DIR', help="把脚本记录的数值快照写入 DIR")
+    parser.add_argument('--quiet', action='store_true', help="丢弃脚本的 stdout（stderr 照常捕获）")
+    parser.add_argument('--log-dir', metavar='DIR', help="把脚本的 stdout 压缩写入 DIR/*.log.gz")
+    parser.add_argument('--seed', type=int, help="基础随机种子（每个脚本按路径派生自己的种子）")
+    parser.add_argument('--memory-limit', type=float, metavar='MB', help="每个脚本的地址空间上限（RLIMIT_AS）")
+    parser.add_argument('--cpu-limit', type=float, metavar='SEC', help="每个脚本的 CPU 时间上限（RLIMIT_CPU）")
+    return parser
+
+
+def main(argv=None):
+    """命令行入口"""
+    args = build_parser().parse_args(argv)
+    scripts = discover(args.paths or DEFAULT_ROOTS, args.patterns or DEFAULT_PATTERNS, args.keyword)
+    if args.list:
+        for path in scripts:
+            print(f"{script_kind(path):8s} {path.relative_to(REPO_ROOT)}")
+        return 0
+
+    print(f"运行 {len(scripts)} 个验证脚本，{args.workers} 路并行，超时 {args.timeout:g}s")
+    print("=" * 60)
+    env = script_env()
+    if args.snapshot:
+        # 命中缓存的脚本不会运行，也就不会写快照
+        env['PSI_SNAPSHOT_DIR'] = str(Path(args.snapshot).resolve())
+        args.no_cache = True
+    if args.seed is not None:
+        env[seeding.SEED_VAR] = str(args.seed)
+    if args.quiet:
+        env[quiet_output.QUIET_VAR] = '1'
+    if args.log_dir:
+        env[quiet_output.LOG_VAR] = str(Path(args.log_dir).resolve())
+    limits = None
+    if args.memory_limit or args.cpu_limit:
+        limits = sandbox.Limits(args.memory_limit, args.cpu_limit)
+        # 越界与否取决于上限，这样的结果不能给没有上限的运行复用
+        args.no_cache = True
+    if args.quiet or args.log_dir:
+        # 这类结果没有 stdout，不能写入缓存给正常运行复用；日志也只在真正运行时生成
+        args.no_cache = True
+    cache = None
+    if not args.no_cache:
+        cache = ResultCache(max_bytes=int(args.cache_size * 1024 * 1024))
+        if args.clear_cache:
+            cache.clear()
+    start = time.perf_counter()
+    warm = WarmPool(env=env) if args.warm else None
+    try:
+        results = run_all(scripts, args.workers, args.timeout, on_result=_print_result,
+                          cache=cache, warm=warm, env=env, limits=limits)
+    finally:
+        if warm is not None:
+            warm.close()
+    wall = time.perf_counter() - start
+    report = write_report(results, args.report, wall, args.workers)
+
+    summary = report['summary']
+    print("=" * 60)
+    print(f"通过 {summary[PASSED]}，失败 {summary[FAILED]}，超时 {summary[TIMEOUT]}，"
+          f"资源越界 {summary[RESOURCE]}，缓存命中 {summary['cached']}，用时 {wall:.1f}s，报告: {args.report}")
+    return 0 if summary[FAILED] == 0 and summary[TIMEOUT] == 0 and summary[RESOURCE] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+预热解释器：NumPy/SciPy/matplotlib 只导入一次，每个脚本在 fork 出的子进程中运行
+
+服务进程启动时导入 PRELOAD 中的模块，然后在 Unix 套接字上等待请求。
+每个请求 fork 一个子进程（写时复制，已导入的模块直接可用），子进程把 stdout/stderr
+重定向到客户端给出的文件，切换到脚本目录，以 runpy 在 __main__ 命名空间中执行脚本。
+服务进程单线程，用 os.wait4 回收子进程并取得其 rusage，超时的子进程由它杀掉。
+
+客户端 WarmPool 可以被多个线程同时使用，每个请求一条连接。
+
+    python3 scripts/verify_runner.py --warm
+"""
+
+import importlib
+import json
+import os
+import runpy
+import selectors
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+from pathlib import Path
+
+import quiet_output
+import sandbox
+import seeding
+
+PRELOAD = (
+    'numpy', 'scipy', 'scipy.linalg', 'scipy.integrate', 'scipy.special', 'scipy.optimize',
+    'scipy.stats', 'matplotlib', 'matplotlib.pyplot',
+)
+POLL_INTERVAL = 0.01
+START_TIMEOUT = 60.0
+
+
+def preload(modules=PRELOAD):
+    """导入常用模块，缺失的可选依赖跳过；返回成功导入的模块名"""
+    os.environ.setdefault('MPLBACKEND', 'Agg')
+    loaded = []
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            continue
+        loaded.append(name)
+    return loaded
+
+
+def _reseed(path):
+    """子进程各自取新的随机种子，与独立解释器的行为一致；设置了 PSI_SEED 时按脚本确定"""
+    if seeding.seed_script(path) is not None:
+        return
+    import random
+    random.seed()
+    numpy = sys.modules.get('numpy')
+    if numpy is not None:
+        numpy.random.seed()
+
+
+def _exec_script(path, stdout_path, stderr_path, limits=None):
+    """在 fork 出的子进程中运行脚本，不返回；limits 为 sandbox.Limits 的字段列表"""
+    code = 1
+    try:
+        os.setsid()                       # 自成进程组，超时时连同其子进程一起杀掉
+        for fd, target in ((1, stdout_path), (2, stderr_path)):
+            out = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            os.dup2(out, fd)
+            os.close(out)
+        sys.stdout.reconfigure(encoding='utf-8')
+        sys.stderr.reconfigure(encoding='utf-8')
+        path = Path(path)
+        os.chdir(path.parent)
+        sys.argv = [str(path)]
+        sys.path[0] = str(path.parent)
+        _reseed(path)
+        quiet_output.install(path)
+        if limits:
+            sandbox.apply_limits(sandbox.Limits(*limits))
+        try:
+            runpy.run_path(str(path), run_name='__main__')
+            code = 0
+        except SystemExit as exc:
+            if exc.code is None:
+                code = 0
+            elif isinstance(exc.code, int):
+                code = exc.code
+            else:
+                print(exc.code, file=sys.stderr)
+                code = 1
+        except MemoryError:
+            traceback.print_exc()
+            code = sandbox.EXIT_MEMORY
+        except BaseException:
+            traceback.print_exc()
+            code = 1
+    finally:
+        try:
+            # os._exit 不运行 atexit，数值快照与输出日志在这里显式写出
+            snapshots = sys.modules.get('numeric_snapshots')
+            if snapshots is not None:
+                snapshots.flush()
+            quiet_output.close()
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os._exit(code & 0xFF)
+
+
+def _send(conn, message):
+    """发送一行 JSON 并关闭连接"""
+    try:
+        conn.sendall(json.dumps(message).encode() + b'\n')
+    except OSError:
+        pass
+    conn.close()
+
+
+def _recv_line(conn):
+    """读取一行 JSON"""
+    data = b''
+    while not data.endswith(b'\n'):
+        chunk = conn.recv(65536)
+        if not chunk:
+            break
+        data += chunk
+    return json.loads(data) if data.strip() else None
+
+
+def serve(sock_path, modules=PRELOAD):
+    """服务进程主循环：预热后监听 sock_path，直到收到 shutdown 请求"""
+    loaded = preload(modules)
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(sock_path)
+    listener.listen(128)
+    selector = selectors.DefaultSelector()
+    selector.register(listener, selectors.EVENT_READ)
+    print(json.dumps({'ready': True, 'preloaded': loaded}), flush=True)
+
+    children = {}  # pid -> [连接, 开始时间, 截止时间, 是否超时]
+    running = True
+    while running or children:
+        if running:
+            for _ in selector.select(timeout=POLL_INTERVAL):
+                conn, _ = listener.accept()
+                request = _recv_line(conn)
+                if not request or request.get('shutdown'):
+                    running = False
+                    conn.close()
+                    continue
+                start = time.perf_counter()
+                pid = os.fork()
+                if pid == 0:
+                    listener.close()
+                    conn.close()
+                    _exec_script(request['script'], request['stdout'], request['stderr'], request.get('limits'))
+                children[pid] = [conn, start, start + request.get('timeout', float('inf')), False]
+        else:
+            time.sleep(POLL_INTERVAL)
+
+        now = time.perf_counter()
+        for pid, child in children.items():
+            if not child[3] and now > child[2]:
+                child[3] = True
+                try:
+                    os.killpg(pid, signal.SIGKILL)
+                except ProcessLookupError:    # 子进程还没来得及 setsid
+                    os.kill(pid, signal.SIGKILL)
+
+        while children:
+            pid, status, usage = os.wait4(-1, os.WNOHANG)
+            if pid == 0:
+                break
+            conn, start, _, timed_out = children.pop(pid)
+            _send(conn, {
+                'returncode': os.waitstatus_to_exitcode(status),
+                'timed_out': timed_out,
+                'wall_time': time.perf_counter() - start,
+                'cpu_time': usage.ru_utime + usage.ru_stime,
+                'max_rss_kb': usage.ru_maxrss,
+            })
+
+    selector.close()
+    listener.close()
+
+
+class WarmPool:
+    """预热服务进程的客户端；with 语句结束时关闭服务"""
+
+    def __init__(self, env=None, python=sys.executable, modules=PRELOAD):
+        self._dir = tempfile.mkdtemp(prefix='psi-warm-')
+        self.sock_path = os.path.join(self._dir, 'server.sock')
+        command = [python, str(Path(__file__).resolve()), '--serve', self.sock_path, *modules]
+        self.process = subprocess.Popen(command, env=env, stdout=subprocess.PIPE, stdin=subprocess.DEVNULL)
+        line = self.process.stdout.readline()
+        if not line:
+            raise RuntimeError("warm interpreter failed to start")
+        self.preloaded = json.loads(line)['preloaded']
+
+    def run(self, script, timeout=float('inf'), limits=None):
+        """
+        在新 fork 的子进程中运行脚本，limits（sandbox.Limits）在子进程中生效
+
+        返回字典：returncode, timed_out, wall_time, cpu_time, max_rss_kb, stdout, stderr。
+        """
+        script = str(Path(script).resolve())
+        fd_out, out_path = tempfile.mkstemp(dir=self._dir, suffix='.out')
+        fd_err, err_path = tempfile.mkstemp(dir=self._dir, suffix='.err')
+        os.close(fd_out)
+        os.close(fd_err)
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+                conn.connect(self.sock_path)
+                request = {'script': script, 'stdout': out_path, 'stderr': err_path, 'timeout': timeout,
+                           'limits': list(limits) if limits else None}
+                conn.sendall(json.dumps(request).encode() + b'\n')
+                result = _recv_line(conn)
+            if result is None:
+                raise RuntimeError(f"warm interpreter dropped the request for {script}")
+            for key, path in (('stdout', out_path), ('stderr', err_path)):
+                result[key] = Path(path).read_bytes().decode('utf-8', errors='replace')
+            return result
+        finally:
+            os.unlink(out_path)
+            os.unlink(err_path)
+
+    def close(self):
+        """请求服务进程退出（等待运行中的子进程结束）"""
+        if self.process.poll() is None:
+            try:
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+                    conn.connect(self.sock_path)
+                    conn.sendall(b'{"shutdown": true}\n')
+            except OSError:
+                self.process.kill()
+            self.process.wait(timeout=START_TIMEOUT)
+        self.process.stdout.close()
+        for name in os.listdir(self._dir):
+            os.unlink(os.path.join(self._dir, name))
+        os.rmdir(self._dir)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main():
+    """主函数：--serve 为服务进程；否则比较冷启动与预热的单脚本开销"""
+    if len(sys.argv) > 2 and sys.argv[1] == '--serve':
+        serve(sys.argv[2], tuple(sys.argv[3:]) or PRELOAD)
+        return
+
+    print("预热解释器开销对比")
+    print("=" * 60)
+    with tempfile.TemporaryDirectory() as tmp:
+        script = Path(tmp) / "probe.py"
+        script.write_text("import numpy as np\nimport scipy.linalg\nprint(np.linalg.det(np.eye(3)))\n")
+        start = time.perf_counter()
+        for _ in range(10):
+            subprocess.run([sys.executable, str(script)], capture_output=True, check=True)
+        cold = (time.perf_counter() - start) / 10
+
+        with WarmPool() as pool:
+            start = time.perf_counter()
+            for _ in range(10):
+                result = pool.run(script)
+            warm = (time.perf_counter() - start) / 10
+            print(f"预热模块: {', '.join(pool.preloaded)}")
+        print(f"冷启动 {cold * 1000:.1f} ms/脚本，预热 fork {warm * 1000:.1f} ms/脚本，"
+              f"输出 {result['stdout'].strip()}")
+
+
+if __name__ == "__main__":
+    main()
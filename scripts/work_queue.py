@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""
+共享目录上的分布式工作队列：多台主机/容器共同运行验证脚本与参数扫描分片，无需消息服务
+
+队列就是一个（NFS 等）共享目录：
+
+    pending/<作业>.json             待领取
+    running/<作业>@<工作者>.json    已领取；工作者定时 touch 作为心跳
+    done/<作业>.json                结果（先写临时文件再改名）
+
+领取是把 pending/ 中的文件 os.rename 到 running/，同一文件系统上只有一个工作者能成功。
+running/ 中心跳超过 --stale 秒未更新的作业视为失联，由空闲的工作者同样以改名的方式接管
+（超过 MAX_ATTEMPTS 次则记为失败）。各主机的时钟应大致同步，--stale 要远大于时钟偏差。
+被接管的原工作者若之后仍写出结果，由于种子确定，两份结果相同，后写的覆盖先写的。
+
+作业有两种：
+    script  运行一个验证脚本（冷启动或 --warm），结果与 verify_runner 的 ScriptResult 相同
+    sweep   调用 scripts/ 中的 module:function，对分片中的每个参数值求值
+
+随机性：脚本按 PSI_SEED 与路径派生种子（见 seeding），扫描分片按目标与分片号派生种子，
+所以无论哪个工作者、以什么顺序运行，结果都可复现。
+
+    python3 scripts/work_queue.py submit /shared/q docs/psi-structum --seed 1
+    python3 scripts/work_queue.py sweep /shared/q zeta_dynamics:zeta_tower --range -2 2 0.01 --shard-size 50
+    python3 scripts/work_queue.py work /shared/q --warm          # 每台主机上各启动若干个
+    python3 scripts/work_queue.py merge /shared/q --report distributed_report.json
+"""
+
+import argparse
+import importlib
+import json
+import os
+import signal
+import socket
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+import seeding
+import verify_runner
+from verify_runner import PASSED, FAILED, REPO_ROOT, ScriptResult
+
+HEARTBEAT_INTERVAL = 10.0
+DEFAULT_STALE = 120.0
+POLL_INTERVAL = 2.0
+SWEEP_POLL = 0.01
+MAX_ATTEMPTS = 3
+DEFAULT_SEED = 0
+SUBDIRS = ('pending', 'running', 'done')
+
+
+def _json_default(value):
+    """NumPy 标量/数组与复数转为 JSON 可表示的值"""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, complex):
+        return [value.real, value.imag]
+    if hasattr(value, '_asdict'):
+        return value._asdict()
+    raise TypeError(f"not JSON serializable: {type(value).__name__}")
+
+
+def _write_json(path, data):
+    """原子写入（临时文件 + 改名）"""
+    tmp = path.with_name(f".{path.name}.{socket.gethostname()}.{os.getpid()}.tmp")
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, default=_json_default)
+    os.replace(tmp, path)
+
+
+def _read_json(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def init_queue(directory):
+    """创建队列目录，返回其 Path"""
+    directory = Path(directory)
+    for name in SUBDIRS:
+        (directory / name).mkdir(parents=True, exist_ok=True)
+    return directory
+
+
+def _job_id(index, label):
+    return f"{index:05d}-" + "".join(c if c.isalnum() else '_' for c in label)[-80:]
+
+
+def _next_index(queue):
+    """新作业的起始序号（接在已有作业之后；序号超过五位时照样按整数比较）"""
+    indices = []
+    for sub in SUBDIRS:
+        for path in (queue / sub).glob("*.json"):
+            prefix = path.name.split('-', 1)[0]
+            if prefix.isdigit():
+                indices.append(int(prefix))
+    return max(indices, default=-1) + 1
+
+
+def submit_scripts(directory, scripts, seed=DEFAULT_SEED):
+    """把验证脚本加入队列，返回作业数"""
+    queue = init_queue(directory)
+    start = _next_index(queue)
+    for offset, path in enumerate(scripts):
+        label = seeding.script_label(path)
+        job_id = _job_id(start + offset, label)
+        _write_json(queue / 'pending' / f"{job_id}.json",
+                    {'id': job_id, 'kind': 'script', 'script': label, 'seed': seed, 'attempts': 0})
+    return len(scripts)
+
+
+def submit_sweep(directory, target, values, shard_size, seed=DEFAULT_SEED):
+    """把 target(value) 的参数扫描按 shard_size 分片加入队列，返回分片数"""
+    queue = init_queue(directory)
+    start = _next_index(queue)
+    values = list(values)
+    shards = [values[i:i + shard_size] for i in range(0, len(values), shard_size)]
+    for number, shard in enumerate(shards):
+        job_id = _job_id(start + number, f"{target}-{number}")
+        _write_json(queue / 'pending' / f"{job_id}.json", {
+            'id': job_id, 'kind': 'sweep', 'target': target, 'shard': number,
+            'values': shard, 'seed': seeding.derive_seed(seed, f"{target}#{number}"), 'attempts': 0,
+        })
+    return len(shards)
+
+
+def claim(queue, worker):
+    """领取一个待运行作业，返回 (作业, running 中的路径)；没有时返回 None"""
+    for path in sorted((queue / 'pending').glob("*.json")):
+        target = queue / 'running' / f"{path.stem}@{worker}.json"
+        try:
+            os.rename(path, target)
+        except FileNotFoundError:
+            continue                      # 被别的工作者抢先
+        return _read_json(target), target
+    return None
+
+
+def steal(queue, worker, stale=DEFAULT_STALE):
+    """接管一个心跳超时的作业；次数用尽的作业直接记为失败。返回值同 claim"""
+    now = time.time()
+    for path in sorted((queue / 'running').glob("*.json")):
+        try:
+            if now - path.stat().st_mtime < stale:
+                continue
+        except FileNotFoundError:
+            continue
+        job_id = path.stem.rsplit('@', 1)[0]
+        target = queue / 'running' / f"{job_id}@{worker}.json"
+        try:
+            os.rename(path, target)
+        except FileNotFoundError:
+            continue
+        # 改名不更新 mtime：先刷新心跳，否则别的工作者在改写之前还会把它当作失联再接管一次
+        os.utime(target)
+        job = _read_json(target)
+        job['attempts'] += 1
+        if job['attempts'] >= MAX_ATTEMPTS:
+            _finish(queue, job, target, {'status': FAILED, 'error': f"abandoned after {job['attempts']} attempts"})
+            continue
+        _write_json(target, job)
+        return job, target
+    return None
+
+
+class Heartbeat:
+    """后台线程定时 touch running 文件；文件消失（被接管）时 lost 置位"""
+
+    def __init__(self, path, interval=HEARTBEAT_INTERVAL):
+        self.path = path
+        self.interval = interval
+        self.lost = threading.Event()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._beat, daemon=True)
+
+    def _beat(self):
+        while not self._stop.wait(self.interval):
+            try:
+                os.utime(self.path)
+            except FileNotFoundError:
+                self.lost.set()
+                return
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def _evaluate_shard(job):
+    """对分片逐个调用 target(value)，分片开始前设定种子"""
+    module_name, function_name = job['target'].split(':')
+    function = getattr(importlib.import_module(module_name), function_name)
+    seeding.seed_all(job['seed'])
+    return [function(value) for value in job['values']]
+
+
+def run_sweep(job, timeout=verify_runner.DEFAULT_TIMEOUT):
+    """
+    在 fork 出的子进程中对分片求值，返回结果字典
+
+    子进程把结果写入临时文件；超过 timeout 秒未结束则杀掉并记为超时，
+    这样卡住的分片不会让心跳一直新鲜而永远占住工作者。
+    """
+    fd, out_path = tempfile.mkstemp(suffix='.json')
+    os.close(fd)
+    start = time.perf_counter()
+    pid = os.fork()
+    if pid == 0:
+        code = 0
+        try:
+            result = {'status': PASSED, 'values': job['values'], 'results': _evaluate_shard(job)}
+        except BaseException as exc:
+            result = {'status': FAILED, 'error': repr(exc)}
+            code = 1
+        try:
+            with open(out_path, 'w', encoding='utf-8') as f:
+                json.dump(result, f, ensure_ascii=False, default=_json_default)
+        finally:
+            os._exit(code)
+    try:
+        deadline = start + timeout
+        while True:
+            waited, _ = os.waitpid(pid, os.WNOHANG)
+            if waited:
+                break
+            if time.perf_counter() > deadline:
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+                return {'status': verify_runner.TIMEOUT, 'error': f"shard exceeded {timeout:g}s",
+                        'wall_time': round(time.perf_counter() - start, 4)}
+            time.sleep(SWEEP_POLL)
+        try:
+            result = _read_json(out_path)
+        except (OSError, ValueError):
+            result = {'status': FAILED, 'error': "shard process exited without a result"}
+    finally:
+        os.unlink(out_path)
+    result['wall_time'] = round(time.perf_counter() - start, 4)
+    return result
+
+
+def run_job(job, timeout, warm=None):
+    """运行一个作业，返回结果字典"""
+    if job['kind'] == 'sweep':
+        return run_sweep(job, timeout)
+    path = REPO_ROOT / job['script']
+    if warm is not None:
+        return verify_runner.run_script_warm(path, warm, timeout)._asdict()
+    env = verify_runner.script_env({seeding.SEED_VAR: str(job['seed'])})
+    return verify_runner.run_script(path, timeout, env=env)._asdict()
+
+
+def _finish(queue, job, running_path, result):
+    """写出结果并移除 running 文件（已被接管时文件不存在）"""
+    result.update({'job': job['id'], 'kind': job['kind'], 'seed': job['seed'],
+                   'attempts': job['attempts']})
+    if job['kind'] == 'sweep':
+        result.update(target=job['target'], shard=job['shard'])
+    _write_json(queue / 'done' / f"{job['id']}.json", result)
+    running_path.unlink(missing_ok=True)
+
+
+def work(directory, worker=None, warm=False, timeout=verify_runner.DEFAULT_TIMEOUT, stale=DEFAULT_STALE,
+         seed=DEFAULT_SEED, on_result=None):
+    """
+    工作者主循环：领取或接管作业直到 pending/ 与 running/ 都为空，返回完成的作业数
+
+    warm=True 时脚本作业由本机的预热解释器运行（其 PSI_SEED 取 seed，
+    与提交时的种子不同的作业改为冷启动）。
+    """
+    queue = init_queue(directory)
+    worker = worker or f"{socket.gethostname()}-{os.getpid()}"
+    pool = None
+    if warm:
+        pool = verify_runner.WarmPool(env=verify_runner.script_env({seeding.SEED_VAR: str(seed)}))
+    completed = 0
+    try:
+        while True:
+            claimed = claim(queue, worker) or steal(queue, worker, stale)
+            if claimed is None:
+                if not any((queue / 'running').glob("*.json")):
+                    return completed
+                time.sleep(POLL_INTERVAL)     # 等待运行中的作业完成或失联
+                continue
+            job, path = claimed
+            use_pool = pool if job['kind'] == 'script' and job['seed'] == seed else None
+            with Heartbeat(path) as heartbeat:
+                result = run_job(job, timeout, use_pool)
+            result['worker'] = worker
+            result['stolen'] = heartbeat.lost.is_set()
+            _finish(queue, job, path, result)
+            completed += 1
+            if on_result:
+                on_result(job, result)
+    finally:
+        if pool is not None:
+            pool.close()
+
+
+def status(directory):
+    """各子目录中的作业数"""
+    queue = Path(directory)
+    return {name: len(list((queue / name).glob("*.json"))) for name in SUBDIRS}
+
+
+def merge(directory, report_path=None):
+    """
+    合并 done/ 中的结果为一份报告（脚本结果格式同 verify_runner 的报告）
+
+    扫描分片按目标合并为有序的 (value, result) 列表。
+    """
+    queue = Path(directory)
+    scripts, sweeps, failed_shards = [], {}, []
+    for path in sorted((queue / 'done').glob("*.json")):
+        entry = _read_json(path)
+        if entry['kind'] == 'sweep':
+            if entry['status'] != PASSED:
+                failed_shards.append(entry)
+                continue
+            sweeps.setdefault(entry['target'], []).append(entry)
+        elif 'script' in entry:
+            scripts.append(entry)
+        else:
+            failed_shards.append(entry)
+    results = [ScriptResult(**{k: v for k, v in e.items() if k in ScriptResult._fields}) for e in scripts]
+    report = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'queue': status(queue),
+        'workers': sorted({e.get('worker', '?') for e in scripts}),
+        'wall_time': round(sum(r.wall_time for r in results), 3),
+        'summary': verify_runner.summarize(results),
+        'results': [dict(r._asdict(), worker=e.get('worker'), seed=e['seed']) for r, e in zip(results, scripts)],
+        'sweeps': {target: [{'value': v, 'result': r}
+                            for shard in sorted(shards, key=lambda e: e['shard'])
+                            for v, r in zip(shard['values'], shard['results'])]
+                   for target, shards in sweeps.items()},
+        'failed': failed_shards,
+    }
+    if report_path:
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=1, default=_json_default)
+    return report
+
+
+def _print_job(job, result):
+    mark = '✅' if result['status'] == PASSED else '❌'
+    name = job.get('script') or f"{job['target']} #{job['shard']}"
+    print(f"{mark} {result.get('wall_time', 0):7.2f}s  {name}", flush=True)
+
+
+def main(argv=None):
+    """命令行：submit / sweep / work / status / merge"""
+    parser = argparse.ArgumentParser(description="共享目录上的分布式验证队列")
+    sub = parser.add_subparsers(dest='command', required=True)
+    p = sub.add_parser('submit', help="把验证脚本加入队列")
+    p.add_argument('queue')
+    p.add_argument('paths', nargs='*')
+    p.add_argument('-k', dest='keyword')
+    p.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    p = sub.add_parser('sweep', help="把 module:function 的参数扫描分片加入队列")
+    p.add_argument('queue')
+    p.add_argument('target', help="scripts/ 中的 module:function")
+    values = p.add_mutually_exclusive_group(required=True)
+    values.add_argument('--values', help="JSON 数组")
+    values.add_argument('--range', nargs=3, type=float, metavar=('START', 'STOP', 'STEP'))
+    p.add_argument('--shard-size', type=int, default=32)
+    p.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    p = sub.add_parser('work', help="领取并运行作业，直到队列为空")
+    p.add_argument('queue')
+    p.add_argument('--worker', help="工作者名（默认 主机名-pid）")
+    p.add_argument('--warm', action='store_true', help="脚本作业由预热解释器运行")
+    p.add_argument('--timeout', type=float, default=verify_runner.DEFAULT_TIMEOUT, help="每个作业的超时（秒）")
+    p.add_argument('--stale', type=float, default=DEFAULT_STALE, help="心跳超时（秒），超时的作业被接管")
+    p.add_argument('--seed', type=int, default=DEFAULT_SEED, help="预热解释器使用的基础种子")
+    p = sub.add_parser('status', help="各状态的作业数")
+    p.add_argument('queue')
+    p = sub.add_parser('merge', help="合并结果")
+    p.add_argument('queue')
+    p.add_argument('--report', default='distributed_report.json')
+    args = parser.parse_args(argv)
+
+    if args.command == 'submit':
+        scripts = verify_runner.discover(args.paths or verify_runner.DEFAULT_ROOTS, keyword=args.keyword)
+        print(f"加入 {submit_scripts(args.queue, scripts, args.seed)} 个脚本作业")
+    elif args.command == 'sweep':
+        grid = json.loads(args.values) if args.values else np.arange(*args.range).round(12).tolist()
+        print(f"加入 {submit_sweep(args.queue, args.target, grid, args.shard_size, args.seed)} 个分片"
+              f"（共 {len(grid)} 个参数值）")
+    elif args.command == 'work':
+        done = work(args.queue, args.worker, args.warm, args.timeout, args.stale, args.seed, _print_job)
+        print(f"完成 {done} 个作业")
+    elif args.command == 'status':
+        print("  ".join(f"{name} {count}" for name, count in status(args.queue).items()))
+    else:
+        report = merge(args.queue, args.report)
+        summary = report['summary']
+        print(f"脚本：通过 {summary[PASSED]}，失败 {summary[FAILED]}，超时 {summary[verify_runner.TIMEOUT]}；"
+              f"扫描 {len(report['sweeps'])} 个目标，失败分片 {len(report['failed'])}；"
+              f"队列 {report['queue']}，报告: {args.report}")
+        return 0 if not report['queue']['pending'] and not report['queue']['running'] else 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Zeckendorf 批量编解码器
+
+与 verify_zeta_equivalence.py 的黄金路径约定一致：
+第i位对应 F_{i+2} (1, 2, 3, 5, 8, ...)，第0位是最小的斐波那契数。
+
+编码结果是按行打包的位矩阵 (np.packbits, bitorder='little')：
+每个整数占一行 ceil(width/8) 个字节，第i位在第 i//8 个字节的第 i%8 位。
+
+超出 int64 的整数（SI常数、普朗克尺度计数等）走单个大整数分解，
+使用按需增长的缓存斐波那契表与二分查找，每一位 O(log n)。
+"""
+
+from bisect import bisect_right
+
+import numpy as np
+
+# F_2 .. F_92：F_92 是不超过 int64 上限的最大斐波那契数
+FIB_TABLE = [1, 2]
+while FIB_TABLE[-1] + FIB_TABLE[-2] <= np.iinfo(np.int64).max:
+    FIB_TABLE.append(FIB_TABLE[-1] + FIB_TABLE[-2])
+_FIB_ARRAY = np.array(FIB_TABLE, dtype=np.int64)
+
+MAX_WIDTH = len(FIB_TABLE)
+
+
+def zeckendorf_width(max_value):
+    """表示 0..max_value 所需的位数"""
+    return int(np.searchsorted(_FIB_ARRAY, max_value, side='right'))
+
+
+def zeckendorf_encode(values, width=None):
+    """
+    把非负 int64 数组编码成打包位矩阵
+
+    向量化贪心：从最高位往下，余数 ≥ F_{i+2} 的行置位并减去。
+    返回 (打包矩阵, width)。
+    """
+    values = np.asarray(values, dtype=np.int64).ravel()
+    if values.size and values.min() < 0:
+        raise ValueError("Zeckendorf 编码只接受非负整数")
+    if width is None:
+        width = zeckendorf_width(values.max()) if values.size else 0
+    if width > MAX_WIDTH:
+        raise ValueError(f"width 不能超过 {MAX_WIDTH}")
+    if values.size and width < MAX_WIDTH and values.max() >= _FIB_ARRAY[width]:
+        raise ValueError(f"{width} 位无法表示 {values.max()}")
+
+    packed = np.zeros(((width + 7) // 8, values.size), dtype=np.uint8)
+    remaining = values.copy()
+    for i in range(width - 1, -1, -1):
+        take = remaining >= _FIB_ARRAY[i]
+        remaining -= take * _FIB_ARRAY[i]
+        packed[i >> 3] |= take.view(np.uint8) << np.uint8(i & 7)
+    return np.ascontiguousarray(packed.T), width
+
+
+def zeckendorf_decode(packed, width):
+    """打包位矩阵还原成 int64 数组"""
+    columns = np.asarray(packed, dtype=np.uint8).T.copy()
+    values = np.zeros(columns.shape[1], dtype=np.int64)
+    for i in range(width):
+        bit = (columns[i >> 3] >> np.uint8(i & 7)) & np.uint8(1)
+        values += bit * _FIB_ARRAY[i]
+    return values
+
+
+def zeckendorf_is_valid(packed, width):
+    """逐行检查黄金约束：相邻位不能同时为1"""
+    columns = np.asarray(packed, dtype=np.uint8).T.copy()
+    clash = np.zeros(columns.shape[1], dtype=np.uint8)
+    prev = np.zeros(columns.shape[1], dtype=np.uint8)
+    for i in range(width):
+        bit = (columns[i >> 3] >> np.uint8(i & 7)) & np.uint8(1)
+        clash |= prev & bit
+        prev = bit
+    return clash == 0
+
+
+def zeckendorf_bits(values, width=None):
+    """未打包的 (个数, width) uint8 位矩阵，列i对应 F_{i+2}"""
+    packed, width = zeckendorf_encode(values, width)
+    return np.unpackbits(packed, axis=1, count=width, bitorder='little')
+
+
+# 大整数分解用的斐波那契表：_BIG_FIB[j] = F_{j+2}，按需增长，进程内共享
+_BIG_FIB = list(FIB_TABLE)
+
+
+def _grow_fib(limit):
+    """把缓存表扩展到最后一项大于 limit"""
+    while _BIG_FIB[-1] <= limit:
+        _BIG_FIB.append(_BIG_FIB[-1] + _BIG_FIB[-2])
+
+
+def zeckendorf_indices(n):
+    """
+    任意大小正整数的 Zeckendorf 分解
+
+    返回斐波那契下标 k (n = Σ F_k, k ≥ 2，两两不相邻) 的降序 int32 数组。
+    每一位用 bisect 在缓存表中定位，搜索上界随已选下标收缩。
+    """
+    n = int(n)
+    if n < 0:
+        raise ValueError("Zeckendorf 分解只接受非负整数")
+    _grow_fib(n)
+    indices = []
+    remaining = n
+    hi = len(_BIG_FIB)
+    while remaining:
+        j = bisect_right(_BIG_FIB, remaining, 0, hi) - 1
+        indices.append(j + 2)
+        remaining -= _BIG_FIB[j]
+        hi = j - 1  # 下一项不能相邻
+    return np.array(indices, dtype=np.int32)
+
+
+def zeckendorf_terms(n):
+    """Zeckendorf 分解的各项斐波那契数（Python 整数，降序）"""
+    return [_BIG_FIB[k - 2] for k in zeckendorf_indices(n).tolist()]
+
+
+def verify_range(start, stop, chunk_size=1 << 20):
+    """
+    分块验证 [start, stop) 内的双射与黄金约束
+
+    返回 (出错个数, 检查个数)。
+    """
+    width = zeckendorf_width(stop - 1)
+    errors = 0
+    for lo in range(start, stop, chunk_size):
+        values = np.arange(lo, min(lo + chunk_size, stop), dtype=np.int64)
+        packed, _ = zeckendorf_encode(values, width)
+        errors += int(np.count_nonzero(zeckendorf_decode(packed, width) != values))
+        errors += int(np.count_nonzero(~zeckendorf_is_valid(packed, width)))
+    return errors, stop - start
+
+
+def main():
+    """主函数：批量双射验证"""
+    print("Zeckendorf 批量编解码器")
+    print("=" * 60)
+    bits = zeckendorf_bits(np.arange(1, 11))
+    for n, row in zip(range(1, 11), bits):
+        print(f"{n:2d} -> {''.join(map(str, row))}")
+
+    errors, checked = verify_range(1, 10**7)
+    status = '✅' if errors == 0 else '❌'
+    print(f"\n检查 {checked} 个整数，错误 {errors} 个 {status}")
+
+    big = 10**120 + 7
+    indices = zeckendorf_indices(big)
+    assert sum(zeckendorf_terms(big)) == big
+    assert np.all(np.diff(indices) <= -2)
+    print(f"\n10^120 + 7 共 {len(indices)} 项，最大下标 F_{indices[0]}")
+
+
+if __name__ == "__main__":
+    main()
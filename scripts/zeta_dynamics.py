@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+复平面上 ζ 的不动点 ψ = ζ(ψ)
+
+对 f(s) = s - ζ(s) 在稠密的复网格起点上同时做牛顿迭代，ζ 与 ζ' 来自
+zeta_engine 的 Euler–Maclaurin 求值。网格按行切块，在进程池中并行。
+
+已找到的根 r_j 用除法收缩 (deflation) 消去：对 g(s) = f(s) / Π(s - r_j)
+迭代，步长 g/g' = f / (f' - f Σ 1/(s - r_j))，未收敛的起点由此转向新根。
+结果是不动点集合与吸引域栅格（每个起点收敛到的根的编号，-1 表示未收敛）。
+
+迭代塔 ζ^[n](s) 对整块网格同时迭代，每步把已收敛、发散或进入周期 p
+（|ζ^[n] - ζ^[n-p]| < tol，p ≤ max_period）的点移出活动集，并沿途累加
+第040章的迭代比之和 Σ_{k≤n} ρ_k（ρ_k = ζ^[k]/ζ^[k-1]，除以步数即平均迭代比）与复杂度
+C_n = Σ_k log|ζ^[k]'(s)|/k!，其中 ζ^[k]' = Π_{j<k} ζ'(ζ^[j](s))。
+"""
+
+import sys
+from collections import namedtuple
+from math import factorial
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from zeta_engine import zeta_and_derivative
+
+PHI = (1 + 5 ** 0.5) / 2
+ESCAPE_RADIUS = 60.0
+POLE_GUARD = 1e-6
+
+FixedPointMap = namedtuple('FixedPointMap', 'roots basins iterations re_axis im_axis')
+ZetaTower = namedtuple('ZetaTower', 'values status period steps ratio_sum complexity re_axis im_axis')
+
+# 迭代塔中每个点的状态
+RUNNING, CONVERGED, DIVERGED, CYCLE = 0, 1, 2, 3
+
+
+def newton_fixed_points(starts, known_roots=(), max_iter=60, tol=1e-12):
+    """
+    从一批起点出发求 s = ζ(s)，可对 known_roots 做除法收缩
+
+    返回 (终点, 是否收敛, 迭代次数)。逃逸出 ESCAPE_RADIUS、
+    落到极点 s = 1 附近或出现 nan 的点标记为未收敛并停止迭代。
+    """
+    s = np.array(starts, dtype=np.complex128).ravel()
+    roots = np.asarray(known_roots, dtype=np.complex128)
+    active = np.ones(s.shape, dtype=bool)
+    converged = np.zeros(s.shape, dtype=bool)
+    iterations = np.zeros(s.shape, dtype=np.int16)
+
+    for it in range(1, max_iter + 1):
+        idx = np.flatnonzero(active)
+        if not len(idx):
+            break
+        z = s[idx]
+        value, derivative = zeta_and_derivative(z)
+        f = z - value
+        df = 1 - derivative
+        if roots.size:
+            df = df - f * (1 / (z[:, None] - roots[None, :])).sum(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            step = f / df
+        z = z - step
+        s[idx] = z
+        iterations[idx] = it
+
+        done = np.abs(step) < tol * (1 + np.abs(z))
+        lost = (~np.isfinite(z) | (np.abs(z) > ESCAPE_RADIUS)
+                | (np.abs(z - 1) < POLE_GUARD))
+        converged[idx[done & ~lost]] = True
+        active[idx[done | lost]] = False
+
+    return s.reshape(np.shape(starts)), converged.reshape(np.shape(starts)), \
+        iterations.reshape(np.shape(starts))
+
+
+def _tile_job(args):
+    """进程池任务：一块网格行"""
+    starts, known_roots, max_iter, tol = args
+    return newton_fixed_points(starts, known_roots, max_iter, tol)
+
+
+def _map_tiles(job, tasks, workers):
+    """按顺序返回各块结果；workers=1 时在本进程内计算，便于在模块级代码中直接调用"""
+    if workers == 1:
+        yield from map(job, tasks)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(job, tasks)
+
+
+def zeta_tower(starts, max_iter=64, tol=1e-10, max_period=8, escape=ESCAPE_RADIUS):
+    """
+    对一批起点同时迭代 ζ，返回 (终值, 状态, 周期, 步数, Σρ_k, C_n)
+
+    状态为 RUNNING/CONVERGED/DIVERGED/CYCLE；周期对收敛点为 1，对循环点为
+    最小的 p ≥ 2，其余为 0。逃逸出 escape、落到极点附近或出现 nan 计为发散。
+    """
+    z = np.array(starts, dtype=np.complex128).ravel()
+    size = z.size
+    status = np.zeros(size, dtype=np.int8)
+    period = np.zeros(size, dtype=np.int8)
+    steps = np.zeros(size, dtype=np.int16)
+    ratio_sum = np.zeros(size, dtype=np.complex128)
+    complexity = np.zeros(size, dtype=np.float64)
+    log_chain = np.zeros(size, dtype=np.float64)   # log|ζ^[k]'(s)|
+    # 最近 max_period 个迭代值的环形缓冲，history[k % max_period] = ζ^[k]
+    history = np.full((max_period, size), np.nan, dtype=np.complex128)
+    history[0] = z
+
+    active = np.arange(size)
+    for n in range(1, max_iter + 1):
+        if not len(active):
+            break
+        prev = z[active]
+        value, derivative = zeta_and_derivative(prev)
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            log_chain[active] += np.log(np.abs(derivative))
+            complexity[active] += log_chain[active] / factorial(n)
+            ratio_sum[active] += value / prev
+        z[active] = value
+        steps[active] = n
+
+        lost = (~np.isfinite(value) | (np.abs(value) > escape)
+                | (np.abs(value - 1) < POLE_GUARD))
+        found = np.zeros(len(active), dtype=np.int8)
+        scale = tol * (1 + np.abs(value))
+        # 周期 p ≥ 2 要求环上各点彼此分开，否则只是绕不动点振荡收敛
+        gap = np.full(len(active), np.inf)
+        for p in range(1, min(n, max_period) + 1):
+            back = history[(n - p) % max_period, active]
+            distance = np.abs(value - back)
+            hit = (found == 0) & ~lost & (distance < scale) & ((p == 1) | (gap > np.sqrt(scale)))
+            found[hit] = p
+            gap = np.minimum(gap, distance)
+        history[n % max_period, active] = value
+
+        status[active[lost]] = DIVERGED
+        status[active[found == 1]] = CONVERGED
+        status[active[found > 1]] = CYCLE
+        period[active] = found
+        active = active[~lost & (found == 0)]
+
+    shape = np.shape(starts)
+    return tuple(a.reshape(shape) for a in (z, status, period, steps, ratio_sum, complexity))
+
+
+def _tower_job(args):
+    """进程池任务：一块网格行的迭代塔"""
+    starts, max_iter, tol, max_period, escape = args
+    return zeta_tower(starts, max_iter, tol, max_period, escape)
+
+
+def zeta_tower_map(re_range=(-3.0, 3.0), im_range=(-3.0, 3.0), resolution=(1024, 1024),
+                   max_iter=64, tol=1e-10, max_period=8, escape=ESCAPE_RADIUS,
+                   workers=None, tile_rows=32):
+    """
+    矩形网格上的迭代塔：状态图、周期图（奇异环）、Σρ_k 与 C_n 栅格
+
+    网格按 tile_rows 行一块分给进程池，内存只与块大小和 max_period 有关。
+    """
+    rows, cols = resolution
+    re_axis = np.linspace(re_range[0], re_range[1], cols)
+    im_axis = np.linspace(im_range[0], im_range[1], rows)
+    tasks = [(re_axis[None, :] + 1j * im_axis[r:r + tile_rows, None], max_iter, tol, max_period, escape)
+             for r in range(0, rows, tile_rows)]
+    parts = list(zip(*_map_tiles(_tower_job, tasks, workers)))
+    return ZetaTower(*(np.concatenate(p) for p in parts), re_axis, im_axis)
+
+
+def _merge_roots(roots, candidates, tol):
+    """把新收敛的点合并进根表，返回 (根表, 每个候选的根编号)"""
+    labels = np.empty(len(candidates), dtype=np.int32)
+    roots = list(roots)
+    for i, z in enumerate(candidates):
+        for j, r in enumerate(roots):
+            if abs(z - r) < tol * (1 + abs(r)):
+                labels[i] = j
+                break
+        else:
+            roots.append(z)
+            labels[i] = len(roots) - 1
+    return roots, labels
+
+
+def zeta_fixed_points(re_range=(1 / PHI, PHI), im_range=(-3.0, 3.0), resolution=(256, 256),
+                      max_iter=60, tol=1e-12, deflation_rounds=3, workers=None, tile_rows=16):
+    """
+    在矩形区域的网格起点上求全部不动点与吸引域
+
+    resolution 为 (Im 方向行数, Re 方向列数)。第一轮普通牛顿确定主要的根；
+    之后每轮对未收敛的起点用已知根做除法收缩，直到没有新根。
+    workers=1 时不启动进程池。
+    """
+    rows, cols = resolution
+    re_axis = np.linspace(re_range[0], re_range[1], cols)
+    im_axis = np.linspace(im_range[0], im_range[1], rows)
+    grid = re_axis[None, :] + 1j * im_axis[:, None]
+
+    basins = np.full(grid.shape, -1, dtype=np.int32)
+    iterations = np.zeros(grid.shape, dtype=np.int16)
+    roots = []
+    merge_tol = 1e3 * tol
+
+    pending = np.ones(grid.shape, dtype=bool)
+    for _ in range(deflation_rounds + 1):
+        idx = np.flatnonzero(pending)
+        if not len(idx):
+            break
+        known = np.array(roots, dtype=np.complex128)
+        tiles = [idx[i:i + tile_rows * cols] for i in range(0, len(idx), tile_rows * cols)]
+        jobs = [(grid.ravel()[t], known, max_iter, tol) for t in tiles]
+        found_new = False
+        for t, (final, ok, its) in zip(tiles, _map_tiles(_tile_job, jobs, workers)):
+            iterations.ravel()[t] += its
+            before = len(roots)
+            roots, labels = _merge_roots(roots, final[ok], merge_tol)
+            found_new = found_new or len(roots) > before
+            basins.ravel()[t[ok]] = labels
+            pending.ravel()[t[ok]] = False
+        if not found_new:
+            break
+
+    return FixedPointMap(np.array(roots, dtype=np.complex128), basins, iterations, re_axis, im_axis)
+
+
+def main():
+    """主函数：1/φ < Re(s) < φ 区域、实轴附近的不动点以及迭代塔"""
+    print("ψ = ζ(ψ) 的复平面不动点")
+    print("=" * 60)
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 96
+    for re_range, im_range in [((1 / PHI, PHI), (-3.0, 3.0)), ((1.1, 3.0), (-1.0, 1.0))]:
+        result = zeta_fixed_points(re_range, im_range, resolution=(size, size))
+        print(f"\nRe ∈ [{re_range[0]:.3f}, {re_range[1]:.3f}], Im ∈ [{im_range[0]}, {im_range[1]}]")
+        for k, r in enumerate(result.roots):
+            share = np.mean(result.basins == k)
+            print(f"  ψ_{k} = {r.real:+.12f} {r.imag:+.12f}i  吸引域占比 {share:.3f}")
+        print(f"  未收敛起点占比 {np.mean(result.basins < 0):.3f}")
+
+    print("\n迭代塔 ζ^[n](s)，Re, Im ∈ [-3, 3]")
+    tower = zeta_tower_map(resolution=(size, size))
+    for code, label in [(CONVERGED, "收敛"), (DIVERGED, "发散"), (CYCLE, "周期"), (RUNNING, "未定")]:
+        print(f"  {label}: {np.mean(tower.status == code):.3f}")
+    for p in np.unique(tower.period[tower.status == CYCLE]):
+        print(f"  周期 {p}: {np.sum(tower.period == p)} 个点")
+    fixed = tower.status == CONVERGED
+    if fixed.any():
+        mean_ratio = tower.ratio_sum[fixed] / tower.steps[fixed]
+        print(f"  收敛点的平均 ρ_k 中位数 {np.median(mean_ratio.real):+.6f}，"
+              f"C_n 中位数 {np.median(tower.complexity[fixed]):+.6f}")
+
+
+if __name__ == "__main__":
+    main()
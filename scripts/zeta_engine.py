@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+加速的 ζ 函数求值器（Euler–Maclaurin 尾项修正）
+
+ζ(s) = Σ_{n<N} n^(-s) + N^(1-s)/(s-1) + N^(-s)/2
+       + Σ_{k=1}^{M} B_{2k}/(2k)! · s(s+1)…(s+2k-2) · N^(-s-2k+1)
+
+部分和按 NumPy 块计算（n 块 × s 块的外积，元素数不超过 DEFAULT_BUDGET），尾项对所有 s 一次算完。
+公式对 s ≠ 1 的整个复平面成立，包括临界带 0 < Re(s) < 1。
+取 N ≥ max(32, |s|)、M = 16 时相邻修正项之比不超过约 1/π²，
+中等 |s| 下误差在 1e-15 量级（大 |Im s| 时受部分和舍入限制，约 1e-13），
+只需几千项而不是直接求和的数十亿项。
+"""
+
+from fractions import Fraction
+from math import factorial
+
+import numpy as np
+
+DEFAULT_CHUNK = 1 << 14
+# 部分和一块中 n×s 元素个数的上限（complex128 约 64 MB）
+DEFAULT_BUDGET = 1 << 22
+EM_ORDER = 16
+MIN_TERMS = 32
+
+
+def bernoulli_even(m):
+    """B_2, B_4, ..., B_2m（Akiyama–Tanigawa 算法，精确有理数）"""
+    size = 2 * m + 1
+    a = [Fraction(0)] * (size + 1)
+    numbers = []
+    for n in range(size + 1):
+        a[n] = Fraction(1, n + 1)
+        for j in range(n, 0, -1):
+            a[j - 1] = j * (a[j - 1] - a[j])
+        numbers.append(a[0])
+    return [numbers[2 * k] for k in range(1, m + 1)]
+
+
+# B_{2k}/(2k)!，k = 1..EM_ORDER
+_EM_COEFFS = [float(b / factorial(2 * k)) for k, b in enumerate(bernoulli_even(EM_ORDER), start=1)]
+
+
+def terms_needed(s):
+    """给定 s 数组所需的部分和项数 N"""
+    s = np.asarray(s, dtype=np.complex128)
+    return max(MIN_TERMS, int(np.ceil(np.abs(s).max(initial=0.0))))
+
+
+def partial_sum(s, start, stop, weights=None, chunk=DEFAULT_CHUNK, budget=DEFAULT_BUDGET):
+    """
+    Σ_{n=start}^{stop-1} a(n)·n^(-s)，s 可为数组
+
+    weights(n) 接收整数块返回系数块，缺省 a(n) = 1。n 按 chunk 分块、s 按
+    budget // len(n块) 分块，逐块累加，单块外积不超过 budget 个元素。
+    """
+    s = np.asarray(s, dtype=np.complex128)
+    flat = s.ravel()
+    total = np.zeros(flat.shape, dtype=np.complex128)
+    chunk = max(1, min(chunk, budget))
+    for lo in range(start, stop, chunk):
+        n = np.arange(lo, min(lo + chunk, stop), dtype=np.float64)
+        log_n = np.log(n)
+        coeffs = None if weights is None else np.asarray(weights(n.astype(np.int64)), dtype=np.complex128)
+        step = max(1, budget // len(n))
+        for j in range(0, len(flat), step):
+            terms = np.exp(-np.outer(log_n, flat[j:j + step]))
+            if coeffs is None:
+                total[j:j + step] += terms.sum(axis=0)
+            else:
+                total[j:j + step] += coeffs @ terms
+    return total.reshape(s.shape)
+
+
+def euler_maclaurin_tail(s, N, order=EM_ORDER):
+    """Σ_{n≥N} n^(-s) 的 Euler–Maclaurin 展开（解析延拓意义下）"""
+    s = np.asarray(s, dtype=np.complex128)
+    log_n = np.log(N)
+    power = np.exp(-s * log_n)               # N^(-s)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        tail = N * power / (s - 1) + power / 2
+    rising = s.copy()                        # s(s+1)…(s+2k-2)
+    power = power / N                        # N^(-s-1)
+    for k, coeff in enumerate(_EM_COEFFS[:order], start=1):
+        tail = tail + coeff * rising * power
+        rising = rising * (s + 2 * k - 1) * (s + 2 * k)
+        power = power / (N * N)
+    return tail
+
+
+def euler_maclaurin_tail_derivative(s, N, order=EM_ORDER):
+    """尾项对 s 的导数，逐项求导（N^(-s) 的导数是 -log N · N^(-s)）"""
+    s = np.asarray(s, dtype=np.complex128)
+    log_n = np.log(N)
+    power = np.exp(-s * log_n)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        d_tail = -log_n * N * power / (s - 1) - N * power / (s - 1) ** 2 - log_n * power / 2
+    rising = s.copy()
+    d_rising = np.ones_like(s)
+    power = power / N
+    for k, coeff in enumerate(_EM_COEFFS[:order], start=1):
+        d_tail = d_tail + coeff * (d_rising - log_n * rising) * power
+        a, b = s + 2 * k - 1, s + 2 * k
+        d_rising = d_rising * a * b + rising * (a + b)
+        rising = rising * a * b
+        power = power / (N * N)
+    return d_tail
+
+
+def zeta_and_derivative(s, n_terms=None, chunk=DEFAULT_CHUNK):
+    """同时返回 ζ(s) 与 ζ'(s)（复数组），供牛顿迭代使用"""
+    s_arr = np.asarray(s, dtype=np.complex128)
+    N = n_terms or terms_needed(s_arr)
+    value = partial_sum(s_arr, 1, N, chunk=chunk) + euler_maclaurin_tail(s_arr, N)
+    derivative = (partial_sum(s_arr, 1, N, weights=lambda n: -np.log(n), chunk=chunk)
+                  + euler_maclaurin_tail_derivative(s_arr, N))
+    return value, derivative
+
+
+def zeta(s, n_terms=None, chunk=DEFAULT_CHUNK):
+    """
+    黎曼 ζ(s)，s 为标量或（复）数组
+
+    实数输入返回实数；s = 1 处返回 inf。
+    """
+    is_real = np.isrealobj(s)
+    s_arr = np.asarray(s, dtype=np.complex128)
+    N = n_terms or terms_needed(s_arr)
+    value = partial_sum(s_arr, 1, N, chunk=chunk) + euler_maclaurin_tail(s_arr, N)
+    value = np.where(s_arr == 1, np.inf, value)
+    if is_real:
+        value = value.real
+    return value[()] if value.ndim == 0 else value
+
+
+def main():
+    """主函数：与已知值比较"""
+    print("加速ζ函数求值器 (Euler–Maclaurin)")
+    print("=" * 60)
+    known = [
+        (2.0, np.pi ** 2 / 6, "π²/6"),
+        (4.0, np.pi ** 4 / 90, "π⁴/90"),
+        (0.5, -1.4603545088095868, "ζ(1/2)"),
+        (0.0, -0.5, "-1/2"),
+        (-1.0, -1 / 12, "-1/12"),
+    ]
+    s_values = np.array([s for s, _, _ in known])
+    values = zeta(s_values)
+    for (s, exact, label), value in zip(known, values):
+        print(f"ζ({s:4.1f}) = {value:+.16f}  ({label}，误差 {abs(value - exact):.1e})")
+
+    rho = 0.5 + 14.134725141734693j
+    print(f"\n|ζ(1/2 + 14.1347i)| = {abs(zeta(rho)):.2e}  (第一个非平凡零点)")
+
+    grid = (np.linspace(0.05, 0.95, 181)[:, None]
+            + 1j * np.linspace(0, 100, 2001)[None, :])
+    values = zeta(grid)
+    print(f"临界带网格 {grid.size} 个点，N = {terms_needed(grid)}，"
+          f"min|ζ| = {np.abs(values).min():.3e}")
+
+
+if __name__ == "__main__":
+    main()
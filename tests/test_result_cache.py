@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+result_cache 的单元测试：键的组成、本地模块查找顺序与按修改时间淘汰
+
+    python3 -m unittest discover tests
+"""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+import seeding
+from result_cache import SHARED_DIR, ResultCache, cache_key, local_dependencies
+
+
+class TestCacheKey(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.dir = Path(self._tmp.name)
+        self.helper = self.dir / "local_helper_for_key.py"
+        self.helper.write_text("VALUE = 1\n")
+        self.script = self.dir / "verify_key.py"
+        self.script.write_text("import local_helper_for_key\nprint(local_helper_for_key.VALUE)\n")
+
+    def test_stable_for_same_inputs(self):
+        self.assertEqual(cache_key(self.script, {}), cache_key(self.script, {}))
+
+    def test_seed_is_part_of_key(self):
+        unseeded = cache_key(self.script, {})
+        seeded = cache_key(self.script, {seeding.SEED_VAR: "1"})
+        self.assertNotEqual(unseeded, seeded)
+        self.assertNotEqual(seeded, cache_key(self.script, {seeding.SEED_VAR: "2"}))
+        self.assertEqual(seeded, cache_key(self.script, {seeding.SEED_VAR: "1", 'UNRELATED': "x"}))
+
+    def test_script_and_dependency_sources(self):
+        self.assertEqual(local_dependencies(self.script), [self.helper.resolve()])
+        before = cache_key(self.script, {})
+        self.helper.write_text("VALUE = 2\n")
+        after_dependency = cache_key(self.script, {})
+        self.assertNotEqual(before, after_dependency)
+        self.script.write_text(self.script.read_text() + "# edited\n")
+        self.assertNotEqual(after_dependency, cache_key(self.script, {}))
+
+    def test_path_is_part_of_key(self):
+        copy = self.dir / "other" / self.script.name
+        copy.parent.mkdir()
+        copy.write_bytes(self.script.read_bytes())
+        (copy.parent / self.helper.name).write_bytes(self.helper.read_bytes())
+        self.assertNotEqual(cache_key(self.script, {}), cache_key(copy, {}))
+
+    def test_shared_dir_shadows_script_directory(self):
+        # verify 脚本把 scripts/ 插在 sys.path 最前，同名模块以 scripts/ 中的为准
+        (self.dir / "seeding.py").write_text("SEED_VAR = 'shadowed'\n")
+        self.script.write_text("import seeding\n")
+        self.assertEqual(local_dependencies(self.script), [(SHARED_DIR / "seeding.py").resolve()])
+
+
+class TestResultCache(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.cache = ResultCache(self._tmp.name, max_bytes=10**6)
+
+    def test_put_get_roundtrip(self):
+        self.assertIsNone(self.cache.get("ab" + "0" * 62))
+        entry = {'script': 'verify_x.py', 'status': 'passed', 'stdout': 'φ ≈ 1.618'}
+        self.cache.put("ab" + "0" * 62, entry)
+        self.assertEqual(self.cache.get("ab" + "0" * 62), entry)
+        self.assertEqual(len(self.cache.entries()), 1)
+
+    def test_corrupt_entry_is_a_miss(self):
+        key = "cd" + "1" * 62
+        self.cache.put(key, {'status': 'passed'})
+        self.cache._path(key).write_text("{not json")
+        self.assertIsNone(self.cache.get(key))
+
+    def test_evict_removes_least_recently_used(self):
+        keys = [f"{i:02d}" + "f" * 62 for i in range(3)]
+        now = time.time()
+        for age, key in zip((300, 200, 100), keys):
+            self.cache.put(key, {'payload': 'x' * 1000})
+            os.utime(self.cache._path(key), (now - age, now - age))
+        # 命中会刷新修改时间：最旧的条目变为最新
+        self.assertIsNotNone(self.cache.get(keys[0]))
+        size = self.cache._path(keys[0]).stat().st_size
+        self.cache.max_bytes = 2 * size
+        self.assertEqual(self.cache.evict(), 1)
+        self.assertIsNone(self.cache.get(keys[1]))
+        self.assertIsNotNone(self.cache.get(keys[0]))
+        self.assertIsNotNone(self.cache.get(keys[2]))
+
+    def test_evict_within_budget_keeps_everything(self):
+        self.cache.put("ee" + "2" * 62, {'status': 'passed'})
+        self.assertEqual(self.cache.evict(), 0)
+        self.cache.clear()
+        self.assertEqual(self.cache.entries(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
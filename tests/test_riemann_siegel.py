@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+riemann_siegel 的单元测试：零点搜索结果与分段大小无关
+
+    python3 -m unittest discover tests
+"""
+
+import contextlib
+import io
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+import riemann_siegel
+
+
+class TestFindZeros(unittest.TestCase):
+    # 前 400 个 Gram 区间含第一个坏 Gram 点 g_126 所在的 Rosser 块
+    COUNT = 400
+
+    def find(self, segment):
+        with tempfile.TemporaryDirectory() as tmp:
+            out = Path(tmp) / "zeros.txt"
+            with contextlib.redirect_stdout(io.StringIO()):
+                written, missing = riemann_siegel.find_zeros(self.COUNT, out, workers=1, segment=segment)
+            return written, missing, np.loadtxt(out)
+
+    def test_segment_size_does_not_change_result(self):
+        written, missing, zeros = self.find(1000)
+        self.assertEqual((written, missing), (self.COUNT, 0))
+        for segment in (7, 13, 126):
+            with self.subTest(segment=segment):
+                w, m, z = self.find(segment)
+                self.assertEqual((w, m), (written, missing))
+                np.testing.assert_allclose(z, zeros, rtol=0, atol=1e-9)
+
+    def test_segments_end_on_good_gram_points(self):
+        bounds = riemann_siegel.segment_bounds(self.COUNT, 7)
+        self.assertEqual(bounds[0][0], 0)
+        self.assertGreaterEqual(bounds[-1][1], self.COUNT)
+        self.assertTrue(all(a[1] == b[0] for a, b in zip(bounds[:-1], bounds[1:])))
+        self.assertTrue(riemann_siegel._is_good([n1 - 1 for _, n1 in bounds]).all())
+
+
+if __name__ == '__main__':
+    unittest.main()
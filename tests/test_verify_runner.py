@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+verify_runner 的单元测试：脚本分类、发现、结果组装、超时与汇总
+
+    python3 -m unittest discover tests
+"""
+
+import signal
+import sys
+import tempfile
+import textwrap
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+import sandbox
+import verify_runner
+from result_cache import ResultCache
+from verify_runner import FAILED, PASSED, RESOURCE, TIMEOUT, ScriptResult
+
+
+def _write(path, source):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(textwrap.dedent(source), encoding='utf-8')
+    return path
+
+
+def _process_gone(pid):
+    """进程已不存在，或只剩僵尸（容器中的 init 不一定回收孤儿）"""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().rsplit(')', 1)[1].split()[0] == 'Z'
+    except FileNotFoundError:
+        return True
+
+
+class RunnerTestCase(unittest.TestCase):
+    """在临时目录中建脚本，并把它当作仓库根目录"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name).resolve()
+        patcher = mock.patch.object(verify_runner, 'REPO_ROOT', self.root)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self._tmp.cleanup)
+
+
+class TestScriptKind(RunnerTestCase):
+
+    def test_unittest_suite(self):
+        path = _write(self.root / "verify_a.py", """
+            import unittest
+            class TestA(unittest.TestCase):
+                def test_x(self):
+                    pass
+        """)
+        self.assertEqual(verify_runner.script_kind(path), 'unittest')
+
+    def test_bare_testcase_import(self):
+        path = _write(self.root / "verify_b.py", """
+            from unittest import TestCase
+            class TestB( TestCase ):
+                pass
+        """)
+        self.assertEqual(verify_runner.script_kind(path), 'unittest')
+
+    def test_print_script(self):
+        path = _write(self.root / "verify_c.py", "print('TestCase in a string is not a suite')\n")
+        self.assertEqual(verify_runner.script_kind(path), 'script')
+
+
+class TestDiscover(RunnerTestCase):
+
+    def setUp(self):
+        super().setUp()
+        for name in ("book/verify_chapter_001.py", "book/verify_chapter_002.py",
+                     "book/derive_c_curv.py", "book/helper.py", "book/__pycache__/verify_chapter_003.py"):
+            _write(self.root / name, "print(1)\n")
+
+    def test_default_patterns(self):
+        found = [p.name for p in verify_runner.discover([self.root])]
+        self.assertEqual(found, ["derive_c_curv.py", "verify_chapter_001.py", "verify_chapter_002.py"])
+
+    def test_single_pattern_and_keyword(self):
+        found = verify_runner.discover([self.root], "verify_*.py", keyword="chapter_002")
+        self.assertEqual([p.name for p in found], ["verify_chapter_002.py"])
+
+    def test_predicate_matches_discovery(self):
+        found = set(verify_runner.discover([self.root]))
+        candidates = (self.root / "book").rglob("*.py")
+        self.assertEqual({p for p in candidates if verify_runner.is_verify_script(p)}, found)
+
+    def test_file_roots_are_taken_as_is(self):
+        helper = self.root / "book" / "helper.py"
+        self.assertEqual(verify_runner.discover([helper]), [helper])
+
+
+class TestMakeResult(RunnerTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.path = _write(self.root / "verify_x.py", "print(1)\n")
+
+    def make(self, returncode=0, timed_out=False, cpu=0.1, stderr='', limits=None):
+        return verify_runner._make_result(self.path, returncode, timed_out, 1.23456789, cpu, 2048,
+                                          'out', stderr, limits)
+
+    def test_passed_and_failed(self):
+        result = self.make()
+        self.assertEqual((result.status, result.script, result.kind), (PASSED, "verify_x.py", 'script'))
+        self.assertEqual(result.wall_time, 1.2346)
+        self.assertEqual(self.make(returncode=1).status, FAILED)
+
+    def test_timeout_wins_over_exit_code(self):
+        result = self.make(returncode=-9, timed_out=True, limits=sandbox.Limits(cpu_seconds=1))
+        self.assertEqual(result.status, TIMEOUT)
+        self.assertIsNone(result.exceeded)
+
+    def test_test_count_parsed_from_stderr(self):
+        self.assertEqual(self.make(stderr="....\nRan 4 tests in 0.01s\n\nOK\n").tests, 4)
+        self.assertEqual(self.make(stderr="Ran 1 test in 0.001s\n").tests, 1)
+        self.assertIsNone(self.make().tests)
+
+    def test_resource_limits(self):
+        memory = self.make(returncode=sandbox.EXIT_MEMORY, limits=sandbox.Limits(memory_mb=100))
+        self.assertEqual((memory.status, memory.exceeded), (RESOURCE, sandbox.MEMORY))
+        cpu = self.make(returncode=-signal.SIGXCPU, cpu=2.0, limits=sandbox.Limits(cpu_seconds=2))
+        self.assertEqual((cpu.status, cpu.exceeded), (RESOURCE, sandbox.CPU))
+        # 没有设上限时同样的退出码只是失败
+        self.assertEqual(self.make(returncode=sandbox.EXIT_MEMORY).status, FAILED)
+
+
+class TestRunScript(RunnerTestCase):
+
+    def test_pass_fail_and_output(self):
+        ok = verify_runner.run_script(_write(self.root / "verify_ok.py", "print('hello')\n"), timeout=30)
+        self.assertEqual((ok.status, ok.returncode, ok.stdout), (PASSED, 0, "hello\n"))
+        self.assertEqual((ok.script, ok.kind, ok.tests), ("verify_ok.py", 'script', None))
+        bad = verify_runner.run_script(_write(self.root / "verify_bad.py", "raise SystemExit(2)\n"),
+                                       timeout=30)
+        self.assertEqual((bad.status, bad.returncode), (FAILED, 2))
+
+    def test_runs_in_script_directory(self):
+        path = _write(self.root / "sub" / "verify_cwd.py", "import os; print(os.getcwd())\n")
+        result = verify_runner.run_script(path, timeout=30)
+        self.assertEqual(Path(result.stdout.strip()).resolve(), path.parent)
+
+    def test_unittest_suite_counts_tests(self):
+        path = _write(self.root / "verify_suite.py", """
+            import unittest
+            class TestS(unittest.TestCase):
+                def test_a(self):
+                    pass
+                def test_b(self):
+                    pass
+            unittest.main()
+        """)
+        result = verify_runner.run_script(path, timeout=30)
+        self.assertEqual((result.status, result.kind, result.tests), (PASSED, 'unittest', 2))
+
+    def test_timeout_kills_process_group(self):
+        pid_file = self.root / "child.pid"
+        path = _write(self.root / "verify_hang.py", f"""
+            import subprocess
+            child = subprocess.Popen(['sleep', '60'])
+            open({str(pid_file)!r}, 'w').write(str(child.pid))
+            child.wait()
+        """)
+        start = time.perf_counter()
+        result = verify_runner.run_script(path, timeout=1.0)
+        self.assertEqual(result.status, TIMEOUT)
+        self.assertLess(time.perf_counter() - start, 30)
+        child = int(pid_file.read_text())
+        deadline = time.time() + 5
+        while not _process_gone(child) and time.time() < deadline:
+            time.sleep(0.05)
+        self.assertTrue(_process_gone(child), "脚本启动的子进程在超时后仍在运行")
+
+
+class TestCachedRun(RunnerTestCase):
+
+    def test_identical_scripts_reported_under_own_path(self):
+        cache = ResultCache(self.root / "cache")
+        first = _write(self.root / "a" / "verify_same.py", "print('same')\n")
+        second = _write(self.root / "b" / "verify_same.py", "print('same')\n")
+        self.assertFalse(verify_runner.cached_run(first, cache, timeout=30).cached)
+        self.assertFalse(verify_runner.cached_run(second, cache, timeout=30).cached)
+        hit = verify_runner.cached_run(second, cache, timeout=30)
+        self.assertEqual((hit.cached, hit.script, hit.stdout), (True, "b/verify_same.py", "same\n"))
+
+
+class TestSummarize(unittest.TestCase):
+
+    def test_counts_by_status_and_cache(self):
+        def result(status, cached=False):
+            return ScriptResult('s.py', 'script', status, 0, 0.0, 0.0, 0, None, '', '', cached)
+
+        summary = verify_runner.summarize([result(PASSED), result(PASSED, cached=True), result(FAILED),
+                                           result(TIMEOUT), result(RESOURCE)])
+        self.assertEqual(summary, {PASSED: 2, FAILED: 1, TIMEOUT: 1, RESOURCE: 1, 'cached': 1})
+        self.assertEqual(verify_runner.summarize([]),
+                         {PASSED: 0, FAILED: 0, TIMEOUT: 0, RESOURCE: 0, 'cached': 0})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+work_queue 的单元测试：领取、接管、作业序号与结果合并
+
+    python3 -m unittest discover tests
+"""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+import work_queue
+from verify_runner import FAILED, PASSED, TIMEOUT
+
+
+class QueueTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.queue = work_queue.init_queue(Path(self._tmp.name) / "q")
+
+    def age(self, path, seconds):
+        """把文件的心跳推回 seconds 秒前"""
+        past = time.time() - seconds
+        os.utime(path, (past, past))
+
+
+class TestClaim(QueueTestCase):
+
+    def test_claims_in_order_until_empty(self):
+        work_queue.submit_sweep(self.queue, "math:sqrt", [1, 4, 9], shard_size=2)
+        first, path = work_queue.claim(self.queue, "w1")
+        self.assertEqual((first['shard'], first['values']), (0, [1, 4]))
+        self.assertEqual(path, self.queue / 'running' / f"{first['id']}@w1.json")
+        second, _ = work_queue.claim(self.queue, "w2")
+        self.assertEqual(second['shard'], 1)
+        self.assertIsNone(work_queue.claim(self.queue, "w3"))
+        self.assertEqual(work_queue.status(self.queue), {'pending': 0, 'running': 2, 'done': 0})
+
+    def test_shard_seeds_are_deterministic(self):
+        work_queue.submit_sweep(self.queue, "math:sqrt", range(4), shard_size=2, seed=5)
+        seeds = [work_queue.claim(self.queue, "w")[0]['seed'] for _ in range(2)]
+        self.assertEqual(seeds[0], work_queue.seeding.derive_seed(5, "math:sqrt#0"))
+        self.assertNotEqual(seeds[0], seeds[1])
+
+
+class TestSteal(QueueTestCase):
+
+    def setUp(self):
+        super().setUp()
+        work_queue.submit_sweep(self.queue, "math:sqrt", [1], shard_size=1)
+        self.job, self.path = work_queue.claim(self.queue, "w1")
+
+    def test_fresh_heartbeat_is_not_stolen(self):
+        self.assertIsNone(work_queue.steal(self.queue, "w2", stale=60))
+
+    def test_stale_job_is_taken_over_once(self):
+        self.age(self.path, 120)
+        job, path = work_queue.steal(self.queue, "w2", stale=60)
+        self.assertEqual((job['id'], job['attempts']), (self.job['id'], 1))
+        self.assertEqual(path.name, f"{self.job['id']}@w2.json")
+        self.assertFalse(self.path.exists())
+        # 接管时刷新了心跳，第三个工作者不会再接管一次
+        self.assertLess(time.time() - path.stat().st_mtime, 60)
+        self.assertIsNone(work_queue.steal(self.queue, "w3", stale=60))
+
+    def test_abandoned_after_max_attempts(self):
+        path = self.path
+        for attempt in range(1, work_queue.MAX_ATTEMPTS):
+            self.age(path, 120)
+            job, path = work_queue.steal(self.queue, f"w{attempt + 1}", stale=60)
+            self.assertEqual(job['attempts'], attempt)
+        self.age(path, 120)
+        self.assertIsNone(work_queue.steal(self.queue, "last", stale=60))
+        done = work_queue._read_json(self.queue / 'done' / f"{self.job['id']}.json")
+        self.assertEqual((done['status'], done['attempts']), (FAILED, work_queue.MAX_ATTEMPTS))
+        self.assertEqual(work_queue.status(self.queue), {'pending': 0, 'running': 0, 'done': 1})
+
+
+class TestNextIndex(QueueTestCase):
+
+    def test_empty_queue_starts_at_zero(self):
+        self.assertEqual(work_queue._next_index(self.queue), 0)
+
+    def test_continues_after_existing_jobs(self):
+        work_queue.submit_sweep(self.queue, "math:sqrt", range(6), shard_size=2)
+        self.assertEqual(work_queue._next_index(self.queue), 3)
+
+    def test_compares_numerically_past_five_digits(self):
+        for sub, name in (('done', "99999-a.json"), ('running', "100000-b@w.json"),
+                          ('pending', "stray.json")):
+            (self.queue / sub / name).write_text("{}")
+        self.assertEqual(work_queue._next_index(self.queue), 100001)
+
+
+class TestRunSweep(unittest.TestCase):
+
+    def test_values_and_timeout(self):
+        job = {'target': 'math:sqrt', 'values': [4, 9], 'seed': 0}
+        result = work_queue.run_sweep(job, timeout=30)
+        self.assertEqual((result['status'], result['results']), (PASSED, [2.0, 3.0]))
+        hung = work_queue.run_sweep({'target': 'time:sleep', 'values': [60], 'seed': 0}, timeout=0.5)
+        self.assertEqual(hung['status'], TIMEOUT)
+        self.assertLess(hung['wall_time'], 10)
+
+    def test_error_in_shard(self):
+        result = work_queue.run_sweep({'target': 'math:sqrt', 'values': [-1], 'seed': 0}, timeout=30)
+        self.assertEqual(result['status'], FAILED)
+        self.assertIn("ValueError", result['error'])
+
+
+class TestMerge(QueueTestCase):
+
+    def finish(self, job, result):
+        running = self.queue / 'running' / f"{job['id']}@w.json"
+        running.write_text("{}")
+        work_queue._finish(self.queue, job, running, dict(result, worker='w'))
+
+    def test_sweeps_merged_in_shard_order(self):
+        work_queue.submit_sweep(self.queue, "math:sqrt", [1, 4, 9, 16, 25], shard_size=2)
+        jobs = [work_queue.claim(self.queue, "w")[0] for _ in range(3)]
+        for job in reversed(jobs):
+            self.finish(job, {'status': PASSED, 'values': job['values'],
+                              'results': [v ** 0.5 for v in job['values']], 'wall_time': 0.1})
+        report = work_queue.merge(self.queue)
+        merged = report['sweeps']["math:sqrt"]
+        self.assertEqual([e['value'] for e in merged], [1, 4, 9, 16, 25])
+        self.assertEqual([e['result'] for e in merged], [1.0, 2.0, 3.0, 4.0, 5.0])
+        self.assertEqual(report['failed'], [])
+
+    def test_script_results_and_failed_shards(self):
+        script_job = {'id': "00000-verify_x", 'kind': 'script', 'script': "verify_x.py", 'seed': 3,
+                      'attempts': 0}
+        self.finish(script_job, {'script': "verify_x.py", 'kind': 'script', 'status': PASSED, 'returncode': 0,
+                                 'wall_time': 0.5, 'cpu_time': 0.4, 'max_rss_kb': 100, 'tests': None,
+                                 'stdout': '', 'stderr': '', 'cached': False, 'exceeded': None})
+        work_queue.submit_sweep(self.queue, "math:sqrt", [-1], shard_size=1)
+        shard, _ = work_queue.claim(self.queue, "w")
+        self.finish(shard, {'status': FAILED, 'error': "ValueError"})
+        report = work_queue.merge(self.queue)
+        self.assertEqual(report['summary'][PASSED], 1)
+        self.assertEqual([(r['script'], r['seed'], r['worker']) for r in report['results']],
+                         [("verify_x.py", 3, 'w')])
+        self.assertEqual([e['job'] for e in report['failed']], [shard['id']])
+        self.assertEqual(report['sweeps'], {})
+
+
+if __name__ == '__main__':
+    unittest.main()